@@ -23,18 +23,36 @@
 
 const int SERIAL_BAUD = 9600;
 
+const char* FIRMWARE_VERSION      = "1.3";
+const char* FIRMWARE_CAPABILITIES = "id,queue,ping,axis,program";
+
 const int COMMAND_INITIALIZE = 10;
 const int COMMAND_ROTATE     = 20;
 const int COMMAND_POWER      = 30;
 const int COMMAND_RESET      = 40;
+const int COMMAND_PING       = 50;
+const int COMMAND_PROGRAM    = 60;
 const int COMMAND_ERROR      = 999;
 
 const char* JSON_PARAMETER_COMMAND = "command";
+const char* JSON_PARAMETER_ID      = "id";
 
 const String COMMAND_NAME_INITIALIZE = "initialize";
 const String COMMAND_NAME_ROTATE     = "rotate";
 const String COMMAND_NAME_POWER      = "power";
 const String COMMAND_NAME_RESET      = "reset";
+const String COMMAND_NAME_PING       = "ping";
+const String COMMAND_NAME_PROGRAM    = "program";
+
+const char* JSON_PARAMETER_AXIS = "axis";
+
+const String AXIS_NAME_YAW   = "yaw";
+const String AXIS_NAME_PITCH = "pitch";
+
+const int AXIS_YAW   = 0;
+const int AXIS_PITCH = 1;
+const int AXIS_COUNT = 2;
+const int AXIS_ERROR = -1;
 
 const char* JSON_PARAMETER_DIRECTION = "direction";
 
@@ -49,14 +67,41 @@ const char* JSON_PARAMETER_TOGGLE = "toggle";
 const String TOGGLE_ON  = "on";
 const String TOGGLE_OFF = "off";
 
-const char* JSON_PARAMETER_POSITION = "position";
+const char* JSON_PARAMETER_POSITION       = "position";
+const char* JSON_PARAMETER_PITCH_POSITION = "pitch-position";
 const char* JSON_PARAMETER_STATUS   = "status";
 
+const char* JSON_PARAMETER_INSTRUCTIONS = "instructions";
+const char* JSON_PARAMETER_MODE         = "mode";
+const char* JSON_PARAMETER_LENGTH       = "length";
+const char* JSON_PARAMETER_EVENT        = "event";
+const char* JSON_PARAMETER_INDEX        = "index";
+const char* JSON_PARAMETER_CODE         = "code";
+
+const String PROGRAM_MODE_APPEND = "append";
+const char* EVENT_PROGRESS       = "progress";
+
+const char INSTRUCTION_YAW     = 'Y';
+const char INSTRUCTION_PITCH   = 'P';
+const char INSTRUCTION_DWELL   = 'D';
+const char INSTRUCTION_SHUTTER = 'S';
+const char INSTRUCTION_SETTLE  = 'T';
+const char INSTRUCTION_HOLD    = 'H';
+const char INSTRUCTION_WAIT    = 'W';
+const char INSTRUCTION_FRAME   = 'F';
+
+const char* JSON_PARAMETER_FIRMWARE     = "firmware";
+const char* JSON_PARAMETER_BAUDRATE     = "baudrate";
+const char* JSON_PARAMETER_CAPABILITIES = "capabilities";
+
 const char* STATUS_INITIALIZATION_FINISHED = "Motor initialization finished";
 const char* STATUS_ROTATION_FINISHED       = "Rotation finished";
 const char* STATUS_POWER_ON                = "Power is on";
 const char* STATUS_POWER_OFF               = "Power is off";
 const char* STATUS_RESET                   = "Position is reset to current position";
+const char* STATUS_READY                   = "Ready";
+const char* STATUS_PROGRAM_STORED          = "Program stored";
+const char* STATUS_PROGRAM_FINISHED        = "Program finished";
 const char* STATUS_ERROR                   = "Error";
 
 const char* JSON_PARAMETER_ERROR       = "error";
@@ -73,6 +118,9 @@ const char* ERROR_ROTATION_DEGREE_VALUE_TOO_SMALL   = "The rotation degree value
 const char* ERROR_ROTATION_POWER_IS_OFF             = "Unable to rotate motor due to the power beeing of, please switch the power on first!";
 const char* ERROR_POWER_TOGGLE_VALUE_NOT_UNDERSTOOD = "The power toggle value was not understood";
 const char* ERROR_REQUEST_NOT_UNDERSTOOD            = "The request could not be parsed";
+const char* ERROR_AXIS_NOT_UNDERSTOOD               = "The axis was not understood";
+const char* ERROR_PROGRAM_TOO_LONG                  = "The program does not fit into the program memory";
+const char* ERROR_PROGRAM_INSTRUCTION_WRONG         = "The program contains an unknown instruction";
 
 const char* JSON_PARAMETER_MOTOR_PORT         = "port";
 const char* JSON_PARAMETER_MOTOR_TOTAL_STEPS  = "total-steps";
@@ -82,56 +130,148 @@ const char* JSON_PARAMETER_MOTOR_ACCELERATION = "acceleration";
 
 const int   RESET_POSITION = 0;
 
-boolean isInputComplete = false;
+const int COMMAND_QUEUE_SIZE = 2;
+const int REQUEST_ID_LENGTH  = 16;
+
+// the pin the cable release is wired to through an optocoupler
+const int SHUTTER_PIN  = 2;
+const int PROGRAM_SIZE = 512;
+
+const int PROGRAM_NEXT    = 0;
+const int PROGRAM_MOVING  = 1;
+const int PROGRAM_WAITING = 2;
+const int PROGRAM_FRAME   = 3;
+
 String inputData = "";
-boolean isPowerOn = false;
+String commandQueue[COMMAND_QUEUE_SIZE];
+int commandQueueStart = 0;
+int commandQueueCount = 0;
+
+// every axis drives its own stepper on its own motor shield port
+boolean isPowerOn[AXIS_COUNT] = {false,false};
+AF_Stepper motor[AXIS_COUNT] = {AF_Stepper(NULL,NULL),AF_Stepper(NULL,NULL)};
+AccelStepper stepper[AXIS_COUNT];
+float motorStepAngle[AXIS_COUNT];
+boolean isMotorInitialized[AXIS_COUNT] = {false,false};
 
-AF_Stepper motor(NULL,NULL);
-AccelStepper stepper;
-float motorStepAngle;
-boolean isMotorInitialized = false;
+boolean isRotating = false;
+int rotationAxis;
+float rotationAngle;
+int rotationSteps;
+char rotationRequestId[REQUEST_ID_LENGTH];
+
+char program[PROGRAM_SIZE + 1];
+int programLength = 0;
+int programPosition = 0;
+int programIndex = 0;
+int programState = PROGRAM_NEXT;
+int programAxis;
+char programCode;
+unsigned long programWaitUntil;
+// timing of the F instruction, set once per program by T, H and W
+unsigned long programSettle = 0;
+unsigned long programHold = 0;
+unsigned long programWait = 0;
+int programShots;
+boolean isShutterHeld = false;
+boolean isProgramRunning = false;
+char programRequestId[REQUEST_ID_LENGTH];
 
 /**
  * Setup method invoked by Arduino
  */
 void setup() {
   Serial.begin(SERIAL_BAUD);
+  pinMode(SHUTTER_PIN,OUTPUT);
+  digitalWrite(SHUTTER_PIN,LOW);
+  aJsonObject* banner = aJson.createObject();
+  ping(NULL,banner);
+  Serial.println(aJson.print(banner));
+  aJson.deleteItem(banner);
 }
 
 /**
  * Loop method, invoked by Arduino
+ * While a rotation or a program is running the motors are stepped and further
+ * commands stay queued, they are executed in order once it has finished.
  */
 void loop() {
-  if(isInputComplete) {
-    char data[inputData.length()];
-    inputData.toCharArray(data,inputData.length());
+  if(isProgramRunning) {
+    runProgram();
+    return;
+  }
+  if(isRotating) {
+    stepper[rotationAxis].run();
+    if(stepper[rotationAxis].distanceToGo() == 0) {
+      finishRotation();
+    }
+    return;
+  }
+  if(commandQueueCount > 0) {
+    String line = commandQueue[commandQueueStart];
+    commandQueue[commandQueueStart] = "";
+    commandQueueStart = (commandQueueStart + 1) % COMMAND_QUEUE_SIZE;
+    commandQueueCount--;
+    char data[line.length()];
+    line.toCharArray(data,line.length());
     aJsonObject* request = aJson.parse(data);
     aJsonObject* response = aJson.createObject();
     executeCommand(request,response);
-    Serial.println(aJson.print(response));
+    if(!isRotating & !isProgramRunning) {
+      copyRequestId(request,response);
+      Serial.println(aJson.print(response));
+    }
     aJson.deleteItem(request);
     aJson.deleteItem(response);
-    inputData = "";
-    isInputComplete = false;
-    if(isMotorInitialized & isPowerOn) {
-      stepper.run();
-    }  
   }
 }
 
 /**
  * This method is invoked whenever serial input is ready.
+ * Complete lines are appended to the command queue, the host never keeps
+ * more than COMMAND_QUEUE_SIZE commands outstanding.
  */
 void serialEvent() {
-  while(Serial.available()) {
+  while(Serial.available() && commandQueueCount < COMMAND_QUEUE_SIZE) {
     char inChar = (char)Serial.read();
     inputData += inChar;
     if(inChar == '\n') {
-      isInputComplete = true;
+      commandQueue[(commandQueueStart + commandQueueCount) % COMMAND_QUEUE_SIZE] = inputData;
+      commandQueueCount++;
+      inputData = "";
     }
   }
 }
 
+/**
+ * Echoes the optional request id so the host can match pipelined responses.
+ */
+void copyRequestId(aJsonObject* request, aJsonObject* response) {
+  if(request) {
+    aJsonObject* id = aJson.getObjectItem(request,JSON_PARAMETER_ID);
+    if(id) {
+      addJsonParameter(response,JSON_PARAMETER_ID,id->valuestring);
+    }
+  }
+}
+
+/**
+ * The axis a request addresses, yaw if the request does not name one.
+ */
+int getAxis(aJsonObject* request) {
+  aJsonObject* axis = aJson.getObjectItem(request,JSON_PARAMETER_AXIS);
+  if(!axis) {
+    return AXIS_YAW;
+  }
+  String axisName = axis->valuestring;
+  if(axisName == AXIS_NAME_YAW) {
+    return AXIS_YAW;
+  } else if(axisName == AXIS_NAME_PITCH) {
+    return AXIS_PITCH;
+  }
+  return AXIS_ERROR;
+}
+
 /**
  * invokes a command, has to be executed after the validation method.
  */
@@ -150,6 +290,12 @@ void executeCommand(aJsonObject* request, aJsonObject* response) {
     case COMMAND_RESET:
       reset(request,response);
     break;
+    case COMMAND_PING:
+      ping(request,response);
+    break;
+    case COMMAND_PROGRAM:
+      storeProgram(request,response);
+    break;
     case COMMAND_ERROR:
       addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_ERROR);
     break;
@@ -165,32 +311,54 @@ void executeCommand(aJsonObject* request, aJsonObject* response) {
  * It allows to add any type of stepper motor to the interface and use it controlled by the software talking ot Arduino.
  * This method is the first required step to use this motor controller.
  * 
+ * The optional axis selects the yaw (default) or the pitch motor.
+ *
  * request: {"command":"initialize","port":"2","total-steps":"200","step-angle":"1.80","max-speed":"20","acceleration":"10"}
+ * request: {"command":"initialize","axis":"pitch","port":"1","total-steps":"200","step-angle":"1.80","max-speed":"20","acceleration":"10"}
  * response: {"status":"Motor initialization finished"}
  *
  */
 void initialize(aJsonObject* request, aJsonObject* response) {
-  motor = AF_Stepper(atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_TOTAL_STEPS)),atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_PORT)));
-  stepper = AccelStepper(forwardstep,backwardstep);
-  stepper.setMaxSpeed(atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_MAX_SPEED)));
-  stepper.setAcceleration(atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_ACCELERATION)));
-  motorStepAngle = atof(getJsonParameter(request,JSON_PARAMETER_MOTOR_STEP_ANGLE));
-  isMotorInitialized = true;
+  int axis = getAxis(request);
+  motor[axis] = AF_Stepper(atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_TOTAL_STEPS)),atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_PORT)));
+  if(axis == AXIS_PITCH) {
+    stepper[axis] = AccelStepper(forwardstepPitch,backwardstepPitch);
+  } else {
+    stepper[axis] = AccelStepper(forwardstep,backwardstep);
+  }
+  stepper[axis].setMaxSpeed(atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_MAX_SPEED)));
+  stepper[axis].setAcceleration(atoi(getJsonParameter(request,JSON_PARAMETER_MOTOR_ACCELERATION)));
+  motorStepAngle[axis] = atof(getJsonParameter(request,JSON_PARAMETER_MOTOR_STEP_ANGLE));
+  isMotorInitialized[axis] = true;
   addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_INITIALIZATION_FINISHED);
 }
 
 /**
- * Defines a single forward step for the stepper motor.
+ * Defines a single forward step for the yaw stepper motor.
  */
 void forwardstep() {  
-  motor.onestep(FORWARD,DOUBLE);
+  motor[AXIS_YAW].onestep(FORWARD,DOUBLE);
 }
 
 /**
- * Defines a single backward step for the stepper motor.
+ * Defines a single backward step for the yaw stepper motor.
  */
 void backwardstep() {  
-  motor.onestep(BACKWARD,DOUBLE);
+  motor[AXIS_YAW].onestep(BACKWARD,DOUBLE);
+}
+
+/**
+ * Defines a single forward step for the pitch stepper motor.
+ */
+void forwardstepPitch() {  
+  motor[AXIS_PITCH].onestep(FORWARD,DOUBLE);
+}
+
+/**
+ * Defines a single backward step for the pitch stepper motor.
+ */
+void backwardstepPitch() {  
+  motor[AXIS_PITCH].onestep(BACKWARD,DOUBLE);
 }
 
 /**
@@ -199,59 +367,276 @@ void backwardstep() {
  * with a modulo function and rounded to the next possible
  * amount of steps closest to the required amount of degrees.
  * It will always be a pessimistic rounding effort!
+ * The response is sent by finishRotation once the target is reached.
  *
- * request: {"command":"rotate","direction":"clockwise","degrees":"36"}
- * response: {"degrees":"36.00","steps":"20","position":"20","status":"Rotation finished"}
+ * The position in the response is the one of the rotated axis.
+ *
+ * request: {"command":"rotate","direction":"clockwise","degrees":"36","id":"7"}
+ * request: {"command":"rotate","axis":"pitch","direction":"counterclockwise","degrees":"45","id":"8"}
+ * response: {"degrees":"36.00","steps":"20","position":"20","id":"7","status":"Rotation finished"}
  *
  */
 void rotate(aJsonObject* request, aJsonObject* response) {
-  if(!isPowerOn) {
+  int axis = getAxis(request);
+  if(!isPowerOn[axis]) {
     addJsonParameter(response,JSON_PARAMETER_ERROR,ERROR_ROTATION_POWER_IS_OFF);
     addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_ERROR);
     return;
   }
   float stepAngle = atof(getJsonParameter(request,JSON_PARAMETER_DEGREES));
   String directionIndication = getJsonParameter(request,JSON_PARAMETER_DIRECTION);
-  if(fmod(stepAngle,motorStepAngle) > 0) {
-    stepAngle = stepAngle - fmod(stepAngle,motorStepAngle);
+  if(fmod(stepAngle,motorStepAngle[axis]) > 0) {
+    stepAngle = stepAngle - fmod(stepAngle,motorStepAngle[axis]);
   }
-  int steps = stepAngle / motorStepAngle;
+  int steps = stepAngle / motorStepAngle[axis];
   if(directionIndication == DIRECTION_CLOCKWISE) {
     steps=abs(steps);
   } else {
     steps=-abs(steps);
   }
-  stepper.runToNewPosition(stepper.currentPosition() + steps);
+  stepper[axis].moveTo(stepper[axis].currentPosition() + steps);
+  rotationAxis = axis;
+  rotationAngle = stepAngle;
+  rotationSteps = abs(steps);
+  rotationRequestId[0] = '\0';
+  aJsonObject* id = aJson.getObjectItem(request,JSON_PARAMETER_ID);
+  if(id) {
+    strncpy(rotationRequestId,id->valuestring,REQUEST_ID_LENGTH - 1);
+    rotationRequestId[REQUEST_ID_LENGTH - 1] = '\0';
+  }
+  isRotating = true;
+}
+
+/**
+ * Reports a finished rotation, invoked by the loop once the target position is reached.
+ */
+void finishRotation() {
+  isRotating = false;
+  aJsonObject* response = aJson.createObject();
   char stepAngleAsString[16];
-  dtostrf(stepAngle,3,2,stepAngleAsString);
+  dtostrf(rotationAngle,3,2,stepAngleAsString);
   char currentPosition[16];
-  itoa(stepper.currentPosition(),currentPosition,10);
+  itoa(stepper[rotationAxis].currentPosition(),currentPosition,10);
   char stepsAsString[16];
-  itoa(abs(steps),stepsAsString,10);
+  itoa(rotationSteps,stepsAsString,10);
   addJsonParameter(response,JSON_PARAMETER_DEGREES,stepAngleAsString);
   addJsonParameter(response,JSON_PARAMETER_STEPS,stepsAsString);
   addJsonParameter(response,JSON_PARAMETER_POSITION,currentPosition);
+  if(rotationRequestId[0] != '\0') {
+    addJsonParameter(response,JSON_PARAMETER_ID,rotationRequestId);
+  }
   addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_ROTATION_FINISHED);
+  Serial.println(aJson.print(response));
+  aJson.deleteItem(response);
+}
+
+/**
+ * Stores a motion program and runs it, the whole sequence of a panorama is
+ * executed without a round trip to the host per position.
+ * Instructions are a letter followed by a number, without separators:
+ *   Y<steps>  rotate the yaw axis by signed steps
+ *   P<steps>  rotate the pitch axis by signed steps
+ *   D<ms>     dwell
+ *   S<ms>     hold the cable release for the given time
+ *   T<ms>     settle time of the following F instructions
+ *   H<ms>     time the following F instructions hold the cable release
+ *   W<ms>     time the following F instructions wait after each release
+ *   F<count>  one frame: settle, then release count times, holding and waiting
+ * A frame is usually Y<steps>F1, the timing is only sent once per program.
+ * Programs longer than one line are uploaded in chunks with mode "append",
+ * the chunk without it starts the program. A progress event is sent after
+ * every instruction, the response once the program has finished.
+ *
+ * request: {"command":"program","instructions":"Y320D200S100D1000","mode":"append"}
+ * response: {"length":"17","status":"Program stored"}
+ * request: {"command":"program","instructions":"Y320D200S100D1000","id":"9"}
+ * request: {"command":"program","instructions":"T200H100W1000Y320F1Y320F1","id":"9"}
+ * event: {"event":"progress","index":"0","code":"Y","position":"320"}
+ * response: {"length":"34","id":"9","status":"Program finished"}
+ *
+ */
+void storeProgram(aJsonObject* request, aJsonObject* response) {
+  char* instructions = getJsonParameter(request,JSON_PARAMETER_INSTRUCTIONS);
+  if(programLength + strlen(instructions) > PROGRAM_SIZE) {
+    programLength = 0;
+    addJsonParameter(response,JSON_PARAMETER_ERROR,ERROR_PROGRAM_TOO_LONG);
+    addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_ERROR);
+    return;
+  }
+  strcpy(program + programLength,instructions);
+  programLength += strlen(instructions);
+  aJsonObject* mode = aJson.getObjectItem(request,JSON_PARAMETER_MODE);
+  if(mode && PROGRAM_MODE_APPEND == mode->valuestring) {
+    char length[16];
+    itoa(programLength,length,10);
+    addJsonParameter(response,JSON_PARAMETER_LENGTH,length);
+    addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_PROGRAM_STORED);
+    return;
+  }
+  programRequestId[0] = '\0';
+  aJsonObject* id = aJson.getObjectItem(request,JSON_PARAMETER_ID);
+  if(id) {
+    strncpy(programRequestId,id->valuestring,REQUEST_ID_LENGTH - 1);
+    programRequestId[REQUEST_ID_LENGTH - 1] = '\0';
+  }
+  programPosition = 0;
+  programIndex = 0;
+  programState = PROGRAM_NEXT;
+  isProgramRunning = true;
+}
+
+/**
+ * Advances the running program, invoked by the loop.
+ */
+void runProgram() {
+  if(programState == PROGRAM_MOVING) {
+    stepper[programAxis].run();
+    if(stepper[programAxis].distanceToGo() == 0) {
+      finishInstruction();
+    }
+    return;
+  }
+  if(programState == PROGRAM_WAITING) {
+    if((long)(millis() - programWaitUntil) >= 0) {
+      digitalWrite(SHUTTER_PIN,LOW);
+      finishInstruction();
+    }
+    return;
+  }
+  if(programState == PROGRAM_FRAME) {
+    runFrame();
+    return;
+  }
+  if(programPosition >= programLength) {
+    finishProgram(NULL);
+    return;
+  }
+  programCode = program[programPosition++];
+  char* end;
+  long value = strtol(program + programPosition,&end,10);
+  programPosition = end - program;
+  if(programCode == INSTRUCTION_YAW | programCode == INSTRUCTION_PITCH) {
+    programAxis = (programCode == INSTRUCTION_YAW) ? AXIS_YAW : AXIS_PITCH;
+    if(!isMotorInitialized[programAxis]) {
+      finishProgram(ERROR_MOTOR_IS_NOT_INITIALIZED);
+    } else if(!isPowerOn[programAxis]) {
+      finishProgram(ERROR_ROTATION_POWER_IS_OFF);
+    } else {
+      stepper[programAxis].moveTo(stepper[programAxis].currentPosition() + value);
+      programState = PROGRAM_MOVING;
+    }
+  } else if(programCode == INSTRUCTION_DWELL | programCode == INSTRUCTION_SHUTTER) {
+    if(programCode == INSTRUCTION_SHUTTER) {
+      digitalWrite(SHUTTER_PIN,HIGH);
+    }
+    programWaitUntil = millis() + value;
+    programState = PROGRAM_WAITING;
+  } else if(programCode == INSTRUCTION_SETTLE | programCode == INSTRUCTION_HOLD | programCode == INSTRUCTION_WAIT) {
+    if(programCode == INSTRUCTION_SETTLE) {
+      programSettle = value;
+    } else if(programCode == INSTRUCTION_HOLD) {
+      programHold = value;
+    } else {
+      programWait = value;
+    }
+    finishInstruction();
+  } else if(programCode == INSTRUCTION_FRAME) {
+    programShots = value;
+    isShutterHeld = false;
+    programWaitUntil = millis() + programSettle;
+    programState = PROGRAM_FRAME;
+  } else {
+    finishProgram(ERROR_PROGRAM_INSTRUCTION_WRONG);
+  }
+}
+
+/**
+ * Advances an F instruction, the settle time is followed by release and wait
+ * for every shot.
+ */
+void runFrame() {
+  if((long)(millis() - programWaitUntil) < 0) {
+    return;
+  }
+  if(isShutterHeld) {
+    digitalWrite(SHUTTER_PIN,LOW);
+    isShutterHeld = false;
+    programShots--;
+    programWaitUntil = millis() + programWait;
+  } else if(programShots > 0) {
+    digitalWrite(SHUTTER_PIN,HIGH);
+    isShutterHeld = true;
+    programWaitUntil = millis() + programHold;
+  } else {
+    finishInstruction();
+  }
+}
+
+/**
+ * Reports a finished program instruction as progress event.
+ */
+void finishInstruction() {
+  aJsonObject* event = aJson.createObject();
+  char index[16];
+  itoa(programIndex,index,10);
+  char code[2] = {programCode,'\0'};
+  addJsonParameter(event,JSON_PARAMETER_EVENT,EVENT_PROGRESS);
+  addJsonParameter(event,JSON_PARAMETER_INDEX,index);
+  addJsonParameter(event,JSON_PARAMETER_CODE,code);
+  if(programState == PROGRAM_MOVING) {
+    char currentPosition[16];
+    itoa(stepper[programAxis].currentPosition(),currentPosition,10);
+    addJsonParameter(event,JSON_PARAMETER_POSITION,currentPosition);
+  }
+  Serial.println(aJson.print(event));
+  aJson.deleteItem(event);
+  programIndex++;
+  programState = PROGRAM_NEXT;
+}
+
+/**
+ * Ends the running program and answers the program request, with an error if given.
+ */
+void finishProgram(const char* error) {
+  isProgramRunning = false;
+  aJsonObject* response = aJson.createObject();
+  char length[16];
+  itoa(programLength,length,10);
+  addJsonParameter(response,JSON_PARAMETER_LENGTH,length);
+  if(programRequestId[0] != '\0') {
+    addJsonParameter(response,JSON_PARAMETER_ID,programRequestId);
+  }
+  if(error) {
+    addJsonParameter(response,JSON_PARAMETER_ERROR,error);
+    addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_ERROR);
+  } else {
+    addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_PROGRAM_FINISHED);
+  }
+  Serial.println(aJson.print(response));
+  aJson.deleteItem(response);
+  programLength = 0;
 }
 
 /**
  * With power the hodling torque of the motor is either switched on or off.
  *
  * request: {"command":"power","toggle":"on"}
+ * request: {"command":"power","axis":"pitch","toggle":"on"}
  * response: {"status":"Power is on"} / {"status":"Power is off"}
  *
  */
 void power(aJsonObject* request, aJsonObject* response) {
+  int axis = getAxis(request);
   String powerToggle = getJsonParameter(request,JSON_PARAMETER_TOGGLE);
   if(powerToggle == TOGGLE_ON) {
-    stepper.enableOutputs();
-    stepper.runSpeed();
-    isPowerOn = true;
+    stepper[axis].enableOutputs();
+    stepper[axis].runSpeed();
+    isPowerOn[axis] = true;
     addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_POWER_ON);
   } else {
-    stepper.disableOutputs();
-    motor.release();
-    isPowerOn = false;
+    stepper[axis].disableOutputs();
+    motor[axis].release();
+    isPowerOn[axis] = false;
     addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_POWER_OFF);
   }
 }
@@ -261,21 +646,58 @@ void power(aJsonObject* request, aJsonObject* response) {
  * This method allows to adjust the motor manually and then reset the internal position.
  *
  * request: {"command":"reset"}
+ * request: {"command":"reset","axis":"pitch"}
  * response: {"status":"Position is reset to current position"}
  *
  */
 void reset(aJsonObject* request, aJsonObject* response) {
-  stepper.setCurrentPosition(RESET_POSITION);
+  stepper[getAxis(request)].setCurrentPosition(RESET_POSITION);
   addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_RESET);
 }
 
+/**
+ * Readiness probe, also sent once as banner after the board has booted.
+ * It can be sent before the motor is initialized.
+ * The position is the one of the yaw axis, the pitch position is added once
+ * the pitch motor has been initialized.
+ *
+ * request: {"command":"ping"}
+ * response: {"firmware":"1.3","baudrate":"9600","capabilities":"id,queue,ping,axis,program","position":"0","status":"Ready"}
+ *
+ */
+void ping(aJsonObject* request, aJsonObject* response) {
+  char baudrate[16];
+  itoa(SERIAL_BAUD,baudrate,10);
+  char currentPosition[16];
+  itoa(isMotorInitialized[AXIS_YAW] ? stepper[AXIS_YAW].currentPosition() : 0,currentPosition,10);
+  addJsonParameter(response,JSON_PARAMETER_FIRMWARE,FIRMWARE_VERSION);
+  addJsonParameter(response,JSON_PARAMETER_BAUDRATE,baudrate);
+  addJsonParameter(response,JSON_PARAMETER_CAPABILITIES,FIRMWARE_CAPABILITIES);
+  addJsonParameter(response,JSON_PARAMETER_POSITION,currentPosition);
+  if(isMotorInitialized[AXIS_PITCH]) {
+    char pitchPosition[16];
+    itoa(stepper[AXIS_PITCH].currentPosition(),pitchPosition,10);
+    addJsonParameter(response,JSON_PARAMETER_PITCH_POSITION,pitchPosition);
+  }
+  addJsonParameter(response,JSON_PARAMETER_STATUS,STATUS_READY);
+}
+
 /**
  * Request input validation. If an error is found it will be reported back to the user.
  */
 int validateInput(aJsonObject* request, aJsonObject* response) {
   if(request) {
     String commandString = getJsonParameter(request,JSON_PARAMETER_COMMAND);
-    if(commandString != COMMAND_NAME_INITIALIZE & !isMotorInitialized) {
+    if(commandString == COMMAND_NAME_PING) {
+      return COMMAND_PING;
+    }
+    int axis = getAxis(request);
+    if(axis == AXIS_ERROR) {
+      addJsonParameter(response,JSON_PARAMETER_ERROR,ERROR_AXIS_NOT_UNDERSTOOD);
+      addJsonParameter(response,JSON_PARAMETER_ERROR_VALUE,getJsonParameter(request,JSON_PARAMETER_AXIS));
+      return COMMAND_ERROR;
+    }
+    if(commandString != COMMAND_NAME_INITIALIZE & !isMotorInitialized[axis]) {
       addJsonParameter(response,JSON_PARAMETER_ERROR,ERROR_MOTOR_IS_NOT_INITIALIZED);
       return COMMAND_ERROR;
     }
@@ -320,6 +742,12 @@ int validateInput(aJsonObject* request, aJsonObject* response) {
       return COMMAND_POWER;
     } else if(commandString == COMMAND_NAME_RESET) {
       return COMMAND_RESET;
+    } else if(commandString == COMMAND_NAME_PROGRAM) {
+      if(!aJson.getObjectItem(request,JSON_PARAMETER_INSTRUCTIONS)) {
+        addJsonParameter(response,JSON_PARAMETER_ERROR,ERROR_REQUEST_NOT_UNDERSTOOD);
+        return COMMAND_ERROR;
+      }
+      return COMMAND_PROGRAM;
     }
   }
   addJsonParameter(response,JSON_PARAMETER_ERROR,ERROR_REQUEST_NOT_UNDERSTOOD);
@@ -19,7 +19,7 @@
  limitations under the License.
 '''
 
-import sys, subprocess, serial, json, threading, time, argparse
+import sys, os, re, select, subprocess, serial, json, threading, time, argparse, queue, asyncio, collections
 
 DEFAULT_BAUDRATE = 9600
 DEFAULT_ENCODING = 'UTF-8'
@@ -29,10 +29,20 @@ JSON_ATTRIBUTE_STATUS = "status";
 JSON_ATTRIBUTE_ERROR = "error";
 
 STATUS_ERROR_VALUE = "Error";
+STATUS_READY_VALUE = "Ready";
 
 POWER_TOGGLE_ON = "on"
 POWER_TOGGLE_OFF = "off"
 
+# prompt printed by "gphoto2 --shell" once a command has finished
+GPHOTO_SHELL_PROMPT = re.compile(rb"gphoto2: \{[^}]*\} [^\n]*> $")
+GPHOTO_SHELL_ERROR = b"*** Error"
+GPHOTO_SHELL_TIMEOUT = 60
+
+# the head is pinged until it answers, the board resets when the port opens
+DEFAULT_READY_TIMEOUT = 10
+PING_INTERVAL = 0.25
+
 
 #----------------------------------------------------------------------
 def main():
@@ -46,40 +56,117 @@ def main():
 		print("The choosen amount of degrees are not valid, Please choose any number which wraps around 360!")
 		return
 	
+	if(results.transport == "asyncio"):
+		asyncio.run(asyncMain(results))
+		return
+	
 	arduino = Arduino(results.device,results.baudrate,4)
 	arduino.connect()
 	
+	camera = None
 	try:
+		if(results.session == "shell"):
+			camera = GphotoShell()
+			camera.start()
 		initialize(arduino,results.shieldport,results.steps,results.stepangle,results.maxspeed,results.acceleration)
 		powerToggle(arduino,POWER_TOGGLE_ON)
 		steps = divmod(360,int(results.degrees))[0]
 		counter = 0
 		while(counter < steps):
-			shoot(results.aperture,results.shutterspeed)
+			shoot(results.aperture,results.shutterspeed,camera)
 			rotate(arduino,results.direction,results.degrees)
 			counter = counter + 1
 		powerToggle(arduino,POWER_TOGGLE_OFF)
-	except ArduinoCommandExecutionException as e:
+	except (ArduinoCommandExecutionException, CameraCommandExecutionException, OSError) as e:
 		print("Error occured: %s \n" % (e))
+	finally:
+		if(camera is not None):
+			camera.close()
+		arduino.disconnect()
+	printLatencies(arduino)
+
+#
+# Same sequence as main() but driven by a single event loop, the serial
+# port and the gphoto2 processes are both serviced without extra threads.
+# Only a gphoto2 shell session, which reads blocking, runs in the executor.
+#
+async def asyncMain(results):
+	head = AsyncArduino(results.device,results.baudrate,4)
+	await head.connect()
 	
-	arduino.disconnect()
+	camera = None
+	try:
+		if(results.session == "shell"):
+			camera = GphotoShell()
+			await asyncio.get_running_loop().run_in_executor(None,camera.start)
+		await head.initialize(results.shieldport,results.steps,results.stepangle,results.maxspeed,results.acceleration)
+		await head.power(POWER_TOGGLE_ON)
+		steps = divmod(360,int(results.degrees))[0]
+		counter = 0
+		while(counter < steps):
+			await asyncShoot(results.aperture,results.shutterspeed,camera)
+			await head.rotate(results.direction,results.degrees)
+			counter = counter + 1
+		await head.power(POWER_TOGGLE_OFF)
+	except (ArduinoCommandExecutionException, CameraCommandExecutionException, asyncio.TimeoutError, OSError) as e:
+		print("Error occured: %s \n" % (e))
+	finally:
+		if(camera is not None):
+			camera.close()
+		head.disconnect()
+	printLatencies(head)
 	
 #----------------------------------------------------------------------
 
-def shoot(aperture, shutterspeed):
+def shoot(aperture, shutterspeed, camera = None):
 	for speed in shutterspeed:
-		captureImage(aperture,speed)
+		if(camera is not None):
+			captureImageInSession(camera,aperture,speed)
+		else:
+			captureImage(aperture,speed)
 	
+def captureCommand(aperture, shutterspeed):
+	return ["gphoto2","--set-config","capturetarget=1","--set-config","/main/capturesettings/aperture=" + aperture,"--set-config","/main/capturesettings/shutterspeed=" + shutterspeed,"--capture-image"]
+
 def captureImage(aperture, shutterspeed):
 	try:
-		start = time.strftime('%s')
-		subprocess.check_call(["gphoto2","--set-config","capturetarget=1","--set-config","/main/capturesettings/aperture=" + aperture,"--set-config","/main/capturesettings/shutterspeed=" + shutterspeed,"--capture-image"],stdout=subprocess.PIPE,stderr=subprocess.PIPE)
-		end = time.strftime('%s')
-		total = int(end) - int(start)
-		sys.stdout.write("image captured with aperture: %s and shutterspeed: %s time used: %s sec. \n" % (aperture,shutterspeed,total))
+		start = time.perf_counter()
+		subprocess.check_call(captureCommand(aperture,shutterspeed),stdout=subprocess.PIPE,stderr=subprocess.PIPE)
+		total = time.perf_counter() - start
+		sys.stdout.write("image captured with aperture: %s and shutterspeed: %s time used: %.2f sec. \n" % (aperture,shutterspeed,total))
 	except subprocess.CalledProcessError as e:
 		print("Error occured while attempting to take image: %s \n" % (e))
 
+def captureImageInSession(camera, aperture, shutterspeed):
+	try:
+		start = time.perf_counter()
+		camera.setConfig("capturetarget","1")
+		camera.setConfig("/main/capturesettings/aperture",aperture)
+		camera.setConfig("/main/capturesettings/shutterspeed",shutterspeed)
+		camera.execute("capture-image")
+		total = time.perf_counter() - start
+		sys.stdout.write("image captured with aperture: %s and shutterspeed: %s time used: %.2f sec. \n" % (aperture,shutterspeed,total))
+	except CameraCommandExecutionException as e:
+		print("Error occured while attempting to take image: %s \n" % (e))
+
+async def asyncShoot(aperture, shutterspeed, camera = None):
+	for speed in shutterspeed:
+		if(camera is not None):
+			# the shell session blocks while it reads, it runs beside the loop
+			await asyncio.get_running_loop().run_in_executor(None,captureImageInSession,camera,aperture,speed)
+		else:
+			await asyncCaptureImage(aperture,speed)
+
+async def asyncCaptureImage(aperture, shutterspeed):
+	start = time.perf_counter()
+	process = await asyncio.create_subprocess_exec(*captureCommand(aperture,shutterspeed),stdout=asyncio.subprocess.PIPE,stderr=asyncio.subprocess.PIPE)
+	await process.communicate()
+	if(process.returncode != 0):
+		print("Error occured while attempting to take image: %s \n" % (subprocess.CalledProcessError(process.returncode,"gphoto2")))
+		return
+	total = time.perf_counter() - start
+	sys.stdout.write("image captured with aperture: %s and shutterspeed: %s time used: %.2f sec. \n" % (aperture,shutterspeed,total))
+
 def initialize(arduino, motorPort, motorSteps, motorStepAngle, motorSpeed, motorAcceleration):
 	request = json.dumps({"command":"initialize","port":motorPort,"total-steps":motorSteps,"step-angle":motorStepAngle,"max-speed":motorSpeed,"acceleration":motorAcceleration})
 	send(arduino,request)
@@ -92,34 +179,78 @@ def rotate(arduino, direction, degrees):
 	send(arduino,request)
 	
 def send(arduino, command):
-	response = arduino.send(command)
+	return parseResponse(arduino.send(command))
+
+def parseResponse(response):
 	responseObject = json.loads(response)
 	if(responseObject[JSON_ATTRIBUTE_STATUS] == STATUS_ERROR_VALUE):
 		raise ArduinoCommandExecutionException(responseObject[JSON_ATTRIBUTE_ERROR])
 	else:
 		sys.stdout.write(responseObject[JSON_ATTRIBUTE_STATUS] + DEFAULT_LF)
+	return responseObject
+
+def pingRequest(attempt):
+	# every attempt has its own id, answers to earlier pings are told apart
+	return json.dumps({"command":"ping","id":str(attempt)})
+
+def readyResponse(line, attempt, start, baudrate):
+	# any reply proves the head is listening, boot noise and answers to
+	# earlier pings are skipped
+	try:
+		responseObject = json.loads(line.decode(DEFAULT_ENCODING))
+	except ValueError:
+		return None
+	if(not isinstance(responseObject,dict)):
+		return None
+	if("id" in responseObject):
+		if(responseObject["id"] != str(attempt)):
+			return None
+	elif("id" in responseObject.get("capabilities","").split(",")):
+		# the boot banner of a firmware which echoes ids, the answer to our ping follows
+		return None
+	if(responseObject.get(JSON_ATTRIBUTE_STATUS) == STATUS_READY_VALUE):
+		sys.stdout.write("Head ready after %.2f sec. firmware: %s baudrate: %s capabilities: %s \n" % (time.perf_counter() - start,responseObject.get("firmware"),responseObject.get("baudrate"),responseObject.get("capabilities")))
+		if(str(responseObject.get("baudrate")) != str(baudrate)):
+			sys.stdout.write("Warning: the head reports baudrate %s but %s is configured \n" % (responseObject.get("baudrate"),baudrate))
+	else:
+		# firmware without ping support answers with an error, it is alive but can not tell us more
+		sys.stdout.write("Head ready after %.2f sec. firmware does not support ping \n" % (time.perf_counter() - start))
+	return responseObject
+
+def printLatencies(arduino):
+	if(len(arduino.latencies) == 0):
+		return
+	durations = sorted([latency for command, latency in arduino.latencies])
+	total = sum(durations)
+	sys.stdout.write("serial round trips: %d avg: %.1f ms min: %.1f ms max: %.1f ms \n" % (len(durations),total * 1000 / len(durations),durations[0] * 1000,durations[-1] * 1000))
 
 #
 # Arduino communciations class
-# This class will run in it's own thread in order to send and receive data.
+# This class will run in it's own thread in order to receive data.
+# The thread blocks in readline and hands every received line over to
+# the response queue, send() blocks on that queue until its line arrives.
 #
 class Arduino(threading.Thread):
 	def __init__(self, device, baudrate, timeout):
 		threading.Thread.__init__(self)
+		self.daemon = True
 		self.device = device
 		self.baudrate = baudrate
 		self.timeout = timeout
 		self.port = None
-		self.hasReceivedResponse = False
 		self.stopProcessing = False
-		self.response = bytearray();
+		self.responses = queue.Queue()
+		self.latencies = []
 	
 	def run(self):
 		while (self.stopProcessing != True):
-			if(self.hasReceivedResponse == False):
-				self.response = self.port.readline()
-				if(len(self.response) > 0):
-					self.hasReceivedResponse = True
+			try:
+				line = self.port.readline()
+			except (serial.serialutil.SerialException, TypeError, ValueError):
+				# raised when the port is closed underneath the blocking read
+				break
+			if(len(line) > 0):
+				self.responses.put(line)
 	
 	def connect(self):
 		try:
@@ -127,20 +258,271 @@ class Arduino(threading.Thread):
 		except serial.serialutil.SerialException:
 			print("The communication port is already in use\n")
 		self.start()
-		time.sleep(1)
+		self.waitUntilReady(DEFAULT_READY_TIMEOUT)
+	
+	def waitUntilReady(self, deadline):
+		# pings sent while the board still resets are lost and simply repeated
+		start = time.perf_counter()
+		attempt = 0
+		while(time.perf_counter() - start < deadline):
+			attempt = attempt + 1
+			self.port.write(pingRequest(attempt).encode(DEFAULT_ENCODING) + DEFAULT_LF.encode(DEFAULT_ENCODING))
+			self.port.flush()
+			retry = time.perf_counter() + PING_INTERVAL
+			while(time.perf_counter() < retry):
+				try:
+					line = self.responses.get(True,max(0.0,retry - time.perf_counter()))
+				except queue.Empty:
+					break
+				responseObject = readyResponse(line,attempt,start,self.baudrate)
+				if(responseObject is not None):
+					return responseObject
+			if(not self.is_alive()):
+				raise ArduinoCommandExecutionException("The communication port has been closed")
+		raise ArduinoCommandExecutionException("The head did not answer within %s seconds" % (deadline))
 	
 	def disconnect(self):
 		self.stopProcessing = True
+		if(hasattr(self.port,"cancel_read")):
+			self.port.cancel_read()
+		if(self.is_alive()):
+			self.join(self.timeout)
 		self.port.close()
 	
 	def send(self, command):
-		self.hasReceivedResponse = False
+		# drop stale lines, e.g. boot noise, so they are not taken for our response
+		while(not self.responses.empty()):
+			self.responses.get_nowait()
+		start = time.perf_counter()
 		self.port.write(command.encode(DEFAULT_ENCODING) + DEFAULT_LF.encode(DEFAULT_ENCODING))
 		self.port.flush()
-		while (self.hasReceivedResponse == False):
-			time.sleep(0.001)
-		return self.response.decode(DEFAULT_ENCODING)
+		response = self.waitForLine()
+		self.latencies.append((command,time.perf_counter() - start))
+		return response.decode(DEFAULT_ENCODING)
+	
+	def waitForLine(self):
+		# wake up once per timeout only to notice a dead reader thread
+		while(True):
+			try:
+				return self.responses.get(True,self.timeout)
+			except queue.Empty:
+				if(not self.is_alive()):
+					raise ArduinoCommandExecutionException("The communication port has been closed")
 
+#
+# asyncio counterpart of the Arduino class.
+# The serial file descriptor is watched by the running event loop, responses
+# are matched to the waiting commands in the order they were sent.
+#
+class AsyncArduino(object):
+	def __init__(self, device, baudrate, timeout):
+		self.device = device
+		self.baudrate = baudrate
+		self.timeout = timeout
+		self.port = None
+		self.loop = None
+		self.received = bytearray()
+		self.outgoing = bytearray()
+		self.waiting = collections.deque()
+		self.latencies = []
+		self.motor = None
+		# set once the replies can no longer be matched to the commands
+		self.failed = None
+	
+	async def connect(self):
+		self.loop = asyncio.get_running_loop()
+		try:
+			self.port = serial.Serial(self.device,self.baudrate,timeout=0,write_timeout=0)
+		except serial.serialutil.SerialException:
+			print("The communication port is already in use\n")
+			raise
+		self.loop.add_reader(self.port.fileno(),self.onReadable)
+		await self.waitUntilReady(DEFAULT_READY_TIMEOUT)
+	
+	async def waitUntilReady(self, deadline):
+		# pings sent while the board still resets are lost and simply repeated
+		start = time.perf_counter()
+		attempt = 0
+		while(time.perf_counter() - start < deadline):
+			attempt = attempt + 1
+			self.outgoing += pingRequest(attempt).encode(DEFAULT_ENCODING) + DEFAULT_LF.encode(DEFAULT_ENCODING)
+			self.onWritable()
+			retry = time.perf_counter() + PING_INTERVAL
+			while(time.perf_counter() < retry):
+				future = self.loop.create_future()
+				self.waiting.append(future)
+				try:
+					line = await asyncio.wait_for(future,retry - time.perf_counter())
+				except asyncio.TimeoutError:
+					# a lost ping is never answered, its waiter must not take the next line
+					if(future in self.waiting):
+						self.waiting.remove(future)
+					break
+				responseObject = readyResponse(line,attempt,start,self.baudrate)
+				if(responseObject is not None):
+					return responseObject
+		raise ArduinoCommandExecutionException("The head did not answer within %s seconds" % (deadline))
+	
+	def disconnect(self):
+		self.loop.remove_reader(self.port.fileno())
+		self.loop.remove_writer(self.port.fileno())
+		for future in self.waiting:
+			future.cancel()
+		self.waiting.clear()
+		self.port.close()
+	
+	def onReadable(self):
+		try:
+			data = os.read(self.port.fileno(),1024)
+		except BlockingIOError:
+			return
+		except OSError:
+			# the adapter is gone, nothing will answer the pending commands
+			self.fail("The communication port has been closed")
+			return
+		self.received += data
+		while(DEFAULT_LF.encode(DEFAULT_ENCODING) in self.received):
+			index = self.received.index(DEFAULT_LF.encode(DEFAULT_ENCODING))
+			line = bytes(self.received[:index + 1])
+			del self.received[:index + 1]
+			# lines nobody is waiting for, e.g. boot noise, are dropped
+			if(len(self.waiting) > 0):
+				future = self.waiting.popleft()
+				if(not future.done()):
+					future.set_result(line)
+	
+	def onWritable(self):
+		try:
+			written = os.write(self.port.fileno(),self.outgoing)
+		except BlockingIOError:
+			written = 0
+		except OSError:
+			self.fail("The communication port has been closed")
+			return
+		del self.outgoing[:written]
+		if(len(self.outgoing) > 0):
+			self.loop.add_writer(self.port.fileno(),self.onWritable)
+		else:
+			self.loop.remove_writer(self.port.fileno())
+	
+	def fail(self, message):
+		# replies are matched by order only, after a lost one every later reply
+		# would be taken for the wrong command, the connection is given up
+		self.failed = message
+		self.loop.remove_reader(self.port.fileno())
+		self.loop.remove_writer(self.port.fileno())
+		self.outgoing = bytearray()
+		while(len(self.waiting) > 0):
+			future = self.waiting.popleft()
+			if(not future.done()):
+				future.set_exception(ArduinoCommandExecutionException(message))
+	
+	async def send(self, command, timeout = None):
+		if(self.failed is not None):
+			raise ArduinoCommandExecutionException(self.failed)
+		if(timeout is None):
+			timeout = self.timeout
+		future = self.loop.create_future()
+		self.waiting.append(future)
+		start = time.perf_counter()
+		self.outgoing += command.encode(DEFAULT_ENCODING) + DEFAULT_LF.encode(DEFAULT_ENCODING)
+		self.onWritable()
+		try:
+			response = await asyncio.wait_for(future,timeout)
+		except asyncio.TimeoutError:
+			self.fail("No response from the head within %.1f sec. to %s" % (timeout,command))
+			raise ArduinoCommandExecutionException(self.failed)
+		self.latencies.append((command,time.perf_counter() - start))
+		return response.decode(DEFAULT_ENCODING)
+	
+	async def initialize(self, motorPort, motorSteps, motorStepAngle, motorSpeed, motorAcceleration):
+		request = json.dumps({"command":"initialize","port":motorPort,"total-steps":motorSteps,"step-angle":motorStepAngle,"max-speed":motorSpeed,"acceleration":motorAcceleration})
+		self.motor = (float(motorStepAngle),float(motorSpeed),float(motorAcceleration))
+		return parseResponse(await self.send(request))
+	
+	async def power(self, status):
+		return parseResponse(await self.send(json.dumps({"command":"power","toggle":status})))
+	
+	async def rotate(self, direction, degrees):
+		request = json.dumps({"command":"rotate","direction":direction,"degrees":degrees})
+		return parseResponse(await self.send(request,self.timeout + self.rotationTime(degrees)))
+	
+	def rotationTime(self, degrees):
+		# the head answers once the rotation is finished, this is an upper
+		# bound of accelerating to full speed and braking again
+		if(self.motor is None):
+			return 0.0
+		stepAngle, speed, acceleration = self.motor
+		return float(degrees) / stepAngle / speed + speed / acceleration
+
+#
+# One "gphoto2 --shell" process kept open for the whole run.
+# The camera is detected and opened once, every command is written to the
+# shell and its output read up to the next prompt.
+#
+class GphotoShell(object):
+	def __init__(self):
+		self.process = None
+		self.output = bytearray()
+		self.settings = {}
+	
+	def start(self):
+		self.process = subprocess.Popen(["gphoto2","--shell"],stdin=subprocess.PIPE,stdout=subprocess.PIPE,stderr=subprocess.STDOUT)
+		self.readUntilPrompt()
+	
+	def close(self):
+		# start() may have failed before gphoto2 was running
+		if(self.process is None):
+			return
+		try:
+			self.process.stdin.write(b"exit\n")
+			self.process.stdin.flush()
+		except (BrokenPipeError, ValueError):
+			pass
+		try:
+			self.process.wait(GPHOTO_SHELL_TIMEOUT)
+		except subprocess.TimeoutExpired:
+			# it never showed a prompt, exit was not read either
+			self.process.kill()
+			self.process.wait()
+	
+	def setConfig(self, name, value):
+		# the session keeps the camera state, unchanged values are not sent again
+		if(self.settings.get(name) == value):
+			return
+		self.execute("set-config %s=%s" % (name,value))
+		self.settings[name] = value
+	
+	def execute(self, command):
+		self.process.stdin.write(command.encode(DEFAULT_ENCODING) + DEFAULT_LF.encode(DEFAULT_ENCODING))
+		self.process.stdin.flush()
+		output = self.readUntilPrompt()
+		if(GPHOTO_SHELL_ERROR in output):
+			raise CameraCommandExecutionException(output.decode(DEFAULT_ENCODING,"replace").strip())
+		return output
+	
+	def readUntilPrompt(self):
+		deadline = time.perf_counter() + GPHOTO_SHELL_TIMEOUT
+		while(GPHOTO_SHELL_PROMPT.search(bytes(self.output)) is None):
+			remaining = deadline - time.perf_counter()
+			if(remaining <= 0 or len(select.select([self.process.stdout],[],[],remaining)[0]) == 0):
+				raise CameraCommandExecutionException("gphoto2 did not answer within %s seconds" % (GPHOTO_SHELL_TIMEOUT))
+			data = os.read(self.process.stdout.fileno(),4096)
+			if(len(data) == 0):
+				raise CameraCommandExecutionException("gphoto2 exited with %s" % (self.process.wait()))
+			self.output += data
+		output = bytes(self.output)
+		self.output = bytearray()
+		return output
+
+#
+# Camera communications Exception
+#
+class CameraCommandExecutionException(Exception):
+	def __init__(self, value):
+		self.value = value
+	def __str__(self):
+		return repr(self.value)
 
 #
 # Arduino communications Exception
@@ -165,6 +547,11 @@ def setupArgumentParser():
 	communication.add_argument("--baudrate",required=False,
 		default="9600",
 		help="RX/TX Baudrate")
+	
+	communication.add_argument("--transport",required=False,
+		default="thread",
+		choices=["thread","asyncio"],
+		help="Serial transport, a dedicated reader thread or an asyncio event loop")
 		
 	# ---- rotation arguments ----
 	
@@ -180,6 +567,11 @@ def setupArgumentParser():
 	
 	image = parser.add_argument_group("image arguments")
 	
+	image.add_argument("--session",required=False,
+		default="shell",
+		choices=["shell","process"],
+		help = "keep one gphoto2 shell open for the whole run or start gphoto2 for every image")
+	
 	image.add_argument("--aperture",required=True,
 		help = "the aperture to be used for all exposures")
 	
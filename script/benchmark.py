@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+
+
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# End to end throughput benchmark.
+#
+# Runs the whole capture loop of control.py against simulator.py on a
+# pseudo terminal and a fake libgphoto2 backend with configurable latencies:
+#
+#   ./benchmark.py --output results.json
+#
+# All simulated durations are multiplied by --timescale so a 300 frame
+# session does not take half an hour, the head gets proportionally faster
+# motors. The results are scaled back to real time, only the overhead of
+# the controller itself gets overrated with small timescales.
+#
+# Every scenario reports frames per minute, the time head and camera were
+# idle and how the session time splits into its phases. The results are
+# written as JSON together with the git revision, --history collects the
+# runs of many versions in one file of JSON lines.
+#
+
+import sys, os, subprocess, json, time, argparse, ctypes, ctypes.util, tempfile, shutil, threading
+import control, metrics
+
+try:
+	from StringIO import StringIO
+except ImportError:
+	from io import StringIO
+
+GP_OK = 0
+
+# seconds the simulator gets to create its pseudo terminal
+SIMULATOR_TIMEOUT = 10
+
+WIRE_BITS_PER_BYTE = control.WIRE_BITS_PER_BYTE
+
+SCENARIOS = [
+	("36x1", "36 positions in one row, one exposure each",
+		["--degrees","10"], 1),
+	("36x1-binary", "36 positions in one row, one exposure each, binary framed head commands",
+		["--degrees","10","--framing","binary"], 1),
+	("36x3", "36 positions in one row, a bracket of three the camera fires itself",
+		["--degrees","10","--aeb","+/- 1","--aebframes","3"], 3),
+	("multirow300", "300 positions in 17 rows up to both poles",
+		["--hfov","19","--vfov","15"], 1),
+]
+
+# phases which keep the head or the camera busy
+HEAD_PHASES = ["rotate","program"]
+CAMERA_PHASES = ["capture","store","config_fetch","config_write","file_get","delete","preview"]
+# phases of the capture loop itself, the download ones only without --overlap
+LOOP_PHASES = ["rotate","program","capture","config_fetch","config_write","preview"]
+DOWNLOAD_PHASES = ["file_get","disk_write","delete"]
+
+libc = ctypes.CDLL(ctypes.util.find_library("c"))
+libc.malloc.restype = ctypes.c_void_p
+
+#----------------------------------------------------------------------
+def main():
+	results = setupArgumentParser()
+
+	names = results.scenario or [name for name, description, arguments, bracket in SCENARIOS]
+	report = {"revision":revision(),"timestamp":time.strftime("%Y-%m-%d-%H:%M:%S",time.localtime()),"parameters":vars(results),"scenarios":[]}
+	for name, description, arguments, bracket in SCENARIOS:
+		if(name not in names):
+			continue
+		sys.stdout.write("%s: %s \n" % (name,description))
+		sys.stdout.flush()
+		result = runScenario(results,name,arguments,bracket)
+		report["scenarios"].append(result)
+		printResult(result)
+
+	with open(results.output,"w") as output:
+		json.dump(report,output,indent=2,sort_keys=True)
+	if(results.history is not None):
+		with open(results.history,"a") as history:
+			history.write(json.dumps(report,sort_keys=True) + "\n")
+
+def runScenario(results, name, arguments, bracket):
+	scale = results.timescale
+	directory = tempfile.mkdtemp(prefix="parallax-benchmark-")
+	link = os.path.join(directory,"head")
+	simulator = startSimulator(results,link)
+	camera = FakeGphoto(results,bracket)
+	try:
+		argv = ["--device",link,"--baudrate",str(results.baudrate),"--direction","clockwise",
+			"--aperture","8","--shutterspeed","1/100",
+			"--location",directory,"--journal",os.path.join(directory,"journal"),
+			"--maxspeed",scaled(results.maxspeed,scale),"--acceleration",scaled(results.acceleration,scale * scale),
+			"--pitchmaxspeed",scaled(results.maxspeed,scale),"--pitchacceleration",scaled(results.acceleration,scale * scale),
+			"--settle",str(results.settle * scale)] + arguments + results.control.split()
+		control.gp = camera
+		control.phases = metrics.Metrics()
+		# the simulated line is faster by the timescale as well, the controller
+		# models it that way without configuring a baudrate the head never reports
+		control.WIRE_BITS_PER_BYTE = WIRE_BITS_PER_BYTE * scale
+		output = StringIO()
+		stdout = sys.stdout
+		if(not results.verbose):
+			sys.stdout = output
+		start = time.time()
+		try:
+			control.main(argv)
+		finally:
+			sys.stdout = stdout
+			control.WIRE_BITS_PER_BYTE = WIRE_BITS_PER_BYTE
+		elapsed = (time.time() - start) / scale
+	finally:
+		simulator.terminate()
+		simulator.wait()
+		shutil.rmtree(directory,True)
+	return evaluate(name,control.phases.summary(),elapsed,camera,scale,"--overlap" in argv)
+
+def evaluate(name, summary, elapsed, camera, scale, overlap):
+	totals = dict([(phase,phaseSummary["total"] / scale) for phase, phaseSummary in summary.items()])
+	result = {"scenario":name,"frames":camera.triggers,"exposures":camera.exposures,"elapsed":elapsed}
+	result["frames_per_minute"] = camera.triggers * 60.0 / elapsed if elapsed > 0 else 0.0
+	result["head_idle"] = max(0.0,elapsed - sum([totals.get(phase,0.0) for phase in HEAD_PHASES]))
+	result["camera_idle"] = max(0.0,elapsed - sum([totals.get(phase,0.0) for phase in CAMERA_PHASES]))
+	# background downloads overlap the loop, they only count where the loop waits for them
+	critical = LOOP_PHASES if overlap else LOOP_PHASES + DOWNLOAD_PHASES
+	breakdown = dict([(phase,{"total":totals[phase],"share":totals[phase] / elapsed}) for phase in critical if phase in totals])
+	# round trips minus the motion in them, commands and acks on the wire
+	wire = max(0.0,totals.get("serial_round_trip",0.0) - sum([totals.get(phase,0.0) for phase in HEAD_PHASES]))
+	breakdown["serial"] = {"total":wire,"share":wire / elapsed}
+	other = max(0.0,elapsed - sum([entry["total"] for entry in breakdown.values()]))
+	breakdown["other"] = {"total":other,"share":other / elapsed}
+	result["critical_path"] = breakdown
+	result["phases"] = dict([(phase,scaleSummary(phaseSummary,scale)) for phase, phaseSummary in summary.items()])
+	return result
+
+def scaleSummary(summary, scale):
+	# seconds back in real time, the histogram buckets only hold for scale 1
+	scaledSummary = {"count":summary["count"]}
+	for key in ["total","min","max","mean"] + ["p%d" % (rank) for rank in metrics.PERCENTILES]:
+		if(key in summary):
+			scaledSummary[key] = summary[key] / scale
+	return scaledSummary
+
+def scaled(value, scale):
+	return str(int(round(float(value) / scale)))
+
+def startSimulator(results, link):
+	simulator = subprocess.Popen([sys.executable,os.path.join(os.path.dirname(os.path.abspath(__file__)),"simulator.py"),
+		"--link",link,"--latency",str(results.latency * results.timescale),
+		"--baudrate",scaled(results.baudrate,results.timescale),"--binary"],stdout=open(os.devnull,"w"))
+	deadline = time.time() + SIMULATOR_TIMEOUT
+	while(not os.path.exists(link)):
+		if(time.time() > deadline or simulator.poll() is not None):
+			simulator.terminate()
+			raise BenchmarkException("The simulator did not start")
+		time.sleep(0.05)
+	return simulator
+
+def revision():
+	try:
+		return subprocess.check_output(["git","describe","--always","--dirty"],cwd=os.path.dirname(os.path.abspath(__file__)),stderr=open(os.devnull,"w")).decode("UTF-8").strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def printResult(result):
+	sys.stdout.write("  %d frames in %.1f sec. %.1f frames/min head idle: %.1f sec. camera idle: %.1f sec. \n" % (result["frames"],result["elapsed"],result["frames_per_minute"],result["head_idle"],result["camera_idle"]))
+	for phase, entry in sorted(result["critical_path"].items(),key=lambda item: -item[1]["total"]):
+		sys.stdout.write("  %-14s %7.1f sec. %5.1f %% \n" % (phase,entry["total"],entry["share"] * 100))
+
+#
+# Benchmark Exception, raised if the simulated hardware can not be set up
+#
+class BenchmarkException(Exception):
+	def __init__(self, value):
+		self.value = value
+	def __str__(self):
+		return repr(self.value)
+
+#
+# Calls of a fake function are answered by the given python function, check()
+# in control.py sets the restype of gp_result_as_string.
+#
+class FakeFunction(object):
+	def __init__(self, function):
+		self.function = function
+		self.restype = None
+		self.argtypes = None
+
+	def __call__(self, *arguments):
+		return self.function(*arguments)
+
+#
+# Replacement for the libgphoto2 calls control.py makes. Every camera
+# operation takes its configured time, the images are files of --imagesize
+# bytes filled with zeros. Brackets fire one frame after the other, each
+# is reported as GP_EVENT_FILE_ADDED once it is exposed and stored, the
+# trigger as GP_EVENT_CAPTURE_COMPLETE once the last frame is exposed.
+#
+class FakeGphoto(object):
+	def __init__(self, results, bracket):
+		scale = results.timescale
+		self.capture = results.capture * scale
+		self.store = results.store * scale
+		self.config = results.config * scale
+		self.transfer = results.transfer * scale
+		self.previewTransfer = results.previewtransfer * scale
+		self.delete = results.delete * scale
+		self.imageSize = results.imagesize
+		self.previewSize = results.previewsize
+		self.bracket = bracket
+		self.triggers = 0
+		self.exposures = 0
+		self.events = []
+		self.lock = threading.Lock()
+		self.gp_result_as_string = FakeFunction(lambda result: b"Fake camera error")
+
+	def __getattr__(self, name):
+		# context, camera and widget bookkeeping, nothing to simulate
+		if(name.startswith("gp_")):
+			return lambda *arguments: GP_OK
+		raise AttributeError(name)
+
+	def nextPath(self):
+		self.exposures = self.exposures + 1
+		path = control.CameraFilePath()
+		path.folder = b"/store_00020001/DCIM/100CANON"
+		path.name = ("IMG_%04d.CR2" % (self.exposures)).encode("UTF-8")
+		return path
+
+	def gp_camera_get_config(self, camera, window, context):
+		time.sleep(self.config)
+		return GP_OK
+
+	def gp_camera_set_config(self, camera, window, context):
+		time.sleep(self.config)
+		return GP_OK
+
+	def gp_widget_count_children(self, widget):
+		return 0
+
+	def gp_camera_trigger_capture(self, camera, context):
+		self.triggers = self.triggers + 1
+		now = time.time()
+		with self.lock:
+			for frame in range(self.bracket):
+				self.events.append((now + (frame + 1) * self.capture + self.store,control.GP_EVENT_FILE_ADDED,self.nextPath()))
+			self.events.append((now + self.bracket * self.capture,control.GP_EVENT_CAPTURE_COMPLETE,None))
+			self.events.sort(key=lambda event: event[0])
+		return GP_OK
+
+	def gp_camera_wait_for_event(self, camera, timeout, eventType, data, context):
+		with self.lock:
+			ready, event, path = self.events[0] if len(self.events) > 0 else (None,None,None)
+		deadline = time.time() + timeout / 1000.0
+		if(ready is None or ready > deadline):
+			time.sleep(max(0.0,deadline - time.time()))
+			eventType.contents.value = control.GP_EVENT_TIMEOUT
+			data.contents.value = None
+			return GP_OK
+		time.sleep(max(0.0,ready - time.time()))
+		with self.lock:
+			self.events.pop(0)
+		eventType.contents.value = event
+		data.contents.value = None
+		if(path is not None):
+			# the caller frees the event data
+			pointer = libc.malloc(ctypes.sizeof(path))
+			ctypes.memmove(pointer,ctypes.addressof(path),ctypes.sizeof(path))
+			data.contents.value = pointer
+		return GP_OK
+
+	def gp_camera_file_read(self, camera, folder, name, fileType, offset, buf, size, context):
+		total = self.previewSize if fileType == control.GP_FILE_TYPE_PREVIEW else self.imageSize
+		duration = self.previewTransfer if fileType == control.GP_FILE_TYPE_PREVIEW else self.transfer
+		chunk = max(0,min(size.contents.value,total - offset))
+		time.sleep(duration * chunk / total)
+		size.contents.value = chunk
+		return GP_OK
+
+	def gp_camera_file_delete(self, camera, folder, name, context):
+		time.sleep(self.delete)
+		return GP_OK
+
+#----------------------------------------------------------------------
+def setupArgumentParser():
+	parser = argparse.ArgumentParser(description="End to end throughput benchmark of control.py with simulated hardware")
+
+	parser.add_argument("--scenario",required=False,
+		action = "append",choices=[name for name, description, arguments, bracket in SCENARIOS],
+		help = "Scenario to run, may be given more than once, all by default")
+
+	parser.add_argument("--output",required=False,
+		default="benchmark-results.json",
+		help = "JSON file the results are written to")
+
+	parser.add_argument("--history",required=False,
+		default=None,
+		help = "File of JSON lines every run is appended to, to compare versions")
+
+	parser.add_argument("--timescale",required=False,
+		type=float,default=0.1,
+		help = "Factor applied to all simulated durations")
+
+	parser.add_argument("--control",required=False,
+		default="--overlap",
+		help = "Further arguments for control.py, e.g. --control=\"--overlap --predict\"")
+
+	parser.add_argument("--verbose",required=False,
+		action = "store_true",
+		help = "Show the output of control.py")
+
+	# ---- head arguments ----
+
+	head = parser.add_argument_group("head arguments")
+
+	head.add_argument("--latency",required=False,
+		type=float,default=0,
+		help = "Milliseconds the head adds before every reply")
+
+	head.add_argument("--baudrate",required=False,
+		type=int,default=9600,
+		help = "Baudrate of the simulated serial line")
+
+	head.add_argument("--maxspeed",required=False,
+		type=int,default=300,
+		help = "Maximum speed of both motors in steps/s")
+
+	head.add_argument("--acceleration",required=False,
+		type=int,default=20,
+		help = "Acceleration of both motors in steps/s^2")
+
+	head.add_argument("--settle",required=False,
+		type=float,default=0.2,
+		help = "Seconds the head needs to settle, used with --predict")
+
+	# ---- camera arguments ----
+
+	camera = parser.add_argument_group("camera arguments")
+
+	camera.add_argument("--capture",required=False,
+		type=float,default=0.4,
+		help = "Seconds from the trigger until an image is exposed")
+
+	camera.add_argument("--store",required=False,
+		type=float,default=0.2,
+		help = "Seconds the camera stores an image after its exposure before it reports the file")
+
+	camera.add_argument("--config",required=False,
+		type=float,default=0.05,
+		help = "Seconds a configuration fetch or write takes")
+
+	camera.add_argument("--transfer",required=False,
+		type=float,default=1.0,
+		help = "Seconds the transfer of one image takes")
+
+	camera.add_argument("--previewtransfer",required=False,
+		type=float,default=0.1,
+		help = "Seconds the transfer of one embedded preview takes")
+
+	camera.add_argument("--delete",required=False,
+		type=float,default=0.05,
+		help = "Seconds deleting an image on the camera takes")
+
+	camera.add_argument("--imagesize",required=False,
+		type=int,default=1024 * 1024,
+		help = "Bytes written to disk per image")
+
+	camera.add_argument("--previewsize",required=False,
+		type=int,default=64 * 1024,
+		help = "Bytes written to disk per preview")
+
+	return parser.parse_args()
+
+#----------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
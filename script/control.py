@@ -19,7 +19,14 @@
  limitations under the License.
 '''
 
-import sys, subprocess, serial, json, threading, time, argparse, ctypes, os
+import sys, subprocess, serial, json, threading, time, argparse, ctypes, ctypes.util, os, collections, re
+import framing, planner, motion, journal, metrics, gptrace
+from metrics import timer
+
+try:
+	import queue
+except ImportError:
+	import Queue as queue
 
 DEFAULT_BAUDRATE = 9600
 DEFAULT_ENCODING = 'UTF-8'
@@ -27,6 +34,35 @@ DEFAULT_LF = '\n'
 
 JSON_ATTRIBUTE_STATUS = "status";
 JSON_ATTRIBUTE_ERROR = "error";
+JSON_ATTRIBUTE_ID = "id";
+JSON_ATTRIBUTE_COMMAND = "command";
+JSON_ATTRIBUTE_EVENT = "event";
+
+# commands in flight at once, matches COMMAND_QUEUE_SIZE in the firmware
+DEFAULT_WINDOW = 2
+
+# start bit, 8 data bits and stop bit of every byte on the serial line
+WIRE_BITS_PER_BYTE = 10
+
+# seconds to wait for the head to answer a ping after opening the port,
+# the port open resets the board which then needs to boot
+DEFAULT_READY_TIMEOUT = 10
+PING_INTERVAL = 0.25
+
+# seconds an exposure may fire before the ack of its move without a warning,
+# the timing of the serial line is not any finer
+EARLY_TOLERANCE = 0.01
+
+# program memory of the head and the instructions sent per command,
+# a line has to fit the serial buffers of the firmware
+PROGRAM_SIZE = 512
+PROGRAM_CHUNK_SIZE = 200
+PROGRAM_MODE_APPEND = "append"
+PROGRAM_INSTRUCTION = re.compile(r"[A-Z][-+]?\d+")
+PROGRESS_INTERVAL = 0.5
+
+STATUS_READY_VALUE = "Ready"
+CAPABILITY_BINARY = "binary"
 
 STATUS_ERROR_VALUE = "Error";
 
@@ -37,48 +73,284 @@ PTR = ctypes.pointer
 
 GP_OK = 0
 GP_CAPTURE_IMAGE = 0
+GP_FILE_TYPE_PREVIEW = 0
 GP_FILE_TYPE_NORMAL = 1
 GP_STORAGE_LOCATION_MEMORY = "Internal RAM"
 GP_STORAGE_LOCATION_CARD = "Memory card"
 
-gp = ctypes.CDLL('/usr/lib/libgphoto2.so.2')
+GP_ERROR_NOT_SUPPORTED = -6
+GP_ERROR_TIMEOUT = -10
+
+GP_EVENT_UNKNOWN = 0
+GP_EVENT_TIMEOUT = 1
+GP_EVENT_FILE_ADDED = 2
+GP_EVENT_CAPTURE_COMPLETE = 4
+
+# ptp2 reports property changes as unknown events, our own writes are echoed too
+PROPERTY_CHANGED = re.compile(br"PTP Property ([0-9a-fA-F]{4}) changed")
+# device properties of the settings CameraConfig writes, standard PTP and Canon EOS codes
+PROPERTY_WIDGETS = {
+	0x5007 : "capturesettings/aperture",
+	0xD101 : "capturesettings/aperture",
+	0x500D : "capturesettings/shutterspeed",
+	0xD102 : "capturesettings/shutterspeed",
+	0x5013 : "capturesettings/drivemode",
+	0xD106 : "capturesettings/drivemode",
+	0xD1D9 : "capturesettings/aeb",
+	0xD11C : "capturetarget",
+}
+
+# milliseconds a single wait for camera events blocks, and seconds a whole
+# bracket may take until all of its files were reported
+EVENT_WAIT_TIMEOUT = 1000
+BRACKET_TIMEOUT = 60
+
+EOS_REMOTE_RELEASE = "eosremoterelease"
+EOS_PRESS_FULL = "Press Full"
+EOS_RELEASE_FULL = "Release Full"
+
+# images are streamed from the camera in chunks of this many bytes
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+try:
+	# traced or replayed if GPHOTO2_TRACE or GPHOTO2_REPLAY is set, see gptrace.py
+	gp = gptrace.load('/usr/lib/libgphoto2.so.2')
+except OSError:
+	# without libgphoto2 only a replacement backend works, e.g. the one of benchmark.py or a replay
+	gp = None
+libc = ctypes.CDLL(ctypes.util.find_library("c"))
+
+# durations of every phase of the session, recorded from all threads
+phases = metrics.Metrics()
+
+# partial reads need libgphoto2 2.5, offset and size are 64 bit
+if(hasattr(gp,"gp_camera_file_read")):
+	gp.gp_camera_file_read.argtypes = [ctypes.c_void_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_int,ctypes.c_uint64,ctypes.c_char_p,ctypes.POINTER(ctypes.c_uint64),ctypes.c_void_p]
 
 #----------------------------------------------------------------------
-def main():
-	results = setupArgumentParser()
+def main(argv = None):
+	results = setupArgumentParser(argv)
+	
+	if(gp is None):
+		print("libgphoto2 could not be loaded, please install it")
+		return
 	
 	if((results.direction != "clockwise") & (results.direction != "counterclockwise")):
 		print("The rotation direction can either by [clockwise] or [counterclockwise]")
 		return
 	
-	if(divmod(360,int(results.degrees))[1] > 0):
+	recovery = None
+	if(results.resume):
+		try:
+			recovery = journal.load(results.journal)
+		except journal.JournalException as e:
+			print("Unable to resume: %s" % (e))
+			return
+	elif(journal.unfinished(results.journal)):
+		print("The journal %s holds an unfinished session, continue it with --resume or remove the journal" % (results.journal))
+		return
+	
+	if(recovery is None and results.hfov is None and results.degrees is None):
+		print("Please choose the degrees per rotation step or the field of view of the lens with --hfov and --vfov")
+		return
+	
+	if(recovery is None and results.hfov is None and divmod(360,int(results.degrees))[1] > 0):
 		print("The choosen amount of degrees are not valid, Please choose any number which wraps around 360!")
 		return
 	
+	if(recovery is not None):
+		positions = recovery.positions
+	elif(results.hfov is not None):
+		try:
+			positions = planner.plan(results.hfov,results.vfov or results.hfov,results.imageoverlap,results.minpitch,results.maxpitch)
+		except planner.PlannerException as e:
+			print("No plan possible: %s" % (e))
+			return
+		sys.stdout.write("%d rows with %d frames, a grid would need %d \n" % (positions[-1].row + 1,len(positions),planner.gridFrames(results.hfov,results.vfov or results.hfov,results.imageoverlap,results.minpitch,results.maxpitch)))
+	else:
+		positions = planner.singleRow(results.degrees)
+	
+	if(results.program and results.location != "memorycard"):
+		print("With --program the head releases the shutter, the images stay on the memory card")
+		return
+	
+	if(results.preview and results.location == "memorycard"):
+		print("Previews need a download location, please choose one with --location")
+		return
+	
 	arduino = Arduino(results.device,results.baudrate,4)
 	arduino.connect()
 
-	gpcontext = initializeGphotoContext()
-	camera = initializeCamera(gpcontext)
-
-	localtime = time.localtime()
-	timestmp = time.strftime("%Y-%m-%d-%H:%M:%S", localtime)
+	sessionJournal = journal.Journal(results.journal)
+	gpcontext = None
+	camera = None
+	config = None
+	session = None
+	downloader = None
+	route = None
+	travel = Travel()
+	finished = False
+	powered = False
+	# the last exposure of the previous position, the camera stores it while the head moves on
+	shot = None
 
 	try:
-		initialize(arduino,results.shieldport,results.steps,results.stepangle,results.maxspeed,results.acceleration)
-		powerToggle(arduino,POWER_TOGGLE_ON)
-		steps = divmod(360,int(results.degrees))[0]
-		counter = 0
-		while(counter < steps):
-			shoot(gpcontext,results.location,results.aperture,results.shutterspeed,camera,timestmp,counter)
-			rotate(arduino,results.direction,results.degrees)
-			counter = counter + 1
-		powerToggle(arduino,POWER_TOGGLE_OFF)
-	except ArduinoCommandExecutionException as e:
+		if(results.framing == framing.FRAMING_BINARY and not results.program):
+			enableBinaryFraming(arduino)
+
+		yaw = Axis(framing.AXIS_YAW,motion.AxisModel(results.stepangle,results.maxspeed,results.acceleration,results.backlash,results.jerk),results.direction)
+		pitch = None
+		if(len([position for position in positions if position.pitch != 0]) > 0):
+			pitch = Axis(framing.AXIS_PITCH,motion.AxisModel(results.pitchstepangle,results.pitchmaxspeed,results.pitchacceleration,results.backlash,results.jerk),results.pitchdirection)
+		
+		if(recovery is None):
+			route = planner.order(positions,yaw.model,None if pitch is None else pitch.model)
+			positions = route.positions
+			home = planner.Position(0,0,planner.nearestTurn(0.0,positions[-1].yaw),0.0)
+			counters = list(range(len(positions)))
+			timestmp = time.strftime("%Y-%m-%d-%H:%M:%S", time.localtime())
+			sessionJournal.create()
+			sessionJournal.plan(timestmp,positions,home)
+		else:
+			home = recovery.home
+			counters = [counter for counter in range(len(positions)) if not recovery.complete(counter)]
+			if(not restoreHead(arduino,recovery,yaw,pitch,results.rehome,positions[counters[0]].yaw if len(counters) > 0 else home.yaw)):
+				return
+			start = planner.Position(0,0,yaw.angle(),0.0 if pitch is None else pitch.angle())
+			route = planner.follow([positions[counter] for counter in counters],yaw.model,None if pitch is None else pitch.model,start,home)
+			timestmp = recovery.timestamp
+			sessionJournal.reopen()
+			sys.stdout.write("Resuming the session of %s, %d of %d positions are done \n" % (timestmp,len(positions) - len(counters),len(positions)))
+
+		if(results.livemetrics is not None):
+			phases.live(results.livemetrics)
+
+		gpcontext = initializeGphotoContext()
+		camera = initializeCamera(gpcontext)
+		config = CameraConfig(camera,gpcontext)
+
+		session = Session(sessionJournal)
+		if(recovery is not None):
+			restoreExposures(gpcontext,camera,session,recovery,counters)
+		# with previews the images wait on the card until the end of the session
+		immediate = not results.preview
+		if(results.overlap and results.location != "memorycard"):
+			downloader = Downloader(gpcontext,camera,session)
+			downloader.start()
+
+		if(results.aeb is not None):
+			programBracket(config,results.location,results.aperture,results.shutterspeed[0],results.aeb,results.drivemode,results.preview)
+
+		try:
+			# the head executes both in order, no need to wait for the first ack
+			pending = [arduino.submit(initializeRequest(results.shieldport,results.steps,results.stepangle,results.maxspeed,results.acceleration)),arduino.submit(powerRequest(POWER_TOGGLE_ON))]
+			if(pitch is not None):
+				pending.append(arduino.submit(initializeRequest(results.pitchport,results.pitchsteps,results.pitchstepangle,results.pitchmaxspeed,results.pitchacceleration,framing.AXIS_PITCH)))
+				pending.append(arduino.submit(powerRequest(POWER_TOGGLE_ON,framing.AXIS_PITCH)))
+			for request in pending:
+				complete(request)
+			powered = True
+			# initializing starts the step count of the head over
+			yaw.reported = 0
+			if(pitch is not None):
+				pitch.reported = 0
+			sessionJournal.head((yaw,pitch))
+			if(results.program):
+				if(results.aeb is None):
+					armCapture(config,results.location,results.aperture,results.shutterspeed[0])
+				instructions = buildProgram([positions[counter] for counter in counters],home,yaw,pitch,results.settle,results.pulse,results.dwell)
+				predicted = route.duration + len(counters) * (results.settle + (results.pulse + results.dwell) / 1000.0)
+				sessionJournal.moving()
+				achieved = runProgram(arduino,instructions,counters,sessionJournal)
+				phases.record("program",achieved)
+				readHeadPosition(arduino,yaw,pitch)
+				sessionJournal.head((yaw,pitch))
+				sys.stdout.write("program of %d bytes predicted: %.1f sec. achieved: %.1f sec. \n" % (len(instructions),predicted,achieved))
+				counters = []
+			for counter in counters:
+				# written before the head starts, a crash during the move leaves it unconfirmed
+				sessionJournal.moving()
+				move = submitMove(arduino,yaw,pitch,positions[counter])
+				if(shot is not None):
+					storeExposures(session,downloader,shot.collect())
+					shot = None
+				if(not results.predict):
+					travel.add(None if move is None else move.confirm())
+					sessionJournal.head((yaw,pitch))
+					move = None
+				if(downloader is not None):
+					# the camera is used by one thread at a time, finish the last bracket first
+					downloader.wait()
+				if(move is not None):
+					if(results.aeb is None):
+						# the settings are written while the head still moves, shoot() finds them unchanged
+						armCapture(config,results.location,results.aperture,results.shutterspeed[0],results.preview)
+					move.waitUntilSettled(results.settle)
+				fired = timer()
+				if(results.aeb is not None):
+					storeExposures(session,downloader,shootBracket(gpcontext,results.location,camera,config,timestmp,counter,results.aebframes,immediate and downloader is None,results.preview))
+				else:
+					shot = shoot(gpcontext,results.location,results.aperture,results.shutterspeed,camera,config,timestmp,counter,immediate and downloader is None,results.preview)
+				if(move is not None):
+					# the ack only confirms the move the images were already taken for
+					travel.add(move.confirm(),move.early(fired))
+					sessionJournal.head((yaw,pitch))
+			sessionJournal.moving()
+			move = submitMove(arduino,yaw,pitch,home)
+			if(shot is not None):
+				storeExposures(session,downloader,shot.collect())
+				shot = None
+			travel.add(None if move is None else move.confirm())
+			sessionJournal.head((yaw,pitch))
+			if(pitch is not None):
+				complete(arduino.submit(powerRequest(POWER_TOGGLE_OFF,framing.AXIS_PITCH)))
+			powerToggle(arduino,POWER_TOGGLE_OFF)
+			powered = False
+			finished = True
+		except ArduinoCommandExecutionException as e:
+			powered = False
+			print("Error occured: %s \n" % (e))
+		
+		# the camera still works when the head failed, everything taken so far is stored
+		if(downloader is not None):
+			downloader.wait()
+		if(shot is not None):
+			session.add(shot.collect())
+			shot = None
+		for exposure in session.pending():
+			downloadImage(gpcontext,camera,exposure)
+			session.update(exposure)
+	except (ArduinoCommandExecutionException, libgphoto2error) as e:
+		finished = False
 		print("Error occured: %s \n" % (e))
+		if(powered):
+			returnHead(arduino,yaw,pitch,home,sessionJournal)
+	finally:
+		if(downloader is not None):
+			downloader.stop()
+		# only a session which moved the head can be resumed
+		if(finished):
+			sessionJournal.finish()
+		elif(recovery is None and not sessionJournal.started):
+			sessionJournal.discard()
+		sessionJournal.close()
+		arduino.disconnect()
+		if(camera is not None):
+			config.invalidate()
+			disconnectCamera(gpcontext,camera)
 	
-	arduino.disconnect()
-	disconnectCamera(gpcontext,camera)
+	if(session is not None):
+		session.printSummary()
+	printLatencies(arduino)
+	if(config is not None):
+		printConfigStatistics(config)
+	if(route is not None):
+		printTravel(travel,route)
+	phases.printSummary()
+	if(results.metrics is not None):
+		phases.report(results.metrics)
+	if(results.livemetrics is not None):
+		phases.writeLive()
 	
 	
 #----------------------------------------------------------------------
@@ -104,92 +376,474 @@ def disconnectCamera(gpcontext,camera):
 	gp.gp_camera_exit(camera, gpcontext)  
 	gp.gp_camera_unref(camera)
 
-def setConfig(camera, gpcontext, name, value):
-	main = Widget()
-	check(gp.gp_camera_get_config(camera,PTR(main._w),gpcontext))
-	tokens = name.split('/')
-	parent = main
-	child = None
-	for token in tokens:
-		child = Widget()
-		ret = gp.gp_widget_get_child_by_name(parent._w,str(token),PTR(child._w))
-		if(ret != 0):
-			check(gp.gp_widget_get_child_by_label(parent._w,str(token),PTR(child._w)))
-		parent = child
-	child.set_value(value)
-	check(gp.gp_camera_set_config(camera,main._w,gpcontext))
-
-def shoot(gpcontext, location, aperture, shutterspeed, camera,  timestmp, counter):
-	microcounter = 1
+def shoot(gpcontext, location, aperture, shutterspeed, camera, config, timestmp, counter, download = True, preview = False):
+	# returns once the last exposure is over, Shot.collect() waits for its file
+	shot = Shot(gpcontext,location,camera,config,timestmp,counter,download,preview)
 	for speed in shutterspeed:
-		captureImage(gpcontext,location,aperture,speed,camera,timestmp,counter,microcounter)
-		microcounter = microcounter + 1
+		# the next exposure needs other settings, the last one has to be stored first
+		shot.collect()
+		captureImage(location,aperture,speed,config,shot,preview)
+	return shot
 	
-def captureImage(gpcontext, location, aperture, shutterspeed, camera, timestmp, counter, microcounter):
-	if(location == "memorycard"):
-		setConfig(camera,gpcontext,"capturetarget",GP_STORAGE_LOCATION_CARD)
-	else:
-		setConfig(camera,gpcontext,"capturetarget",GP_STORAGE_LOCATION_MEMORY)
-	setConfig(camera,gpcontext,'capturesettings/aperture',aperture)
-	setConfig(camera,gpcontext,'capturesettings/shutterspeed',shutterspeed)
-	cam_path = CameraFilePath()  
-	gp.gp_camera_capture(camera,GP_CAPTURE_IMAGE,ctypes.pointer(cam_path),gpcontext)
+def captureImage(location, aperture, shutterspeed, config, shot, preview = False):
+	armCapture(config,location,aperture,shutterspeed,preview)
+	shot.trigger()
+
+def storeExposures(session, downloader, exposures):
+	session.add(exposures)
+	if(downloader is not None):
+		# the rotation is idle time for the camera, previews or not
+		downloader.download(exposures)
+
+def armCapture(config, location, aperture, shutterspeed, preview = False):
+	config.pollEvents()
+	setCaptureTarget(config,location,preview)
+	config.set('capturesettings/aperture',aperture)
+	config.set('capturesettings/shutterspeed',shutterspeed)
+	config.flush()
+
+def collectExposure(gpcontext, location, camera, timestmp, counter, microcounter, folder, name, download = True, preview = False):
+	exposure = Exposure(counter,microcounter,folder,name)
+	exposure.card = location == "memorycard" or preview
 	if(location != "memorycard"):
-		cam_file = ctypes.c_void_p()  
-		fd = os.open("{0}/{1}-IMG-{2:03d}-{3:03d}.CR2".format(location,timestmp,counter,microcounter), os.O_CREAT | os.O_WRONLY)  
-		gp.gp_file_new_from_fd(ctypes.pointer(cam_file), fd)  
-		gp.gp_camera_file_get(camera,  
-				      cam_path.folder,  
-				      cam_path.name,  
-				      GP_FILE_TYPE_NORMAL,  
-				      cam_file,  
-				      gpcontext)  
-		gp.gp_camera_file_delete(camera,  
-				         cam_path.folder,  
-				         cam_path.name,  
-				         gpcontext)  
+		# the target name is fixed now so late downloads still land at the right position
+		exposure.filename = "{0}/{1}-IMG-{2:03d}-{3:03d}.CR2".format(location,timestmp,counter,microcounter)
+		if(preview):
+			exposure.preview = "{0}/{1}-PREVIEW-{2:03d}-{3:03d}.jpg".format(location,timestmp,counter,microcounter)
+			downloadPreview(gpcontext,camera,exposure)
+		if(download):
+			downloadImage(gpcontext,camera,exposure)
+	return exposure
+
+def programBracket(config, location, aperture, shutterspeed, aeb, drivemode, preview = False):
+	# written once, every position then only needs a trigger
+	setCaptureTarget(config,location,preview)
+	config.set('capturesettings/aperture',aperture)
+	config.set('capturesettings/shutterspeed',shutterspeed)
+	config.set('capturesettings/aeb',aeb)
+	if(drivemode is not None):
+		config.set('capturesettings/drivemode',drivemode)
+	config.flush()
+
+def setCaptureTarget(config, location, preview = False):
+	# images which are downloaded later have to survive on the card
+	if(location == "memorycard" or preview):
+		config.set("capturetarget",GP_STORAGE_LOCATION_CARD)
+	else:
+		config.set("capturetarget",GP_STORAGE_LOCATION_MEMORY)
+
+def shootBracket(gpcontext, location, camera, config, timestmp, counter, frames, download = True, preview = False):
+	config.pollEvents()
+	# the programmed settings survive unless the camera reported a change
+	config.flush()
+	with phases.measure("capture"):
+		if(config.contains(EOS_REMOTE_RELEASE)):
+			# canon bodies keep firing the bracket as long as the shutter is held
+			config.set(EOS_REMOTE_RELEASE,EOS_PRESS_FULL)
+			config.flush()
+			try:
+				paths = waitForFiles(gpcontext,camera,config,frames)
+			finally:
+				config.set(EOS_REMOTE_RELEASE,EOS_RELEASE_FULL)
+				config.flush()
+		else:
+			check(gp.gp_camera_trigger_capture(camera,gpcontext))
+			paths = waitForFiles(gpcontext,camera,config,frames)
+	exposures = []
+	microcounter = 1
+	for folder, name in paths:
+		exposures.append(collectExposure(gpcontext,location,camera,timestmp,counter,microcounter,folder,name,download,preview))
+		microcounter = microcounter + 1
+	return exposures
+
+def waitForFiles(gpcontext, camera, config, frames, exposed = False):
+	# with exposed the wait ends as soon as the camera reports the exposure as complete
+	paths = []
+	deadline = timer() + BRACKET_TIMEOUT
+	while(len(paths) < frames):
+		if(timer() > deadline):
+			raise libgphoto2error(GP_ERROR_TIMEOUT, "Only %d of %d bracketed images were reported by the camera" % (len(paths),frames))
+		eventType = ctypes.c_int()
+		data = ctypes.c_void_p()
+		check(gp.gp_camera_wait_for_event(camera,EVENT_WAIT_TIMEOUT,PTR(eventType),PTR(data),gpcontext))
+		if(eventType.value == GP_EVENT_FILE_ADDED):
+			path = ctypes.cast(data,ctypes.POINTER(CameraFilePath)).contents
+			paths.append((path.folder,path.name))
+		elif(eventType.value == GP_EVENT_UNKNOWN and data.value):
+			config.propertyChanged(ctypes.cast(data,ctypes.c_char_p).value)
+		if(data.value):
+			libc.free(data)
+		if(exposed and eventType.value == GP_EVENT_CAPTURE_COMPLETE):
+			break
+	return paths
+
+def downloadImage(gpcontext, camera, exposure):
+	# transfer and disk write alternate chunk by chunk, each is summed up on its own
+	transfer = 0.0
+	write = 0.0
+	with open(exposure.filename,"wb") as target:
+		chunks = readImage(gpcontext,camera,exposure.folder,exposure.name)
+		while(True):
+			start = timer()
+			chunk = next(chunks,None)
+			transfer = transfer + timer() - start
+			if(chunk is None):
+				break
+			start = timer()
+			target.write(chunk)
+			write = write + timer() - start
+		start = timer()
+		# the journal will call the image safe, it has to be on disk by then
+		target.flush()
+		os.fsync(target.fileno())
+		write = write + timer() - start
+	phases.record("file_get",transfer)
+	phases.record("disk_write",write)
+	exposure.downloaded = True
+	deleteImage(gpcontext,camera,exposure)
+
+def deleteImage(gpcontext, camera, exposure):
+	with phases.measure("delete"):
+		exposure.deleted = gp.gp_camera_file_delete(camera,  
+				         exposure.folder,  
+				         exposure.name,  
+				         gpcontext) >= GP_OK
+
+def downloadPreview(gpcontext, camera, exposure):
+	# the jpeg embedded in the raw, a small fraction of its size
+	with phases.measure("preview"), open(exposure.preview,"wb") as target:
+		for chunk in readImage(gpcontext,camera,exposure.folder,exposure.name,filetype = GP_FILE_TYPE_PREVIEW):
+			target.write(chunk)
+
+def readImage(gpcontext, camera, folder, name, chunksize = DEFAULT_CHUNK_SIZE, filetype = GP_FILE_TYPE_NORMAL):
+	'''
+	Yields the file in chunks of at most chunksize bytes, read with partial
+	object transfers so memory stays the same for any file size. Cameras or
+	libraries without partial reads get the whole file and hand it out in chunks.
+	'''
+	if(hasattr(gp,"gp_camera_file_read")):
+		buffer = ctypes.create_string_buffer(chunksize)
+		offset = 0
+		while(True):
+			size = ctypes.c_uint64(chunksize)
+			result = gp.gp_camera_file_read(camera,folder,name,filetype,offset,buffer,PTR(size),gpcontext)
+			if(result == GP_ERROR_NOT_SUPPORTED and offset == 0):
+				break
+			check(result)
+			if(size.value == 0):
+				return
+			yield buffer.raw[:size.value]
+			offset = offset + size.value
+			if(size.value < chunksize):
+				return
+	for chunk in readWholeImage(gpcontext,camera,folder,name,chunksize,filetype):
+		yield chunk
+
+def readWholeImage(gpcontext, camera, folder, name, chunksize, filetype):
+	cam_file = ctypes.c_void_p()
+	check(gp.gp_file_new(PTR(cam_file)))
+	try:
+		check(gp.gp_camera_file_get(camera,folder,name,filetype,cam_file,gpcontext))
+		data = ctypes.c_void_p()
+		size = ctypes.c_ulong()
+		check(gp.gp_file_get_data_and_size(cam_file,PTR(data),PTR(size)))
+		for offset in range(0,size.value,chunksize):
+			yield ctypes.string_at(data.value + offset,min(chunksize,size.value - offset))
+	finally:
 		gp.gp_file_unref(cam_file)
 
+def initializeRequest(motorPort, motorSteps, motorStepAngle, motorSpeed, motorAcceleration, axis = None):
+	return withAxis({"command":"initialize","port":motorPort,"total-steps":motorSteps,"step-angle":motorStepAngle,"max-speed":motorSpeed,"acceleration":motorAcceleration},axis)
+
+def powerRequest(status, axis = None):
+	return withAxis({"command":"power","toggle":status},axis)
+
+def rotateRequest(direction, degrees, axis = None):
+	return withAxis({"command":"rotate","direction":direction,"degrees":degrees},axis)
+
+def withAxis(request, axis):
+	# requests without an axis address yaw, like on firmware without a second motor
+	if(axis is not None and axis != framing.AXIS_YAW):
+		request[framing.JSON_ATTRIBUTE_AXIS] = axis
+	return request
+
+def programRequest(instructions, mode = None):
+	request = {"command":"program","instructions":instructions}
+	if(mode is not None):
+		request["mode"] = mode
+	return request
+
+def buildProgram(positions, home, yaw, pitch, settle, pulse, dwell):
+	# the timing is sent once, per position: move there, then F settles, releases the shutter and waits for the camera
+	instructions = ["T%d" % (int(settle * 1000)),"H%d" % (pulse),"W%d" % (dwell)]
+	for position in positions + [home]:
+		for code, axis, degrees in (("Y",yaw,position.yaw),("P",pitch,position.pitch)):
+			if(axis is not None):
+				steps = axis.moveSteps(degrees)
+				if(steps != 0):
+					instructions.append("%s%d" % (code,steps))
+		if(position is not home):
+			instructions.append("F1")
+	return "".join(instructions)
+
+def programChunks(instructions):
+	chunks = [""]
+	for instruction in PROGRAM_INSTRUCTION.findall(instructions):
+		if(len(chunks[-1]) + len(instruction) > PROGRAM_CHUNK_SIZE):
+			chunks.append("")
+		chunks[-1] = chunks[-1] + instruction
+	return chunks
+
+def runProgram(arduino, instructions, counters, sessionJournal):
+	if(len(instructions) > PROGRAM_SIZE):
+		raise ArduinoCommandExecutionException("The program needs %d bytes but the head only has %d, please plan fewer positions" % (len(instructions),PROGRAM_SIZE))
+	start = timer()
+	chunks = programChunks(instructions)
+	pending = [arduino.submit(programRequest(chunk,PROGRAM_MODE_APPEND)) for chunk in chunks[:-1]]
+	for request in pending:
+		complete(request)
+	request = arduino.submit(programRequest(chunks[-1]))
+	released = 0
+	# the head reports every instruction, the program is acknowledged once at its end
+	while(request.wait(PROGRESS_INTERVAL) is None):
+		released = printProgress(arduino,released,counters,sessionJournal)
+	printProgress(arduino,released,counters,sessionJournal)
+	complete(request)
+	return timer() - start
+
+def printProgress(arduino, released, counters, sessionJournal):
+	while(True):
+		try:
+			event = arduino.events.get_nowait()
+		except queue.Empty:
+			return released
+		if(event.get("code") == "F"):
+			# the image is on the memory card, nothing to download
+			sessionJournal.frame(counters[released],0)
+			released = released + 1
+			sys.stdout.write("Frame %d of %d released \n" % (released,len(counters)))
+
+def submitMove(arduino, yaw, pitch, position):
+	move = Move(arduino)
+	for axis, degrees in ((yaw,position.yaw),(pitch,position.pitch)):
+		if(axis is not None):
+			request, duration = axis.moveRequest(degrees)
+			if(request is not None):
+				move.add(arduino.submit(request),duration,axis)
+	if(len(move.pending) == 0):
+		return None
+	return move
+
+def readHeadPosition(arduino, yaw, pitch):
+	positions = headPositions(arduino.send({"command":"ping"}))
+	if(positions is not None):
+		for axis in (yaw,pitch):
+			if(axis is not None):
+				axis.reported = positions[axis.name]
+
+def headPositions(responseObject):
+	# motor steps the head counted since it initialized the axes
+	if(responseObject is None or "position" not in responseObject):
+		return None
+	return {framing.AXIS_YAW:int(responseObject["position"]),framing.AXIS_PITCH:int(responseObject.get("pitch-position",0))}
+
+def returnHead(arduino, yaw, pitch, home, sessionJournal):
+	# the camera failed, the head goes home unpowered and the journal knows where it is
+	try:
+		sessionJournal.moving()
+		move = submitMove(arduino,yaw,pitch,home)
+		if(move is not None):
+			move.confirm()
+		sessionJournal.head((yaw,pitch))
+		if(pitch is not None):
+			complete(arduino.submit(powerRequest(POWER_TOGGLE_OFF,framing.AXIS_PITCH)))
+		powerToggle(arduino,POWER_TOGGLE_OFF)
+	except ArduinoCommandExecutionException as e:
+		print("Error occured while returning the head: %s \n" % (e))
+
+def restoreHead(arduino, recovery, yaw, pitch, rehome, nextYaw):
+	'''
+	Puts the axes where the journal left the head. The head counts its
+	position only until it restarts, the ping answered on connect tells
+	whether it still agrees with the journal. Returns False if the head
+	has to be turned back to its home position and resumed with --rehome.
+	'''
+	if(rehome):
+		# yaw is unwrapped, home is the whole turn closest to the next position
+		yaw.position = int(round(planner.nearestTurn(0.0,nextYaw) / yaw.model.stepAngle))
+		sys.stdout.write("Counting from the home position the head has been turned back to" + DEFAULT_LF)
+		return True
+	if(recovery.moving):
+		sys.stdout.write("The head stopped in the middle of a move, please turn it back to its home position and resume with --rehome" + DEFAULT_LF)
+		return False
+	if(recovery.head is None):
+		# the head never moved
+		return True
+	axes = [axis for axis in (yaw,pitch) if axis is not None]
+	for axis in axes:
+		if(axis.name in recovery.head):
+			state = recovery.head[axis.name]
+			axis.position = state["position"]
+			axis.sign = state["sign"]
+			axis.reported = state["reported"]
+	reported = headPositions(arduino.ready)
+	if(reported is None):
+		sys.stdout.write("The head can not report its position, continuing from the journaled one" + DEFAULT_LF)
+	elif(len([axis for axis in axes if reported[axis.name] != axis.reported]) == 0):
+		sys.stdout.write("Head position verified" + DEFAULT_LF)
+	elif(len([axis for axis in axes if reported[axis.name] != 0]) == 0):
+		sys.stdout.write("The head restarted since, continuing from the journaled position" + DEFAULT_LF)
+	else:
+		for axis in axes:
+			sys.stdout.write("The head reports %s at %d steps but the journal at %d \n" % (axis.name,reported[axis.name],axis.reported))
+		sys.stdout.write("Please turn the head back to its home position and resume with --rehome" + DEFAULT_LF)
+		return False
+	return True
+
+def restoreExposures(gpcontext, camera, session, recovery, counters):
+	# images of finished positions which are still on the card are downloaded at the end
+	for counter in range(len(recovery.positions)):
+		if(counter in counters):
+			continue
+		for values in recovery.frameExposures(counter):
+			exposure = Exposure(values["counter"],values["microcounter"],values["folder"],values["name"])
+			for field in journal.EXPOSURE_FIELDS[4:]:
+				setattr(exposure,field,values[field])
+			if(exposure.downloaded and exposure.card and not exposure.deleted):
+				deleteImage(gpcontext,camera,exposure)
+				session.update(exposure)
+			session.restore(exposure)
+
 def initialize(arduino, motorPort, motorSteps, motorStepAngle, motorSpeed, motorAcceleration):
-	request = json.dumps({"command":"initialize","port":motorPort,"total-steps":motorSteps,"step-angle":motorStepAngle,"max-speed":motorSpeed,"acceleration":motorAcceleration})
-	send(arduino,request)
+	return send(arduino,initializeRequest(motorPort,motorSteps,motorStepAngle,motorSpeed,motorAcceleration))
 	
 def powerToggle(arduino, status):
-	send(arduino,json.dumps({"command":"power","toggle":status}))
+	return send(arduino,powerRequest(status))
 	
 def rotate(arduino, direction, degrees):
-	request = json.dumps({"command":"rotate","direction":direction,"degrees":degrees})
-	send(arduino,request)
+	return send(arduino,rotateRequest(direction,degrees))
 	
-def send(arduino, command):
-	response = arduino.send(command)
-	responseObject = json.loads(response)
+def send(arduino, request):
+	return complete(arduino.submit(request))
+
+def complete(request):
+	responseObject = request.wait()
 	if(responseObject[JSON_ATTRIBUTE_STATUS] == STATUS_ERROR_VALUE):
 		raise ArduinoCommandExecutionException(responseObject[JSON_ATTRIBUTE_ERROR])
 	else:
 		sys.stdout.write(responseObject[JSON_ATTRIBUTE_STATUS] + DEFAULT_LF)
+	return responseObject
+
+def enableBinaryFraming(arduino):
+	if(arduino.capabilities is not None and CAPABILITY_BINARY not in arduino.capabilities):
+		sys.stdout.write("The head does not support binary framing, continuing with JSON" + DEFAULT_LF)
+		return
+	responseObject = arduino.send({"command":framing.COMMAND_FRAMING,"mode":framing.FRAMING_BINARY})
+	if(responseObject.get(JSON_ATTRIBUTE_STATUS) == framing.STATUS_FRAMING_ENABLED):
+		sys.stdout.write(responseObject[JSON_ATTRIBUTE_STATUS] + DEFAULT_LF)
+	else:
+		sys.stdout.write("The head does not support binary framing, continuing with JSON" + DEFAULT_LF)
+
+def printConfigStatistics(config):
+	# one setConfig() used to cost a tree fetch plus a write for every setting
+	saved = 2 * config.requests - config.fetches - config.writes
+	sys.stdout.write("camera config settings: %d unchanged: %d tree fetches: %d writes: %d round trips saved: %d \n" % (config.requests,config.skipped,config.fetches,config.writes,saved))
+
+def printTravel(travel, route):
+	sys.stdout.write("head moves: %d predicted: %.1f sec. achieved: %.1f sec. \n" % (travel.moves,route.duration,travel.achieved))
+	if(len(travel.early) > 0):
+		sys.stdout.write("Warning: %d exposures fired before the head confirmed its move, up to %.0f ms early, consider a longer --settle \n" % (len(travel.early),max(travel.early) * 1000))
+
+def printLatencies(arduino):
+	if(len(arduino.latencies) == 0):
+		return
+	durations = sorted([latency for command, latency in arduino.latencies])
+	total = sum(durations)
+	sys.stdout.write("serial round trips: %d avg: %.1f ms min: %.1f ms max: %.1f ms \n" % (len(durations),total * 1000 / len(durations),durations[0] * 1000,durations[-1] * 1000))
 
 #
 # Arduino communciations class
-# This class will run in it's own thread in order to send and receive data.
+# This class will run in it's own thread in order to receive data.
+# The thread blocks in readline and completes the outstanding request the
+# received line belongs to. Every request carries an id which the firmware
+# echoes, responses without id are matched to the oldest outstanding request.
+# Once binary framing has been negotiated frames are read instead of lines.
 #
 class Arduino(threading.Thread):
-	def __init__(self, device, baudrate, timeout):
+	def __init__(self, device, baudrate, timeout, window = DEFAULT_WINDOW):
 		threading.Thread.__init__(self)
+		self.daemon = True
 		self.device = device
 		self.baudrate = baudrate
 		self.timeout = timeout
 		self.port = None
-		self.hasReceivedResponse = False
 		self.stopProcessing = False
-		self.response = bytearray();
+		self.lock = threading.Lock()
+		self.window = threading.Semaphore(window)
+		self.pending = collections.OrderedDict()
+		self.sequence = 0
+		self.binary = False
+		self.latencies = []
+		self.capabilities = None
+		# answer to the ping on connect, it carries the position of the head
+		self.ready = None
+		# progress events of a running program, they answer no request
+		self.events = queue.Queue()
 	
 	def run(self):
 		while (self.stopProcessing != True):
-			if(self.hasReceivedResponse == False):
-				self.response = self.port.readline()
-				if(len(self.response) > 0):
-					self.hasReceivedResponse = True
+			try:
+				if(self.binary):
+					self.receiveFrame()
+				else:
+					self.receiveLine()
+			except (serial.serialutil.SerialException, TypeError, ValueError):
+				# raised when the port is closed underneath the blocking read
+				break
+	
+	def receiveLine(self):
+		line = self.port.readline()
+		if(len(line) == 0):
+			return
+		try:
+			responseObject = json.loads(line.decode(DEFAULT_ENCODING))
+		except ValueError:
+			# not a response, e.g. boot noise
+			return
+		if(isinstance(responseObject,dict)):
+			self.dispatch(responseObject)
+	
+	def receiveFrame(self):
+		frame = framing.readFrame(self.port.read)
+		if(frame is None):
+			return
+		try:
+			responseObject = framing.decodeReply(frame)
+		except framing.FramingException as e:
+			print("Dropped corrupt frame: %s \n" % (e))
+			return
+		self.dispatch(responseObject)
+	
+	def dispatch(self, responseObject):
+		if(JSON_ATTRIBUTE_EVENT in responseObject):
+			self.events.put(responseObject)
+			return
+		identifier = responseObject.get(JSON_ATTRIBUTE_ID)
+		with self.lock:
+			if(identifier in self.pending):
+				request = self.pending.pop(identifier)
+			elif(identifier is None and len(self.pending) > 0):
+				request = self.pending.popitem(last=False)[1]
+			else:
+				# nobody is waiting for this response
+				return
+		if(request.command == framing.COMMAND_FRAMING and responseObject.get(JSON_ATTRIBUTE_STATUS) == framing.STATUS_FRAMING_ENABLED):
+			# switch before the next read, the head answers in frames from now on
+			self.binary = True
+		request.complete(responseObject)
+		self.latencies.append((request.command,request.latency))
+		phases.record("serial_round_trip",request.latency)
+		self.window.release()
 	
 	def connect(self):
 		try:
@@ -197,20 +851,101 @@ class Arduino(threading.Thread):
 		except serial.serialutil.SerialException:
 			print("The communication port is already in use\n")
 		self.start()
-		time.sleep(1)
+		self.waitUntilReady(DEFAULT_READY_TIMEOUT)
+	
+	def waitUntilReady(self, deadline):
+		# the boot banner or the answer to any ping proves the head is listening,
+		# pings sent while the board still resets are lost and simply repeated
+		start = timer()
+		while(timer() - start < deadline):
+			request = self.submit({"command":"ping"})
+			responseObject = request.wait(PING_INTERVAL)
+			if(responseObject is None):
+				self.cancel(request)
+				continue
+			if(responseObject.get(JSON_ATTRIBUTE_STATUS) == STATUS_READY_VALUE):
+				self.ready = responseObject
+				self.capabilities = responseObject.get("capabilities","").split(",")
+				sys.stdout.write("Head ready after %.2f sec. firmware: %s baudrate: %s capabilities: %s \n" % (timer() - start,responseObject.get("firmware"),responseObject.get("baudrate"),responseObject.get("capabilities")))
+				if(str(responseObject.get("baudrate")) != str(self.baudrate)):
+					sys.stdout.write("Warning: the head reports baudrate %s but %s is configured \n" % (responseObject.get("baudrate"),self.baudrate))
+			else:
+				# firmware without ping support, it is alive but can not tell us more
+				sys.stdout.write("Head ready after %.2f sec. firmware does not support ping \n" % (timer() - start))
+			return responseObject
+		raise ArduinoCommandExecutionException("The head did not answer within %s seconds" % (deadline))
+	
+	def cancel(self, request):
+		with self.lock:
+			if(self.pending.pop(request.identifier,None) is None):
+				return
+		self.window.release()
 	
 	def disconnect(self):
 		self.stopProcessing = True
+		if(hasattr(self.port,"cancel_read")):
+			self.port.cancel_read()
+		if(self.is_alive()):
+			self.join(self.timeout)
 		self.port.close()
 	
-	def send(self, command):
-		self.hasReceivedResponse = False
-		self.port.write(command.encode(DEFAULT_ENCODING) + DEFAULT_LF.encode(DEFAULT_ENCODING))
-		self.port.flush()
-		while (self.hasReceivedResponse == False):
-			time.sleep(0.001)
-		return self.response.decode(DEFAULT_ENCODING)
+	def submit(self, request):
+		# blocks while the head already has a full window of commands queued
+		self.window.acquire()
+		with self.lock:
+			# ids wrap within one byte so they fit binary frames as well
+			self.sequence = (self.sequence % 255) + 1
+			identifier = str(self.sequence)
+			request = dict(request)
+			request[JSON_ATTRIBUTE_ID] = identifier
+			try:
+				if(self.binary):
+					data = framing.encodeCommand(request)
+				else:
+					data = json.dumps(request).encode(DEFAULT_ENCODING) + DEFAULT_LF.encode(DEFAULT_ENCODING)
+			except framing.FramingException as e:
+				# nothing was sent, the slot is free for the next command
+				self.window.release()
+				raise ArduinoCommandExecutionException("The command can not be sent: %s" % (e))
+			pending = ArduinoRequest(self,identifier,request[JSON_ATTRIBUTE_COMMAND])
+			self.pending[identifier] = pending
+			pending.size = len(data)
+			self.port.write(data)
+			self.port.flush()
+		return pending
+	
+	def send(self, request):
+		return self.submit(request).wait()
 
+#
+# A command which has been written to the head and awaits its response.
+#
+class ArduinoRequest(object):
+	def __init__(self, arduino, identifier, command):
+		self.arduino = arduino
+		self.identifier = identifier
+		self.command = command
+		self.start = timer()
+		self.latency = None
+		self.response = None
+		self.size = 0
+		self.received = threading.Event()
+	
+	def complete(self, responseObject):
+		self.latency = timer() - self.start
+		self.response = responseObject
+		self.received.set()
+	
+	def wait(self, timeout = None):
+		# wake up once per timeout only to notice a dead reader thread,
+		# returns None if no response arrived within the optional timeout
+		start = timer()
+		while(not self.received.wait(self.arduino.timeout if timeout is None else timeout)):
+			if(not self.arduino.is_alive()):
+				raise ArduinoCommandExecutionException("The communication port has been closed")
+			if(timeout is not None and timer() - start >= timeout):
+				return None
+		return self.response
 
 #
 # Arduino communications Exception
@@ -221,12 +956,392 @@ class ArduinoCommandExecutionException(Exception):
 	def __str__(self):
 		return repr(self.value)
 
+#
+# Position of one motor axis in steps, counted from where it was initialized.
+# Targets are absolute angles so rounding to whole steps never accumulates,
+# yaw targets are unwrapped, a move turns in the direction of its sign.
+#
+class Axis(object):
+	def __init__(self, name, model, direction):
+		self.name = name
+		self.model = model
+		self.direction = direction
+		self.position = 0
+		self.sign = 0
+		# position in motor steps as last reported by the head, backlash included
+		self.reported = 0
+	
+	def angle(self):
+		return self.position * self.model.stepAngle
+	
+	def reverse(self):
+		if(self.direction == "clockwise"):
+			return "counterclockwise"
+		return "clockwise"
+	
+	def moveSteps(self, degrees):
+		# signed motor steps to the target, backlash included
+		target = int(round(degrees / self.model.stepAngle))
+		steps = target - self.position
+		if(steps == 0):
+			return 0
+		self.position = target
+		sign = 1 if steps > 0 else -1
+		motorSteps = abs(steps)
+		if(self.sign != 0 and sign != self.sign):
+			# the play is taken up first, the camera does not move for these steps
+			motorSteps = motorSteps + self.model.backlashSteps()
+		self.sign = sign
+		return sign * motorSteps
+	
+	def moveRequest(self, degrees):
+		# returns the rotation together with the seconds the model predicts for it
+		steps = self.moveSteps(degrees)
+		if(steps == 0):
+			return None, 0.0
+		direction = self.direction if steps > 0 else self.reverse()
+		# half a step on top survives the rounding down to whole steps in the firmware
+		return rotateRequest(direction,"%.4f" % ((abs(steps) + 0.5) * self.model.stepAngle),self.name), self.model.stepsDuration(abs(steps))
+
+#
+# Rotations submitted together, the head executes them one after the other.
+# The motion model predicts when the last one ends, the acks only confirm it.
+#
+class Move(object):
+	def __init__(self, arduino):
+		self.arduino = arduino
+		self.pending = []
+		self.axes = []
+		self.start = timer()
+		self.duration = 0.0
+	
+	def add(self, request, duration, axis = None):
+		self.pending.append(request)
+		self.axes.append(axis)
+		# every command has to cross the wire before the head starts it
+		self.duration = self.duration + duration + float(request.size) * WIRE_BITS_PER_BYTE / int(self.arduino.baudrate)
+	
+	def waitUntilSettled(self, settle):
+		remaining = self.start + self.duration + settle - timer()
+		if(remaining > 0):
+			time.sleep(remaining)
+	
+	def confirm(self):
+		for request, axis in zip(self.pending,self.axes):
+			responseObject = complete(request)
+			if(axis is not None and "position" in responseObject):
+				axis.reported = int(responseObject["position"])
+		return self.finished() - self.start
+	
+	def finished(self):
+		# the head finished when its ack started to cross the wire, the wire model
+		# may overestimate that (other framing, slower link), never before the request
+		return max([request.start + max(0.0,request.latency - self.wireTime(request.response)) for request in self.pending])
+	
+	def wireTime(self, responseObject):
+		if(self.arduino.binary):
+			size = len(framing.encodeReply(responseObject))
+		else:
+			size = len(json.dumps(responseObject)) + 2
+		return float(size) * WIRE_BITS_PER_BYTE / int(self.arduino.baudrate)
+	
+	def early(self, fired):
+		# seconds the camera fired before the head reported the move done
+		return max(0.0,self.finished() - fired)
+
+#
+# Time the head spent on its moves, measured from submitting the rotations
+# until the last one was acknowledged.
+#
+class Travel(object):
+	def __init__(self):
+		self.moves = 0
+		self.achieved = 0.0
+		self.early = []
+	
+	def add(self, duration, early = 0.0):
+		if(duration is not None):
+			self.moves = self.moves + 1
+			self.achieved = self.achieved + duration
+			phases.record("rotate",duration)
+		if(early > EARLY_TOLERANCE):
+			self.early.append(early)
+
+#
+# The exposures of one position. They are triggered and the capture returns
+# once the exposure is over, the camera reports each file only after it is
+# stored. collect() waits for the files still missing, the loop calls it
+# after the head started the next move.
+#
+class Shot(object):
+	def __init__(self, gpcontext, location, camera, config, timestmp, counter, download, preview):
+		self.gpcontext = gpcontext
+		self.location = location
+		self.camera = camera
+		self.config = config
+		self.timestmp = timestmp
+		self.counter = counter
+		self.download = download
+		self.preview = preview
+		self.triggered = 0
+		self.paths = []
+		self.exposures = []
+	
+	def trigger(self):
+		with phases.measure("capture"):
+			check(gp.gp_camera_trigger_capture(self.camera,self.gpcontext))
+			self.triggered = self.triggered + 1
+			self.paths.extend(waitForFiles(self.gpcontext,self.camera,self.config,1,True))
+	
+	def collect(self):
+		missing = self.triggered - len(self.exposures) - len(self.paths)
+		if(missing > 0):
+			with phases.measure("store"):
+				self.paths.extend(waitForFiles(self.gpcontext,self.camera,self.config,missing))
+		for folder, name in self.paths:
+			self.exposures.append(collectExposure(self.gpcontext,self.location,self.camera,self.timestmp,self.counter,len(self.exposures) + 1,folder,name,self.download,self.preview))
+		self.paths = []
+		return self.exposures
+
+#
+# A single exposure, where it lives on the camera and where it goes on disk.
+#
+class Exposure(object):
+	def __init__(self, counter, microcounter, folder, name):
+		self.counter = counter
+		self.microcounter = microcounter
+		self.folder = folder
+		self.name = name
+		self.filename = None
+		self.preview = None
+		# True if the image was stored on the memory card, not in the camera RAM
+		self.card = True
+		self.downloaded = False
+		self.deleted = False
+
+#
+# All exposures of a session, images which are not downloaded yet are
+# fetched from the card at the end so none of them is left behind.
+# Every change is recorded in the journal.
+#
+class Session(object):
+	def __init__(self, journal = None):
+		self.exposures = []
+		self.journal = journal
+	
+	def add(self, exposures):
+		self.exposures.extend(exposures)
+		if(self.journal is not None and len(exposures) > 0):
+			for exposure in exposures:
+				self.journal.exposure(exposure)
+			self.journal.frame(exposures[0].counter,len(exposures))
+	
+	def restore(self, exposure):
+		# taken over from the journal of an interrupted session
+		self.exposures.append(exposure)
+	
+	def update(self, exposure):
+		if(self.journal is not None):
+			self.journal.exposure(exposure)
+	
+	def pending(self):
+		return [exposure for exposure in self.exposures if exposure.filename is not None and not exposure.downloaded]
+	
+	def printSummary(self):
+		previews = len([exposure for exposure in self.exposures if exposure.preview is not None])
+		downloaded = len([exposure for exposure in self.exposures if exposure.downloaded])
+		sys.stdout.write("%d exposures, %d previews, %d images downloaded \n" % (len(self.exposures),previews,downloaded))
+
+#
+# Downloads exposures in the background while the head rotates.
+# The caller has to wait() for the downloads before it uses the camera again,
+# libgphoto2 does not allow two operations on one camera at the same time.
+#
+class Downloader(threading.Thread):
+	def __init__(self, gpcontext, camera, session):
+		threading.Thread.__init__(self)
+		self.daemon = True
+		self.gpcontext = gpcontext
+		self.camera = camera
+		self.session = session
+		self.exposures = queue.Queue()
+		self.error = None
+	
+	def run(self):
+		while(True):
+			exposure = self.exposures.get()
+			try:
+				if(exposure is None):
+					return
+				if(self.error is None):
+					downloadImage(self.gpcontext,self.camera,exposure)
+					self.session.update(exposure)
+			except Exception as e:
+				self.error = e
+			finally:
+				self.exposures.task_done()
+	
+	def download(self, exposures):
+		for exposure in exposures:
+			self.exposures.put(exposure)
+	
+	def wait(self):
+		self.exposures.join()
+		if(self.error is not None):
+			error = self.error
+			self.error = None
+			raise error
+	
+	def stop(self):
+		self.exposures.put(None)
+		self.join()
+
 #
 # gphoto2 classes and structs
 #
 class CameraFilePath(ctypes.Structure):
 	_fields_=[('name', (ctypes.c_char * 128)),('folder', (ctypes.c_char * 1024))]
 
+#
+# Camera configuration tree, fetched once and kept for the whole session.
+# set() only changes the cached widgets, flush() sends all pending changes
+# with a single gp_camera_set_config. A property change reported by the
+# camera only forgets the value applied to that setting, the tree is kept.
+# Values equal to the last one applied are not sent again.
+# Widgets are looked up in an index built by one traversal when the tree
+# is loaded, keyed by name path, label path, name and label.
+#
+class CameraConfig(object):
+	def __init__(self, camera, gpcontext):
+		self.camera = camera
+		self.gpcontext = gpcontext
+		self.main = None
+		self.index = {}
+		self.dirty = False
+		self.applied = {}
+		self.staged = {}
+		# settings of the last write, the camera echoes them as property changes
+		# until the next drain of the event queue
+		self.echoes = set()
+		self.fetches = 0
+		self.writes = 0
+		self.requests = 0
+		self.skipped = 0
+	
+	def load(self):
+		if(self.main is None):
+			self.main = Widget()
+			with phases.measure("config_fetch"):
+				check(gp.gp_camera_get_config(self.camera,PTR(self.main._w),self.gpcontext))
+			self.fetches = self.fetches + 1
+			self.index = {}
+			self.indexChildren(self.main,None,None)
+		return self.main
+	
+	def indexChildren(self, widget, namePath, labelPath):
+		for number in range(gp.gp_widget_count_children(widget._w)):
+			child = Widget()
+			check(gp.gp_widget_get_child(widget._w,number,PTR(child._w)))
+			name = widgetText(gp.gp_widget_get_name,child)
+			label = widgetText(gp.gp_widget_get_label,child)
+			childNamePath = name if namePath is None else namePath + '/' + name
+			childLabelPath = label if labelPath is None else labelPath + '/' + label
+			self.index[childNamePath] = child
+			self.index.setdefault(childLabelPath,child)
+			# depth first like gp_widget_get_child_by_name, the first match wins
+			self.index.setdefault(name,child)
+			self.index.setdefault(label,child)
+			self.indexChildren(child,childNamePath,childLabelPath)
+	
+	def widget(self, name):
+		parent = self.load()
+		if(name in self.index):
+			return self.index[name]
+		# mixed name and label paths are not indexed, walk them
+		child = None
+		for token in name.split('/'):
+			child = Widget()
+			ret = gp.gp_widget_get_child_by_name(parent._w,str(token),PTR(child._w))
+			if(ret != 0):
+				check(gp.gp_widget_get_child_by_label(parent._w,str(token),PTR(child._w)))
+			parent = child
+		return child
+	
+	def contains(self, name):
+		self.load()
+		return name in self.index
+	
+	def set(self, name, value):
+		self.requests = self.requests + 1
+		if(self.staged.get(name,self.applied.get(name)) == str(value)):
+			self.skipped = self.skipped + 1
+			return
+		widget = self.widget(name)
+		widget.set_value(value)
+		# the cached widget may still hold this value while the camera was changed
+		# on the body, libgphoto2 only writes widgets which are marked changed
+		widget.set_changed()
+		self.staged[name] = str(value)
+		self.dirty = True
+	
+	def flush(self):
+		if(self.dirty):
+			with phases.measure("config_write"):
+				check(gp.gp_camera_set_config(self.camera,self.main._w,self.gpcontext))
+			self.writes = self.writes + 1
+			self.echoes = set(self.staged)
+			self.applied.update(self.staged)
+			self.staged = {}
+			self.dirty = False
+	
+	def invalidate(self):
+		if(self.main is not None):
+			gp.gp_widget_free(self.main._w)
+		self.main = None
+		self.index = {}
+		self.dirty = False
+		self.applied = {}
+		self.staged = {}
+		self.echoes = set()
+	
+	def propertyChanged(self, text):
+		# only a setting we write and did not just write ourselves has to be written again
+		match = PROPERTY_CHANGED.search(text)
+		if(match is None):
+			return
+		name = PROPERTY_WIDGETS.get(int(match.group(1),16))
+		if(name is None):
+			return
+		if(name in self.echoes):
+			self.echoes.discard(name)
+			return
+		# changed on the camera, the cached tree is still good for all other settings
+		self.applied.pop(name,None)
+	
+	def pollEvents(self):
+		# drain the pending camera events without waiting
+		while(True):
+			eventType = ctypes.c_int()
+			data = ctypes.c_void_p()
+			check(gp.gp_camera_wait_for_event(self.camera,0,PTR(eventType),PTR(data),self.gpcontext))
+			if(eventType.value == GP_EVENT_TIMEOUT):
+				# the echoes of the last write had a whole position to arrive, a body
+				# which does not echo must not have its next real change ignored
+				self.echoes = set()
+				return
+			if(eventType.value == GP_EVENT_UNKNOWN and data.value):
+				self.propertyChanged(ctypes.cast(data,ctypes.c_char_p).value)
+			if(data.value):
+				libc.free(data)
+
+def widgetText(getter, widget):
+	text = ctypes.c_char_p()
+	check(getter(widget._w,PTR(text)))
+	value = text.value or b""
+	if(not isinstance(value,str)):
+		value = value.decode(DEFAULT_ENCODING)
+	return value
+
 class Widget(object):
     	def __init__(self):
 		self._w = ctypes.c_void_p()
@@ -234,6 +1349,9 @@ class Widget(object):
     	def set_value(self,value):
 		check(gp.gp_widget_set_value(self._w,str(value)))
 
+    	def set_changed(self):
+		check(gp.gp_widget_set_changed(self._w,1))
+
 class libgphoto2error(Exception):
    	def __init__(self, result, message):
         	self.result = result
@@ -242,7 +1360,7 @@ class libgphoto2error(Exception):
         	return self.message + ' (' + str(self.result) + ')'
 
 #----------------------------------------------------------------------
-def setupArgumentParser():
+def setupArgumentParser(argv = None):
 	parser = argparse.ArgumentParser(description="Arduino Parallax Motor Controller Script")
 	
 	# ---- communication arguments ----
@@ -255,7 +1373,40 @@ def setupArgumentParser():
 	communication.add_argument("--baudrate",required=False,
 		default="9600",
 		help="RX/TX Baudrate")
+	
+	communication.add_argument("--framing",required=False,
+		default="json",
+		choices=["json",framing.FRAMING_BINARY],
+		help="Wire format for head commands, binary falls back to JSON if the head does not support it")
 		
+	# ---- journal arguments ----
+	
+	recovery = parser.add_argument_group("journal arguments")
+	
+	recovery.add_argument("--journal",required=False,
+		default="parallax.journal",
+		help="File the session is recorded in, a crashed session can be continued from it")
+	
+	recovery.add_argument("--resume",required=False,
+		action = "store_true",
+		help="Continue the unfinished session of the journal with the first position which is not safely shot")
+	
+	recovery.add_argument("--rehome",required=False,
+		action = "store_true",
+		help="With --resume, the head has been turned back to its home position by hand, count from there instead of the journaled position")
+	
+	# ---- metrics arguments ----
+	
+	timing = parser.add_argument_group("metrics arguments")
+	
+	timing.add_argument("--metrics",required=False,
+		default=None,
+		help="JSON file the durations of every phase are reported to at the end of the session, with percentiles and histograms")
+	
+	timing.add_argument("--livemetrics",required=False,
+		default=None,
+		help="Text file in the Prometheus format which is kept up to date during the session, e.g. for the node_exporter textfile collector")
+	
 	# ---- rotation arguments ----
 	
 	rotation = parser.add_argument_group("rotation arguments")
@@ -263,8 +1414,60 @@ def setupArgumentParser():
 	rotation.add_argument("--direction",required=True,
 		help = "Rotation direction, clockwise or counterclockwise")
 	
-	rotation.add_argument("--degrees",required=True,
-		help = "Degrees per rotation step")
+	rotation.add_argument("--backlash",required=False,
+		type=float,default=0.0,
+		help = "Play of the gears in degrees, taken up whenever an axis reverses")
+	
+	rotation.add_argument("--predict",required=False,
+		action = "store_true",
+		help = "Fire the camera when the motion model says the head has settled instead of waiting for its ack")
+	
+	rotation.add_argument("--settle",required=False,
+		type=float,default=0.2,
+		help = "Seconds the head needs to stop vibrating after a move, used with --predict")
+	
+	rotation.add_argument("--jerk",required=False,
+		type=float,default=None,
+		help = "Jerk in steps/s^3 for heads with S-curve motion, the trapezoid of AccelStepper is modeled without it")
+	
+	rotation.add_argument("--program",required=False,
+		action = "store_true",
+		help = "Upload the whole panorama to the head at once, the head releases the shutter through its cable release")
+	
+	rotation.add_argument("--pulse",required=False,
+		type=int,default=100,
+		help = "Milliseconds the cable release is held with --program")
+	
+	rotation.add_argument("--dwell",required=False,
+		type=int,default=1000,
+		help = "Milliseconds the head waits after a release with --program, has to cover the exposure and storing the image")
+	
+	rotation.add_argument("--degrees",required=False,
+		help = "Degrees per rotation step, single row at the horizon")
+	
+	# ---- planner arguments ----
+	
+	plan = parser.add_argument_group("planner arguments")
+	
+	plan.add_argument("--hfov",required=False,
+		type=float,default=None,
+		help = "Horizontal field of view of the lens in degrees, plans multiple rows instead of --degrees")
+	
+	plan.add_argument("--vfov",required=False,
+		type=float,default=None,
+		help = "Vertical field of view of the lens in degrees, defaults to --hfov")
+	
+	plan.add_argument("--imageoverlap",required=False,
+		type=float,default=0.25,
+		help = "Fraction of the field of view neighbouring images overlap")
+	
+	plan.add_argument("--minpitch",required=False,
+		type=float,default=-planner.POLE,
+		help = "Lowest pitch to cover in degrees, -90 includes the nadir")
+	
+	plan.add_argument("--maxpitch",required=False,
+		type=float,default=planner.POLE,
+		help = "Highest pitch to cover in degrees, 90 includes the zenith")
 	
 	# ---- image arguments ----
 	
@@ -274,12 +1477,32 @@ def setupArgumentParser():
 		default="memorycard",
 		help = "the location where to store all downladed files")
 
+	image.add_argument("--overlap",required=False,
+		action = "store_true",
+		help = "download and delete the images of a position while the head already rotates to the next one")
+
+	image.add_argument("--preview",required=False,
+		action = "store_true",
+		help = "download the embedded jpeg of every image right away and the raw files only at the end of the session, or while rotating with --overlap")
+
 	image.add_argument("--aperture",required=True,
 		help = "the aperture to be used for all exposures")
 	
 	image.add_argument("--shutterspeed",required=True,
 		action = "append",
-		help = "List of shutterspeeds to execute in the given order")
+		help = "List of shutterspeeds to execute in the given order, with --aeb only the first one is used as the center exposure")
+	
+	image.add_argument("--aeb",required=False,
+		default=None,
+		help = "let the camera bracket itself with this auto exposure bracketing value, e.g. \"+/- 1\", one trigger per position")
+	
+	image.add_argument("--aebframes",required=False,
+		type=int,default=3,
+		help = "the amount of images the camera takes for one bracket")
+	
+	image.add_argument("--drivemode",required=False,
+		default=None,
+		help = "drive mode to set together with --aeb, e.g. \"Continuous\" for bodies which need it to fire the whole bracket")
 	
 	# ---- motor arguments ----
 	
@@ -305,7 +1528,35 @@ def setupArgumentParser():
 		default="20",
 		help = "Rotation acceleration")
 	
-	return parser.parse_args()
+	# ---- pitch motor arguments ----
+	
+	pitchMotor = parser.add_argument_group("pitch motor arguments")
+	
+	pitchMotor.add_argument("--pitchport",required=False,
+		default="2",
+		help = "The output port of the pitch motor on the Arduino Motor Shield.")
+	
+	pitchMotor.add_argument("--pitchsteps",required=False,
+		default="200",
+		help = "The total amount of steps for one full 360 deg. rotation of the pitch motor")
+	
+	pitchMotor.add_argument("--pitchstepangle",required=False,
+		default="0.1125",
+		help = "The degrees for one Step of the pitch motor.")
+	
+	pitchMotor.add_argument("--pitchmaxspeed",required=False,
+		default="300",
+		help = "Maximum speed for the pitch motor")
+	
+	pitchMotor.add_argument("--pitchacceleration",required=False,
+		default="20",
+		help = "Pitch rotation acceleration")
+	
+	pitchMotor.add_argument("--pitchdirection",required=False,
+		default="counterclockwise",
+		help = "Rotation direction of the pitch motor which tilts the camera up")
+	
+	return parser.parse_args(argv)
 
 #----------------------------------------------------------------------
 if __name__ == "__main__":
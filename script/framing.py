@@ -0,0 +1,273 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Compact binary framing for the head protocol.
+#
+# Every frame looks like:
+#
+#   SYNC | opcode | id | length | payload (length bytes) | crc16
+#
+# The crc is CRC-16/CCITT (0x1021, initial 0xFFFF) over opcode, id, length
+# and payload, transmitted big endian like all other multi byte fields.
+#
+# Commands and replies are decoded into the same dictionaries the JSON
+# protocol uses, all values as strings, so the code above the transport
+# does not need to know which framing is active.
+#
+# A rotate command is 9 bytes on the wire instead of about 70 as JSON.
+#
+
+import struct
+
+SYNC = 0xA5
+HEADER_LENGTH = 4
+CRC_LENGTH = 2
+
+OPCODE_INITIALIZE = 0x10
+OPCODE_ROTATE     = 0x20
+OPCODE_POWER      = 0x30
+OPCODE_RESET      = 0x40
+
+# set in the command opcode for the pitch axis, commands without it address yaw
+OPCODE_AXIS_PITCH = 0x01
+
+OPCODE_REPLY_STATUS   = 0x81
+OPCODE_REPLY_ROTATION = 0x82
+OPCODE_REPLY_ERROR    = 0x8F
+
+# sent as JSON to switch both sides over to binary frames
+COMMAND_FRAMING = "framing"
+FRAMING_BINARY = "binary"
+STATUS_FRAMING_ENABLED = "Binary framing enabled"
+
+COMMAND_OPCODES = {
+	"initialize" : OPCODE_INITIALIZE,
+	"rotate"     : OPCODE_ROTATE,
+	"power"      : OPCODE_POWER,
+	"reset"      : OPCODE_RESET,
+}
+
+# port, total-steps, step-angle (1/10000 deg), max-speed, acceleration
+INITIALIZE_FORMAT = ">BHIHH"
+# direction, degrees (1/100 deg)
+ROTATE_FORMAT = ">BH"
+# toggle
+POWER_FORMAT = ">B"
+# status
+STATUS_FORMAT = ">B"
+# status, degrees (1/100 deg), steps, position
+ROTATION_FORMAT = ">BHHi"
+# error
+ERROR_FORMAT = ">B"
+
+STEP_ANGLE_SCALE = 10000
+DEGREES_SCALE = 100
+
+DIRECTIONS = ["clockwise","counterclockwise"]
+TOGGLES = ["off","on"]
+
+# same texts as the firmware sends in its JSON responses
+STATUSES = [
+	"Error",
+	"Motor initialization finished",
+	"Rotation finished",
+	"Power is on",
+	"Power is off",
+	"Position is reset to current position",
+]
+
+ERRORS = [
+	"Unknown error",
+	"The motor has not been initialized yet, please do so now!",
+	"Please specify a valid motor port value",
+	"Please specify the total steps for the motor",
+	"Please specify a valid step angle for the motor",
+	"Please specify a maximum speed value for the motor",
+	"Please specify a acceleration value for the motor",
+	"The rotation direction was not understood",
+	"The rotation degree value has to be greater 0",
+	"Unable to rotate motor due to the power beeing of, please switch the power on first!",
+	"The power toggle value was not understood",
+	"The request could not be parsed",
+	"The axis was not understood",
+]
+
+JSON_ATTRIBUTE_STATUS = "status"
+JSON_ATTRIBUTE_ERROR = "error"
+JSON_ATTRIBUTE_ID = "id"
+JSON_ATTRIBUTE_COMMAND = "command"
+JSON_ATTRIBUTE_AXIS = "axis"
+
+AXIS_YAW = "yaw"
+AXIS_PITCH = "pitch"
+
+#
+# Binary framing Exception, raised for frames which can not be encoded or decoded
+#
+class FramingException(Exception):
+	def __init__(self, value):
+		self.value = value
+	def __str__(self):
+		return repr(self.value)
+
+def crc16(data):
+	crc = 0xFFFF
+	for byte in bytearray(data):
+		crc = crc ^ (byte << 8)
+		for bit in range(8):
+			if(crc & 0x8000):
+				crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+			else:
+				crc = (crc << 1) & 0xFFFF
+	return crc
+
+def encodeFrame(opcode, identifier, payload):
+	body = bytearray([opcode,identifier & 0xFF,len(payload)]) + bytearray(payload)
+	return bytes(bytearray([SYNC]) + body + bytearray(struct.pack(">H",crc16(body))))
+
+def decodeFrame(frame):
+	frame = bytearray(frame)
+	if(len(frame) < HEADER_LENGTH + CRC_LENGTH or frame[0] != SYNC):
+		raise FramingException("The frame is incomplete")
+	body = frame[1:-CRC_LENGTH]
+	if(struct.unpack(">H",bytes(frame[-CRC_LENGTH:]))[0] != crc16(body)):
+		raise FramingException("The frame checksum does not match")
+	if(body[2] != len(body) - 3):
+		raise FramingException("The frame length does not match")
+	return body[0], body[1], bytes(body[3:])
+
+def readFrame(read):
+	'''
+	Reads one frame with the given read(size) function, bytes in front of the
+	sync byte are skipped. Returns None if read() timed out.
+	'''
+	while(True):
+		byte = read(1)
+		if(len(byte) == 0):
+			return None
+		if(bytearray(byte)[0] == SYNC):
+			break
+	header = bytearray(read(HEADER_LENGTH - 1))
+	if(len(header) < HEADER_LENGTH - 1):
+		return None
+	rest = bytearray(read(header[2] + CRC_LENGTH))
+	if(len(rest) < header[2] + CRC_LENGTH):
+		return None
+	return bytes(bytearray([SYNC]) + header + rest)
+
+def pack(format, *values):
+	try:
+		return struct.pack(format,*values)
+	except struct.error as e:
+		raise FramingException("The values %s do not fit the frame: %s" % (values,e))
+
+def unpack(format, payload):
+	try:
+		return struct.unpack(format,payload)
+	except struct.error as e:
+		raise FramingException("The payload does not match the frame: %s" % (e))
+
+def entry(table, code):
+	# codes of a newer firmware or of a corrupt frame which passed the crc
+	if(code >= len(table)):
+		raise FramingException("The code %d is not known" % code)
+	return table[code]
+
+def formatNumber(value):
+	return ("%.4f" % value).rstrip("0").rstrip(".")
+
+def lookup(table, value, default = 0):
+	if(value in table):
+		return table.index(value)
+	return default
+
+#----------------------------------------------------------------------
+# host side
+
+def encodeCommand(request):
+	command = request.get(JSON_ATTRIBUTE_COMMAND)
+	if(command not in COMMAND_OPCODES):
+		raise FramingException("The command %s has no binary representation" % command)
+	identifier = int(request.get(JSON_ATTRIBUTE_ID,0))
+	if(command == "initialize"):
+		payload = pack(INITIALIZE_FORMAT,int(request["port"]),int(request["total-steps"]),int(round(float(request["step-angle"]) * STEP_ANGLE_SCALE)),int(request["max-speed"]),int(request["acceleration"]))
+	elif(command == "rotate"):
+		payload = pack(ROTATE_FORMAT,lookup(DIRECTIONS,request["direction"],0xFF),int(round(float(request["degrees"]) * DEGREES_SCALE)))
+	elif(command == "power"):
+		payload = pack(POWER_FORMAT,lookup(TOGGLES,request["toggle"],0xFF))
+	else:
+		payload = b""
+	opcode = COMMAND_OPCODES[command]
+	if(request.get(JSON_ATTRIBUTE_AXIS,AXIS_YAW) == AXIS_PITCH):
+		opcode = opcode | OPCODE_AXIS_PITCH
+	elif(request.get(JSON_ATTRIBUTE_AXIS,AXIS_YAW) != AXIS_YAW):
+		raise FramingException("The axis %s has no binary representation" % request.get(JSON_ATTRIBUTE_AXIS))
+	return encodeFrame(opcode,identifier,payload)
+
+def decodeReply(frame):
+	opcode, identifier, payload = decodeFrame(frame)
+	response = {JSON_ATTRIBUTE_ID:str(identifier)}
+	if(opcode == OPCODE_REPLY_STATUS):
+		response[JSON_ATTRIBUTE_STATUS] = entry(STATUSES,unpack(STATUS_FORMAT,payload)[0])
+	elif(opcode == OPCODE_REPLY_ROTATION):
+		status, degrees, steps, position = unpack(ROTATION_FORMAT,payload)
+		response[JSON_ATTRIBUTE_STATUS] = entry(STATUSES,status)
+		response["degrees"] = "%.2f" % (float(degrees) / DEGREES_SCALE)
+		response["steps"] = str(steps)
+		response["position"] = str(position)
+	elif(opcode == OPCODE_REPLY_ERROR):
+		response[JSON_ATTRIBUTE_STATUS] = STATUSES[0]
+		response[JSON_ATTRIBUTE_ERROR] = entry(ERRORS,unpack(ERROR_FORMAT,payload)[0])
+	else:
+		raise FramingException("The reply opcode 0x%02x is not known" % opcode)
+	return response
+
+#----------------------------------------------------------------------
+# head side, reference implementation for simulated heads
+
+def decodeCommand(frame):
+	opcode, identifier, payload = decodeFrame(frame)
+	request = {JSON_ATTRIBUTE_ID:str(identifier)}
+	if(opcode & OPCODE_AXIS_PITCH):
+		request[JSON_ATTRIBUTE_AXIS] = AXIS_PITCH
+		opcode = opcode & ~OPCODE_AXIS_PITCH
+	if(opcode == OPCODE_INITIALIZE):
+		port, totalSteps, stepAngle, maxSpeed, acceleration = unpack(INITIALIZE_FORMAT,payload)
+		request.update({"command":"initialize","port":str(port),"total-steps":str(totalSteps),"step-angle":formatNumber(float(stepAngle) / STEP_ANGLE_SCALE),"max-speed":str(maxSpeed),"acceleration":str(acceleration)})
+	elif(opcode == OPCODE_ROTATE):
+		direction, degrees = unpack(ROTATE_FORMAT,payload)
+		request.update({"command":"rotate","direction":DIRECTIONS[direction] if direction < len(DIRECTIONS) else str(direction),"degrees":formatNumber(float(degrees) / DEGREES_SCALE)})
+	elif(opcode == OPCODE_POWER):
+		toggle = unpack(POWER_FORMAT,payload)[0]
+		request.update({"command":"power","toggle":TOGGLES[toggle] if toggle < len(TOGGLES) else str(toggle)})
+	elif(opcode == OPCODE_RESET):
+		request.update({"command":"reset"})
+	else:
+		raise FramingException("The command opcode 0x%02x is not known" % opcode)
+	return request
+
+def encodeReply(response):
+	identifier = int(response.get(JSON_ATTRIBUTE_ID,0))
+	status = response.get(JSON_ATTRIBUTE_STATUS)
+	if(status == STATUSES[0]):
+		return encodeFrame(OPCODE_REPLY_ERROR,identifier,pack(ERROR_FORMAT,lookup(ERRORS,response.get(JSON_ATTRIBUTE_ERROR))))
+	if("position" in response):
+		payload = pack(ROTATION_FORMAT,lookup(STATUSES,status),int(round(float(response["degrees"]) * DEGREES_SCALE)),int(response["steps"]),int(response["position"]))
+		return encodeFrame(OPCODE_REPLY_ROTATION,identifier,payload)
+	return encodeFrame(OPCODE_REPLY_STATUS,identifier,pack(STATUS_FORMAT,lookup(STATUSES,status)))
@@ -0,0 +1,365 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Record and replay of libgphoto2 sessions.
+#
+# control.py and piggyphoto load libgphoto2 through load(). With
+# GPHOTO2_TRACE set to a file every call is recorded there as one JSON
+# line: function, arguments, return code, duration, payload size and
+# whatever the library wrote through the pointers it got. With
+# GPHOTO2_REPLAY set to such a trace no camera and no libgphoto2 are
+# needed, every call returns what was recorded after the recorded time,
+# divided by GPHOTO2_REPLAY_SPEED (2 is twice as fast, inf answers
+# immediately).
+#
+#   GPHOTO2_TRACE=eos.trace ./control.py ...
+#   GPHOTO2_REPLAY=eos.trace ./control.py ...
+#
+# The calls of a function are replayed in the order they were recorded,
+# the session has to make the same calls of a function again. Image data
+# is not recorded, only its size, replayed files contain zeros.
+#
+
+import os, json, time, base64, threading, collections, ctypes, ctypes.util
+from metrics import timer
+
+ENV_TRACE = "GPHOTO2_TRACE"
+ENV_REPLAY = "GPHOTO2_REPLAY"
+ENV_REPLAY_SPEED = "GPHOTO2_REPLAY_SPEED"
+
+TRACE_VERSION = 1
+
+GP_EVENT_UNKNOWN = 0
+GP_EVENT_FILE_ADDED = 2
+GP_EVENT_FOLDER_ADDED = 3
+
+GP_WIDGET_TEXT = 2
+GP_WIDGET_RADIO = 5
+GP_WIDGET_MENU = 6
+
+# char name[128], char folder[1024]
+CAMERA_FILE_PATH_SIZE = 128 + 1024
+
+# output argument holding the bytes a call transferred
+PAYLOADS = {
+	"gp_camera_file_read" : 6,
+	"gp_file_get_data_and_size" : 2,
+}
+
+# event data of a replay is released by the caller with free()
+libc = ctypes.CDLL(ctypes.util.find_library("c"))
+libc.malloc.restype = ctypes.c_void_p
+libc.malloc.argtypes = [ctypes.c_size_t]
+
+libraries = {}
+
+def load(path):
+	'''
+	The library at path, traced or replayed as the environment says. Every
+	caller gets the same instance so all calls end up in one trace.
+	'''
+	trace = os.environ.get(ENV_TRACE)
+	replay = os.environ.get(ENV_REPLAY)
+	key = (path,trace,replay)
+	if(key not in libraries):
+		if(replay):
+			libraries[key] = ReplayLibrary(replay,float(os.environ.get(ENV_REPLAY_SPEED,1.0)))
+		elif(trace):
+			libraries[key] = TracingLibrary(ctypes.CDLL(path),trace)
+		else:
+			libraries[key] = ctypes.CDLL(path)
+	return libraries[key]
+
+#
+# Replay Exception, raised when a session makes calls the trace does not have
+#
+class ReplayException(Exception):
+	def __init__(self, value):
+		self.value = value
+	def __str__(self):
+		return repr(self.value)
+
+def text(value):
+	# bytes survive JSON as latin-1, every byte maps to one character
+	if(isinstance(value,bytes)):
+		return value.decode("latin-1")
+	return value
+
+def raw(value):
+	if(value is None):
+		return None
+	return value.encode("latin-1")
+
+def encode(data):
+	return base64.b64encode(data).decode("ascii")
+
+def decode(data):
+	return base64.b64decode(data.encode("ascii"))
+
+def outputTarget(argument):
+	# the object a pointer argument points to, pointer() and byref() alike
+	if(isinstance(argument,ctypes._Pointer)):
+		return argument.contents
+	if(type(argument).__name__ == "CArgObject"):
+		return argument._obj
+	return None
+
+def describeArgument(argument):
+	if(argument is None or isinstance(argument,(int,float))):
+		return argument
+	if(isinstance(argument,bytes) or isinstance(argument,type(u""))):
+		return text(argument)
+	if(isinstance(argument,ctypes.Array)):
+		return "buffer[%d]" % (len(argument))
+	if(isinstance(argument,ctypes.c_void_p)):
+		return "handle"
+	if(isinstance(argument,ctypes._SimpleCData)):
+		return argument.value
+	if(outputTarget(argument) is not None):
+		return "pointer"
+	try:
+		return int(argument)
+	except (TypeError, ValueError):
+		return type(argument).__name__
+
+def describeResult(result):
+	if(result is None or isinstance(result,(int,float))):
+		return result
+	if(isinstance(result,bytes)):
+		return {"string":text(result)}
+	if(isinstance(result,ctypes._Pointer) and result._type_ is ctypes.c_char_p):
+		# a NULL terminated list like gp_library_version
+		strings = []
+		while(result[len(strings)] is not None):
+			strings.append(text(result[len(strings)]))
+		return {"strings":strings}
+	return int(result)
+
+def snapshot(argument, index):
+	'''
+	What the library wrote through a pointer argument. Buffers are only
+	measured, their content is image data.
+	'''
+	if(isinstance(argument,ctypes.Array)):
+		return {"index":index,"buffer":len(argument)}
+	target = outputTarget(argument)
+	if(target is None):
+		return None
+	if(isinstance(target,ctypes.c_char_p)):
+		return {"index":index,"string":text(target.value)}
+	if(isinstance(target,ctypes.c_void_p)):
+		return {"index":index,"handle":target.value is not None}
+	if(isinstance(target,ctypes._SimpleCData)):
+		return {"index":index,"value":target.value}
+	return {"index":index,"bytes":encode(ctypes.string_at(ctypes.addressof(target),ctypes.sizeof(target)).rstrip(b"\0"))}
+
+#
+# Records every call of the wrapped library, see load().
+#
+class TracingLibrary(object):
+	def __init__(self, library, path):
+		self.library = library
+		self.lock = threading.Lock()
+		self.trace = open(path,"a")
+		self.write({"trace":TRACE_VERSION,"started":time.strftime("%Y-%m-%d-%H:%M:%S",time.localtime())})
+
+	def __getattr__(self, name):
+		# raises AttributeError for functions the library lacks, hasattr() keeps working
+		function = TracingFunction(self,name,getattr(self.library,name))
+		setattr(self,name,function)
+		return function
+
+	def write(self, record):
+		line = json.dumps(record,sort_keys=True) + "\n"
+		with self.lock:
+			self.trace.write(line)
+			self.trace.flush()
+
+	def record(self, name, arguments, result, duration):
+		outputs = [output for output in [snapshot(argument,index) for index, argument in enumerate(arguments)] if output is not None]
+		if(name == "gp_camera_wait_for_event"):
+			self.recordEvent(arguments,outputs)
+		elif(name == "gp_widget_get_value"):
+			self.recordWidgetValue(arguments,outputs)
+		record = {"function":name,"arguments":[describeArgument(argument) for argument in arguments],"result":describeResult(result),"duration":duration,"outputs":outputs}
+		if(name in PAYLOADS):
+			record["payload"] = outputTarget(arguments[PAYLOADS[name]]).value
+		self.write(record)
+
+	def recordEvent(self, arguments, outputs):
+		# the event data is allocated by the library, its layout depends on the type
+		eventType = outputTarget(arguments[2]).value
+		data = outputTarget(arguments[3]).value
+		if(data is None):
+			return
+		if(eventType in (GP_EVENT_FILE_ADDED,GP_EVENT_FOLDER_ADDED)):
+			payload = ctypes.string_at(data,CAMERA_FILE_PATH_SIZE)
+		elif(eventType == GP_EVENT_UNKNOWN):
+			payload = ctypes.string_at(data) + b"\0"
+		else:
+			return
+		for output in outputs:
+			if(output["index"] == 3):
+				output["data"] = encode(payload.rstrip(b"\0"))
+				output["size"] = len(payload)
+
+	def recordWidgetValue(self, arguments, outputs):
+		# strings are handed out as a pointer into the widget, numbers in the storage itself
+		widgetType = ctypes.c_int()
+		self.library.gp_widget_get_type(arguments[0],ctypes.byref(widgetType))
+		target = outputTarget(arguments[1])
+		for output in outputs:
+			if(output["index"] == 1):
+				output.pop("handle",None)
+				if(widgetType.value in (GP_WIDGET_TEXT,GP_WIDGET_RADIO,GP_WIDGET_MENU)):
+					output["pointed"] = text(ctypes.string_at(target.value)) if target.value else None
+				else:
+					output["bytes"] = encode(ctypes.string_at(ctypes.addressof(target),ctypes.sizeof(target)))
+
+#
+# One function of a traced library, restype and argtypes go to the real one.
+#
+class TracingFunction(object):
+	def __init__(self, library, name, function):
+		self.library = library
+		self.name = name
+		self.function = function
+
+	def getRestype(self):
+		return self.function.restype
+
+	def setRestype(self, restype):
+		self.function.restype = restype
+
+	def getArgtypes(self):
+		return self.function.argtypes
+
+	def setArgtypes(self, argtypes):
+		self.function.argtypes = argtypes
+
+	restype = property(getRestype,setRestype)
+	argtypes = property(getArgtypes,setArgtypes)
+
+	def __call__(self, *arguments):
+		start = timer()
+		result = self.function(*arguments)
+		duration = timer() - start
+		self.library.record(self.name,arguments,result,duration)
+		return result
+
+#
+# Answers calls from a trace, see load().
+#
+class ReplayLibrary(object):
+	def __init__(self, path, speed = 1.0):
+		if(not speed > 0):
+			raise ReplayException("The replay speed has to be greater than 0, not %s" % (speed))
+		self.speed = speed
+		self.lock = threading.Lock()
+		self.calls = {}
+		self.handles = 0
+		# memory handed out by replayed calls has to live as long as the caller uses it
+		self.keep = collections.deque(maxlen=1024)
+		with open(path) as trace:
+			for line in trace:
+				try:
+					record = json.loads(line)
+				except ValueError:
+					# the recording may have been cut off in the middle of a line
+					continue
+				if("function" in record):
+					self.calls.setdefault(record["function"],collections.deque()).append(record)
+
+	def __getattr__(self, name):
+		if(name not in self.calls):
+			raise AttributeError("%s was never called while recording" % (name))
+		function = ReplayFunction(self,name)
+		setattr(self,name,function)
+		return function
+
+	def next(self, name):
+		with self.lock:
+			if(len(self.calls[name]) == 0):
+				raise ReplayException("%s is called more often than in the trace" % (name))
+			return self.calls[name].popleft()
+
+	def handle(self):
+		# handles are only ever passed back to the library, any distinct value will do
+		with self.lock:
+			self.handles = self.handles + 1
+			return 0x1000 + self.handles * 0x10
+
+	def replay(self, name, arguments, record):
+		for output in record["outputs"]:
+			target = outputTarget(arguments[output["index"]])
+			if(target is None):
+				continue
+			if("data" in output):
+				data = decode(output["data"])
+				pointer = libc.malloc(output["size"])
+				ctypes.memset(pointer,0,output["size"])
+				ctypes.memmove(pointer,data,len(data))
+				target.value = pointer
+			elif("pointed" in output):
+				if(output["pointed"] is None):
+					target.value = None
+				else:
+					value = ctypes.create_string_buffer(raw(output["pointed"]))
+					self.keep.append(value)
+					target.value = ctypes.addressof(value)
+			elif(name == "gp_file_get_data_and_size" and "handle" in output):
+				# zeros of the recorded size, read right after the call
+				data = ctypes.create_string_buffer(max(1,record.get("payload") or 0))
+				self.keep.append(data)
+				target.value = ctypes.addressof(data)
+			elif("string" in output):
+				target.value = raw(output["string"])
+			elif("handle" in output):
+				target.value = self.handle() if output["handle"] else None
+			elif("value" in output):
+				target.value = output["value"]
+			elif("bytes" in output):
+				data = decode(output["bytes"])
+				ctypes.memset(ctypes.addressof(target),0,ctypes.sizeof(target))
+				ctypes.memmove(ctypes.addressof(target),data,min(len(data),ctypes.sizeof(target)))
+		return self.result(record["result"])
+
+	def result(self, result):
+		if(isinstance(result,dict) and "string" in result):
+			return raw(result["string"])
+		if(isinstance(result,dict) and "strings" in result):
+			strings = (ctypes.c_char_p * (len(result["strings"]) + 1))(*([raw(value) for value in result["strings"]] + [None]))
+			self.keep.append(strings)
+			return ctypes.cast(strings,ctypes.POINTER(ctypes.c_char_p))
+		return result
+
+#
+# One function of a replayed library, restype and argtypes are accepted and ignored.
+#
+class ReplayFunction(object):
+	def __init__(self, library, name):
+		self.library = library
+		self.name = name
+		self.restype = None
+		self.argtypes = None
+
+	def __call__(self, *arguments):
+		record = self.library.next(self.name)
+		time.sleep(record["duration"] / self.library.speed)
+		return self.library.replay(self.name,arguments,record)
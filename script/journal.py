@@ -0,0 +1,198 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Crash safe journal of a session.
+#
+# The journal is a file of JSON lines which is only ever appended to, every
+# record is synced to disk before the session goes on, so a crash loses at
+# most the step which was in progress. Read back, the last record of a kind
+# wins:
+#
+#   plan      timestamp of the file names, ordered positions and home
+#   moving    the head has been sent a move which is not confirmed yet
+#   head      steps of every axis after a confirmed move, with the position
+#             the head reported for it in its own motor steps
+#   exposure  capture, download and delete state of one image
+#   frame     all exposures of a position have been captured
+#   finished  the session ended, nothing is left to resume
+#
+# A line torn by the crash is ignored.
+#
+
+import json, os, threading
+import planner
+
+RECORD_PLAN = "plan"
+RECORD_MOVING = "moving"
+RECORD_HEAD = "head"
+RECORD_EXPOSURE = "exposure"
+RECORD_FRAME = "frame"
+RECORD_FINISHED = "finished"
+
+EXPOSURE_FIELDS = ["counter","microcounter","folder","name","filename","preview","card","downloaded","deleted"]
+
+#
+# Journal Exception, raised for journals which can not be resumed
+#
+class JournalException(Exception):
+	def __init__(self, value):
+		self.value = value
+	def __str__(self):
+		return repr(self.value)
+
+#
+# Writing side of the journal, shared by the main and the download thread.
+#
+class Journal(object):
+	def __init__(self, path):
+		self.path = path
+		self.file = None
+		self.lock = threading.Lock()
+		# set once the head was sent a move, from then on the session can be resumed
+		self.started = False
+
+	def create(self):
+		self.file = open(self.path,"w")
+		self.started = False
+
+	def reopen(self):
+		self.file = open(self.path,"a")
+
+	def close(self):
+		if(self.file is not None):
+			self.file.close()
+			self.file = None
+
+	def discard(self):
+		# a session which failed before the head moved has nothing to resume
+		if(self.file is not None):
+			self.close()
+			os.remove(self.path)
+
+	def append(self, record, **values):
+		values["record"] = record
+		line = json.dumps(values,sort_keys=True) + "\n"
+		with self.lock:
+			self.file.write(line)
+			self.file.flush()
+			os.fsync(self.file.fileno())
+
+	def plan(self, timestamp, positions, home):
+		self.append(RECORD_PLAN,timestamp=timestamp,positions=[positionValues(position) for position in positions],home=positionValues(home))
+
+	def moving(self):
+		self.started = True
+		self.append(RECORD_MOVING)
+
+	def head(self, axes):
+		self.append(RECORD_HEAD,axes=dict([(axis.name,{"position":axis.position,"sign":axis.sign,"reported":axis.reported}) for axis in axes if axis is not None]))
+
+	def exposure(self, exposure):
+		self.append(RECORD_EXPOSURE,**dict([(field,getattr(exposure,field)) for field in EXPOSURE_FIELDS]))
+
+	def frame(self, counter, exposures):
+		self.append(RECORD_FRAME,counter=counter,exposures=exposures)
+
+	def finish(self):
+		self.append(RECORD_FINISHED)
+
+#
+# Reading side, the state of an interrupted session.
+#
+class Recovery(object):
+	def __init__(self):
+		self.timestamp = None
+		self.positions = None
+		self.home = None
+		self.head = None
+		self.moving = False
+		self.exposures = {}
+		self.frames = {}
+		self.finished = False
+
+	def read(self, line):
+		try:
+			values = json.loads(line)
+		except ValueError:
+			return
+		record = values.get("record")
+		if(record == RECORD_PLAN):
+			self.timestamp = values["timestamp"]
+			self.positions = [planner.Position(*position) for position in values["positions"]]
+			self.home = planner.Position(*values["home"])
+		elif(record == RECORD_MOVING):
+			self.moving = True
+		elif(record == RECORD_HEAD):
+			self.head = values["axes"]
+			self.moving = False
+		elif(record == RECORD_EXPOSURE):
+			self.exposures[(values["counter"],values["microcounter"])] = values
+		elif(record == RECORD_FRAME):
+			self.frames[values["counter"]] = values["exposures"]
+		elif(record == RECORD_FINISHED):
+			self.finished = True
+
+	def frameExposures(self, counter):
+		return [self.exposures[key] for key in sorted(self.exposures) if key[0] == counter]
+
+	def complete(self, counter):
+		'''
+		A position is done once all its exposures are either downloaded or
+		still on the memory card, images in the camera RAM did not survive.
+		'''
+		if(counter not in self.frames):
+			return False
+		exposures = self.frameExposures(counter)
+		if(len(exposures) < self.frames[counter]):
+			return False
+		return len([exposure for exposure in exposures if not isSafe(exposure)]) == 0
+
+def isSafe(exposure):
+	if(exposure["downloaded"]):
+		return os.path.isfile(exposure["filename"]) and os.path.getsize(exposure["filename"]) > 0
+	return exposure["card"]
+
+def positionValues(position):
+	return [position.row,position.column,position.yaw,position.pitch]
+
+def readJournal(path):
+	recovery = Recovery()
+	with open(path) as journal:
+		for line in journal:
+			recovery.read(line)
+	return recovery
+
+def load(path):
+	if(not os.path.isfile(path)):
+		raise JournalException("There is no journal at %s" % (path))
+	recovery = readJournal(path)
+	if(recovery.positions is None):
+		raise JournalException("The journal %s does not contain a plan" % (path))
+	if(recovery.finished):
+		raise JournalException("The session in %s has already finished" % (path))
+	return recovery
+
+def unfinished(path):
+	'''
+	True if the file holds a session which never finished.
+	'''
+	if(not os.path.isfile(path)):
+		return False
+	recovery = readJournal(path)
+	return recovery.positions is not None and not recovery.finished
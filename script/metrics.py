@@ -0,0 +1,177 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Per phase timing of a session.
+#
+# Every phase (serial round trip, rotation, config write, capture, file
+# transfer, delete, disk write...) collects its durations in seconds from a
+# monotonic clock, on python 2 clock_gettime of libc, see monotonicClock().
+# At the end of the session they are summarized as counts, percentiles and
+# a histogram in a JSON report. While the session runs a text file in the
+# Prometheus exposition format is kept up to date, e.g. for the textfile
+# collector of node_exporter.
+#
+
+import sys, json, os, threading, time, ctypes, ctypes.util
+
+# clock id of clock_gettime, see time.h
+CLOCK_MONOTONIC = 6 if sys.platform == "darwin" else 1
+
+class timespec(ctypes.Structure):
+	_fields_ = [('tv_sec', ctypes.c_long),('tv_nsec', ctypes.c_long)]
+
+def monotonicClock():
+	'''
+	time.perf_counter where it exists (python 3), clock_gettime with
+	CLOCK_MONOTONIC from libc otherwise. Only if libc has no monotonic clock
+	the wall clock is used, an NTP step then shows up in the durations.
+	'''
+	if(hasattr(time,"perf_counter")):
+		return time.perf_counter
+	try:
+		clock_gettime = ctypes.CDLL(ctypes.util.find_library("c")).clock_gettime
+	except (OSError, AttributeError):
+		return time.time
+	clock_gettime.argtypes = [ctypes.c_int,ctypes.POINTER(timespec)]
+	if(clock_gettime(CLOCK_MONOTONIC,ctypes.byref(timespec())) != 0):
+		return time.time
+	def monotonic():
+		value = timespec()
+		clock_gettime(CLOCK_MONOTONIC,ctypes.byref(value))
+		return value.tv_sec + value.tv_nsec / 1e9
+	return monotonic
+
+# every duration of the session is measured on this clock
+timer = monotonicClock()
+
+# upper bounds of the histogram buckets in seconds, the last one catches the rest
+BUCKETS = [0.001,0.002,0.005,0.01,0.02,0.05,0.1,0.2,0.5,1.0,2.0,5.0,10.0,30.0,60.0]
+PERCENTILES = [50,90,99]
+
+# the live file is rewritten at most this often in seconds
+LIVE_INTERVAL = 1.0
+LIVE_PREFIX = "parallax_phase_seconds"
+
+def percentile(durations, rank):
+	'''
+	Nearest rank percentile of sorted durations.
+	'''
+	if(len(durations) == 0):
+		return None
+	index = max(0,int(-(-rank * len(durations) // 100)) - 1)
+	return durations[min(index,len(durations) - 1)]
+
+def histogram(durations):
+	'''
+	Count of durations per bucket, not cumulative, the last entry counts
+	everything above the largest bound.
+	'''
+	counts = [0] * (len(BUCKETS) + 1)
+	for duration in durations:
+		bucket = 0
+		while(bucket < len(BUCKETS) and duration > BUCKETS[bucket]):
+			bucket = bucket + 1
+		counts[bucket] = counts[bucket] + 1
+	return counts
+
+def summarize(durations):
+	durations = sorted(durations)
+	summary = {"count":len(durations),"total":sum(durations),"histogram":dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"],histogram(durations)))}
+	if(len(durations) > 0):
+		summary.update({"min":durations[0],"max":durations[-1],"mean":sum(durations) / len(durations)})
+		for rank in PERCENTILES:
+			summary["p%d" % (rank)] = percentile(durations,rank)
+	return summary
+
+#
+# Measures a phase in a with statement.
+#
+class Measurement(object):
+	def __init__(self, metrics, phase):
+		self.metrics = metrics
+		self.phase = phase
+		self.start = None
+
+	def __enter__(self):
+		self.start = timer()
+		return self
+
+	def __exit__(self, excType, excValue, traceback):
+		self.metrics.record(self.phase,timer() - self.start)
+		return False
+
+#
+# Durations of all phases of one session, recorded from any thread.
+#
+class Metrics(object):
+	def __init__(self):
+		self.phases = {}
+		self.lock = threading.Lock()
+		self.liveLock = threading.Lock()
+		self.livePath = None
+		self.lastWrite = 0.0
+		self.started = timer()
+
+	def measure(self, phase):
+		return Measurement(self,phase)
+
+	def record(self, phase, seconds):
+		with self.lock:
+			self.phases.setdefault(phase,[]).append(seconds)
+		if(self.livePath is not None and timer() - self.lastWrite >= LIVE_INTERVAL):
+			self.writeLive()
+
+	def durations(self, phase):
+		with self.lock:
+			return list(self.phases.get(phase,[]))
+
+	def summary(self):
+		with self.lock:
+			phases = dict([(phase,list(durations)) for phase, durations in self.phases.items()])
+		return dict([(phase,summarize(durations)) for phase, durations in phases.items()])
+
+	def live(self, path):
+		self.livePath = path
+		self.writeLive()
+
+	def writeLive(self):
+		# written next to the target and renamed so a scraper never sees half a file
+		lines = ["# TYPE %s histogram" % (LIVE_PREFIX)]
+		for phase, summary in sorted(self.summary().items()):
+			cumulative = 0
+			for bound in [str(bound) for bound in BUCKETS] + ["+Inf"]:
+				cumulative = cumulative + summary["histogram"][bound]
+				lines.append("%s_bucket{phase=\"%s\",le=\"%s\"} %d" % (LIVE_PREFIX,phase,bound,cumulative))
+			lines.append("%s_sum{phase=\"%s\"} %f" % (LIVE_PREFIX,phase,summary["total"]))
+			lines.append("%s_count{phase=\"%s\"} %d" % (LIVE_PREFIX,phase,summary["count"]))
+		with self.liveLock:
+			self.lastWrite = timer()
+			temporary = self.livePath + ".tmp"
+			with open(temporary,"w") as live:
+				live.write("\n".join(lines) + "\n")
+			os.rename(temporary,self.livePath)
+
+	def report(self, path):
+		with open(path,"w") as report:
+			json.dump({"elapsed":timer() - self.started,"buckets":BUCKETS,"phases":self.summary()},report,indent=2,sort_keys=True)
+
+	def printSummary(self):
+		for phase, summary in sorted(self.summary().items()):
+			if(summary["count"] > 0):
+				sys.stdout.write("%s: %d times p50: %.1f ms p90: %.1f ms p99: %.1f ms max: %.1f ms total: %.1f sec. \n" % (phase,summary["count"],summary["p50"] * 1000,summary["p90"] * 1000,summary["p99"] * 1000,summary["max"] * 1000,summary["total"]))
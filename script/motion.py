@@ -0,0 +1,127 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Motion timing of the head as driven by the firmware.
+#
+# The firmware hands every move to AccelStepper which accelerates with the
+# configured acceleration (steps/s^2) up to max-speed (steps/s), cruises and
+# decelerates again, a trapezoidal velocity profile. Short moves never reach
+# max-speed and turn into a triangle.
+#
+# Drivers with jerk limitation ramp the acceleration itself up and down,
+# an S-curve profile, scurveDuration() models those.
+#
+
+import math
+
+def rotationSteps(degrees, stepAngle):
+	'''
+	Steps the firmware executes for a rotation, the degrees are rounded down
+	to a multiple of the step angle exactly like rotate() in the firmware does.
+	'''
+	degrees = abs(float(degrees))
+	stepAngle = float(stepAngle)
+	if(math.fmod(degrees,stepAngle) > 0):
+		degrees = degrees - math.fmod(degrees,stepAngle)
+	return int(degrees / stepAngle)
+
+def trapezoidDuration(steps, maxSpeed, acceleration):
+	'''
+	Seconds AccelStepper needs for a move of the given amount of steps.
+	'''
+	steps = abs(steps)
+	maxSpeed = float(maxSpeed)
+	acceleration = float(acceleration)
+	if(steps == 0):
+		return 0.0
+	# steps spent accelerating to max speed, the same again for braking
+	rampSteps = maxSpeed * maxSpeed / (2 * acceleration)
+	if(steps >= 2 * rampSteps):
+		return (steps - 2 * rampSteps) / maxSpeed + 2 * maxSpeed / acceleration
+	return 2 * math.sqrt(steps / acceleration)
+
+def rampDuration(speed, acceleration, jerk):
+	'''
+	Seconds an S-curve needs to get from standstill to the given speed.
+	'''
+	if(speed * jerk >= acceleration * acceleration):
+		# the acceleration limit is reached and held for a while
+		return speed / acceleration + acceleration / jerk
+	return 2 * math.sqrt(speed / jerk)
+
+def scurveDuration(steps, maxSpeed, acceleration, jerk):
+	'''
+	Seconds a jerk limited move of the given amount of steps needs, jerk
+	in steps/s^3. Both ramps are symmetric so each one covers its end
+	speed times half its duration.
+	'''
+	steps = abs(steps)
+	maxSpeed = float(maxSpeed)
+	acceleration = float(acceleration)
+	jerk = float(jerk)
+	if(steps == 0):
+		return 0.0
+	ramp = rampDuration(maxSpeed,acceleration,jerk)
+	if(steps >= maxSpeed * ramp):
+		return 2 * ramp + (steps - maxSpeed * ramp) / maxSpeed
+	# max speed is not reached, find the peak speed the distance allows
+	low = 0.0
+	high = maxSpeed
+	for iteration in range(60):
+		speed = (low + high) / 2
+		if(speed * rampDuration(speed,acceleration,jerk) > steps):
+			high = speed
+		else:
+			low = speed
+	return 2 * rampDuration(low,acceleration,jerk)
+
+def rotationDuration(degrees, stepAngle, maxSpeed, acceleration):
+	return trapezoidDuration(rotationSteps(degrees,stepAngle),maxSpeed,acceleration)
+
+#
+# Time model of one axis, degrees in and seconds out. Backlash is the play
+# in degrees the motor has to take up first whenever it reverses. Without
+# a jerk the profile is the trapezoid of AccelStepper, with one an S-curve.
+#
+class AxisModel(object):
+	def __init__(self, stepAngle, maxSpeed, acceleration, backlash = 0.0, jerk = None):
+		self.stepAngle = float(stepAngle)
+		self.maxSpeed = float(maxSpeed)
+		self.acceleration = float(acceleration)
+		self.backlash = float(backlash)
+		self.jerk = jerk
+
+	def steps(self, degrees):
+		return int(round(abs(degrees) / self.stepAngle))
+
+	def backlashSteps(self):
+		return int(round(self.backlash / self.stepAngle))
+
+	def duration(self, degrees, reversal = False):
+		steps = self.steps(degrees)
+		if(steps == 0):
+			return 0.0
+		if(reversal):
+			steps = steps + self.backlashSteps()
+		return self.stepsDuration(steps)
+
+	def stepsDuration(self, steps):
+		if(self.jerk is None):
+			return trapezoidDuration(steps,self.maxSpeed,self.acceleration)
+		return scurveDuration(steps,self.maxSpeed,self.acceleration,self.jerk)
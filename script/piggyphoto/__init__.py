@@ -24,8 +24,15 @@ libgphoto2dll = '/usr/lib/libgphoto2.so.2'
 #libgphoto2dll = '/usr/local/lib/libgphoto2.so.6'
 
 import re
-import ctypes
-gp = ctypes.CDLL(libgphoto2dll)
+import ctypes, ctypes.util
+try:
+    # shares the traced or replayed library with control.py, see gptrace.py
+    import gptrace
+    gp = gptrace.load(libgphoto2dll)
+except ImportError:
+    gp = ctypes.CDLL(libgphoto2dll)
+# event data handed out by gp_camera_wait_for_event has to be released with free()
+libc = ctypes.CDLL(ctypes.util.find_library('c'))
 context = gp.gp_context_new()
 
 def library_version(verbose = True):
@@ -43,7 +50,8 @@ def library_version(verbose = True):
     return v
 
 import os, string, time
-from ptp import *
+# the PTP codes of ptp.h, e.g. ptp.EC.ObjectAdded, each table is built on first use
+import ptp
 
 PTR = ctypes.pointer
 
@@ -144,10 +152,24 @@ else:
 # gphoto constants
 # Defined in 'gphoto2-port-result.h'
 GP_OK = 0
+GP_ERROR_NOT_SUPPORTED = -6
 # CameraCaptureType enum in 'gphoto2-camera.h'
 GP_CAPTURE_IMAGE = 0
 # CameraFileType enum in 'gphoto2-file.h'
 GP_FILE_TYPE_NORMAL = 1
+# CameraEventType enum in 'gphoto2-camera.h'
+GP_EVENT_UNKNOWN = 0          # unknown and unhandled event, data is a char * with a description
+GP_EVENT_TIMEOUT = 1          # timeout, no event
+GP_EVENT_FILE_ADDED = 2       # a new file was added, data is a CameraFilePath *
+GP_EVENT_FOLDER_ADDED = 3     # a new folder was added, data is a CameraFilePath *
+GP_EVENT_CAPTURE_COMPLETE = 4 # the last capture is complete
+event_types = ['Unknown', 'Timeout', 'FileAdded', 'FolderAdded', 'CaptureComplete']
+
+# the ptp2 driver reports all events it does not map itself as text
+ptp_event_patterns = [
+    re.compile(r'PTP Property ([0-9a-fA-F]{4}) changed'),
+    re.compile(r'PTP Event ([0-9a-fA-F]{4})'),
+]
 
 
 
@@ -326,15 +348,75 @@ class camera(object):
             return cfile
 
     def download_file(self, srcfolder, srcfilename, destpath):
+        f = open(destpath, 'wb')
+        try:
+            for chunk in self.read_file(srcfolder, srcfilename):
+                f.write(chunk)
+        finally:
+            f.close()
+
+    def read_file(self, srcfolder, srcfilename, chunk_size = 1024 * 1024, filetype = GP_FILE_TYPE_NORMAL):
+        """Generator yielding the file in chunks of at most chunk_size bytes.
+        Uses partial object reads (libgphoto2 >= 2.5) so memory does not grow
+        with the file size, otherwise the whole file is fetched and split up.
+        """
+        if hasattr(gp, 'gp_camera_file_read'):
+            buf = ctypes.create_string_buffer(chunk_size)
+            offset = 0
+            while True:
+                size = ctypes.c_uint64(chunk_size)
+                ans = gp.gp_camera_file_read(self._cam, str(srcfolder), str(srcfilename), filetype,
+                                             ctypes.c_uint64(offset), buf, PTR(size), context)
+                if ans == GP_ERROR_NOT_SUPPORTED and offset == 0:
+                    break
+                check(ans)
+                if size.value == 0:
+                    return
+                yield buf.raw[:size.value]
+                offset += size.value
+                if size.value < chunk_size:
+                    return
         cfile = cameraFile(self._cam, srcfolder, srcfilename)
-        cfile.save(destpath)
-        gp.gp_file_unref(cfile._cf)
+        try:
+            data = ctypes.c_void_p()
+            size = ctypes.c_ulong()
+            check(gp.gp_file_get_data_and_size(cfile._cf, PTR(data), PTR(size)))
+            for offset in xrange(0, size.value, chunk_size):
+                yield ctypes.string_at(data.value + offset, min(chunk_size, size.value - offset))
+        finally:
+            gp.gp_file_unref(cfile._cf)
 
     def trigger_capture(self):
         check(gp.gp_camera_trigger_capture(self._cam, context))
 
     def wait_for_event(self, timeout):
-        raise NotImplementedError
+        """Waits at most timeout milliseconds for the next camera event.
+        Returns a cameraEvent, with type GP_EVENT_TIMEOUT if nothing happened.
+        """
+        evtype = ctypes.c_int()
+        data = ctypes.c_void_p()
+        check(gp.gp_camera_wait_for_event(self._cam, int(timeout), PTR(evtype), PTR(data), context))
+        try:
+            return cameraEvent(evtype.value, data)
+        finally:
+            if data.value:
+                libc.free(data)
+
+    def capture_exposure(self, timeout = 10000):
+        """Triggers a capture and returns as soon as the exposure is done,
+        while the camera may still be storing the file. Returns the event
+        which ended the exposure, the file arrives later as GP_EVENT_FILE_ADDED
+        through wait_for_event unless that event already is the one returned.
+        """
+        self.trigger_capture()
+        deadline = time.time() + timeout / 1000.0
+        while True:
+            remaining = int((deadline - time.time()) * 1000)
+            if remaining <= 0:
+                raise libgphoto2error(-10, 'Capture did not complete within %d ms' % timeout)
+            event = self.wait_for_event(remaining)
+            if event.type in (GP_EVENT_CAPTURE_COMPLETE, GP_EVENT_FILE_ADDED):
+                return event
 
     def list_folders(self, path = "/"):
         l = cameraList()
@@ -363,7 +445,7 @@ class camera(object):
 
     def ptp_canon_eos_requestdevicepropvalue(self, prop):
         params = ctypes.c_void_p(self._cam.value + 12)
-        gp.ptp_generic_no_data(params, PTP_OC_CANON_EOS_RequestDevicePropValue, 1, prop)
+        gp.ptp_generic_no_data(params, ptp.OC.CANON_EOS_RequestDevicePropValue, 1, prop)
 
     # TODO: port_speed, init, config
 
@@ -407,6 +489,65 @@ class cameraFile(object):
 
     # TODO: new_from_fd (?), new_from_handler (?), mime_tipe, mtime, detect_mime_type, adjust_name_for_mime_type, data_and_size, append, slurp, python file object?
 
+class cameraEvent(object):
+    """A camera event, the data of gp_camera_wait_for_event copied to python.
+    Events the ptp2 driver only reports as text are decoded into their
+    PTP event code, the DevicePropChanged events also carry the property.
+    """
+    def __init__(self, evtype, data = None):
+        self.type = evtype
+        self.folder = None
+        self.name = None
+        self.text = None
+        self.code = None
+        self.property = None
+        if evtype in (GP_EVENT_FILE_ADDED, GP_EVENT_FOLDER_ADDED):
+            path = ctypes.cast(data, ctypes.POINTER(CameraFilePath)).contents
+            self.folder = path.folder
+            self.name = path.name
+            self.code = ptp.EC.ObjectAdded
+        elif evtype == GP_EVENT_CAPTURE_COMPLETE:
+            self.code = ptp.EC.CaptureComplete
+        elif evtype == GP_EVENT_UNKNOWN and data is not None and data.value:
+            self.text = ctypes.cast(data, ctypes.c_char_p).value
+            self._decode_text()
+
+    def _decode_text(self):
+        match = ptp_event_patterns[0].search(self.text)
+        if match:
+            self.code = ptp.EC.DevicePropChanged
+            self.property = int(match.group(1), 16)
+            return
+        match = ptp_event_patterns[1].search(self.text)
+        if match:
+            self.code = int(match.group(1), 16)
+
+    def _get_type_name(self):
+        return event_types[self.type] if 0 <= self.type < len(event_types) else str(self.type)
+    type_name = property(_get_type_name, None)
+
+    def _get_ptp_name(self):
+        if self.code is None:
+            return None
+        return ptp_event_name(self.code)
+    ptp_name = property(_get_ptp_name, None)
+
+    def __repr__(self):
+        if self.name is not None:
+            return '%s %s/%s' % (self.type_name, self.folder, self.name)
+        if self.property is not None:
+            return '%s %s 0x%04x' % (self.type_name, self.ptp_name, self.property)
+        if self.code is not None:
+            return '%s %s' % (self.type_name, self.ptp_name)
+        if self.text is not None:
+            return '%s %s' % (self.type_name, self.text)
+        return self.type_name
+
+def ptp_event_name(code, vendor = None):
+    """Name of a PTP_EC_* event code, vendor codes which collide are all listed
+    unless the vendor (e.g. 'CANON') is given."""
+    return ptp.EC.name(code, vendor) or '0x%04x' % code
+
 class cameraAbilitiesList(object):
     _static_l = None
     def __init__(self):
@@ -711,6 +852,23 @@ class cameraWidget(object):
         return children
     children = property(_get_children, None)
 
+    def _get_child_borrowed(self, child_number):
+        # children are owned by the tree, no extra reference is needed
+        w = cameraWidget()
+        check(gp.gp_widget_get_child(self._w, int(child_number), PTR(w._w)))
+        return w
+
+    def _get_children_by_name(self):
+        """Immediate children by name, listed once per widget on first use."""
+        try:
+            return self._children_by_name
+        except AttributeError:
+            self._children_by_name = {}
+            for i in range(self.count_children()):
+                c = self._get_child_borrowed(i)
+                self._children_by_name.setdefault(c.name, c)
+            return self._children_by_name
+
     def _get_parent(self):
         w = cameraWidget()
         check(gp.gp_widget_get_parent(self._w, PTR(w._w)))
@@ -753,7 +911,8 @@ class cameraWidget(object):
         type = "Type: " + self.typestr
         #value = "Current value: " + str(self.value)
         childs = []
-        for c in self.children:
+        for i in range(self.count_children()):
+            c = self._get_child_borrowed(i)
             childs.append("  - " + c.name + ": " + c.label)
         if len(childs):
             childstr = "Children:\n" + string.join(childs, "\n")
@@ -761,28 +920,34 @@ class cameraWidget(object):
         else:
             return label + "\n" + info + "\n" + type
 
-    def _pop(widget, simplewidget):
-        #print widget
-        for c in widget.children:
-            simplechild = cameraWidgetSimple()
-            if c.count_children():
-                setattr(simplewidget, c.name, simplechild)
-                simplechild.__doc__ = c.createdoc()
-                c._pop(simplechild)
-            else:
-                setattr(simplewidget, c.name, c)
-
-            #print c.name, simplewidget.__doc__
-        #print dir(simplewidget)
-
     def populate_children(self):
-        simplewidget = cameraWidgetSimple()
-        setattr(self, self.name, simplewidget)
-        simplewidget.__doc__ = self.createdoc()
-        self._pop(simplewidget)
+        # the attribute tree below is materialised lazily, see cameraWidgetSimple
+        setattr(self, self.name, cameraWidgetSimple(self))
 
     def __repr__(self):
         return "%s:%s:%s:%s:%s" % (self.label, self.name, self.info, self.typestr, self.value)
 
 class cameraWidgetSimple(object):
-    pass
+    # Attribute view of a widget, e.g. config.main.capturesettings.aperture.
+    # A child is looked up on its first attribute access and cached, sections
+    # become further cameraWidgetSimple views and leaves are cameraWidget.
+    # The docstring is generated from the widget only when it is read.
+
+    def __init__(self, widget):
+        self._widget = widget
+
+    __doc__ = property(lambda self: self._widget.createdoc())
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        child = self._widget._get_children_by_name().get(name)
+        if child is None:
+            raise AttributeError(name)
+        if child.count_children():
+            child = cameraWidgetSimple(child)
+        setattr(self, name, child)
+        return child
+
+    def __dir__(self):
+        return sorted(self._widget._get_children_by_name().keys())
@@ -1,10 +1,21 @@
 import re
 
+# PTP_<table>_<code>, e.g. PTP_OC_CANON_EOS_RemoteRelease is OC.CANON_EOS_RemoteRelease
+table_reg = r"^PTP_([A-Z]+)_([a-zA-Z0-9_]+)$"
+per_line = 6
+# ptp.h computes some lengths from the sizes of C types
+sizes = {"uint8_t": 1, "uint16_t": 2, "uint32_t": 4, "uint64_t": 8}
+
 f = open("ptp.h")
 out = open("ptp.py", "w")
-out.write("# Constants extracted from gphoto2's ptp.h\n\n")
+out.write("# Constants extracted from gphoto2's ptp.h by ptph.py, do not edit.\n")
+out.write("# The codes of a prefix form a table which is built on first use, see ptptable.py\n\n")
+out.write("from ptptable import ptpTable\n\n")
 lines = f.readlines()
 
+# the values are evaluated here, some are expressions of earlier ones
+values = {}
+names = []
 for line in lines:
     line = line.strip()
     reg = r"^#define\s+([a-zA-Z0-9_]+)\s+(.*)"
@@ -15,4 +26,30 @@ for line in lines:
         name, value = g[0], g[1]
         value = value.replace("/*", "#")
         value = value.replace("//", "#")
-        out.write("%s = %s\n" % (name, value))
+        value = value.split("#")[0].strip()
+        value = re.sub(r"sizeof\((\w+)\)", lambda size: str(sizes.get(size.group(1), size.group(0))), value)
+        try:
+            values[name] = eval(value, {}, values)
+        except Exception:
+            continue
+        if name not in names:
+            names.append(name)
+
+tables = []
+entries = {}
+for name in names:
+    m = re.match(table_reg, name)
+    if m and isinstance(values[name], (int, long)):
+        table, member = m.groups()
+        if table not in entries:
+            tables.append(table)
+            entries[table] = []
+        entries[table].append("%s=0x%x" % (member, values[name]))
+    else:
+        out.write("%s = %r\n" % (name, values[name]))
+
+for table in tables:
+    out.write("\n%s = ptpTable('PTP_%s_', (\n" % (table, table))
+    for i in range(0, len(entries[table]), per_line):
+        out.write("    '%s '\n" % " ".join(entries[table][i:i + per_line]))
+    out.write("))\n")
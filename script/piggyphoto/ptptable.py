@@ -0,0 +1,89 @@
+# Lazily built tables of the PTP codes in ptp.py
+#
+# ptph.py groups the codes of ptp.h by prefix, PTP_OC_CANON_EOS_RemoteRelease
+# becomes ptp.OC.CANON_EOS_RemoteRelease. A table keeps its codes as one
+# string until it is used for the first time, only then the members and the
+# reverse map from code to names are built.
+
+class ptpCode(int):
+    """A PTP code which knows its name, compares and hashes as the plain int."""
+    def __new__(cls, value, name):
+        code = int.__new__(cls, value)
+        code.name = name
+        return code
+
+    def __repr__(self):
+        return '%s (0x%04x)' % (self.name, self)
+
+class ptpTable(object):
+    """The codes of one prefix of ptp.h, e.g. PTP_OC_ for operation codes.
+    Vendor codes stay in the table of their prefix, their names start with
+    the vendor block, e.g. CANON_ or NIKON_.
+    """
+    def __init__(self, prefix, source):
+        self.prefix = prefix
+        self._source = source
+        self._members = None
+        self._names = None
+
+    def _load(self):
+        # both maps are assigned at once, a concurrent first use builds them twice at worst
+        members = {}
+        names = {}
+        for entry in self._source.split():
+            name, value = entry.split('=')
+            code = ptpCode(int(value, 16), self.prefix + name)
+            members[name] = code
+            names.setdefault(int(code), []).append(code)
+        self._names = names
+        self._members = members
+
+    def _get_members(self):
+        if self._members is None:
+            self._load()
+        return self._members
+    members = property(_get_members, None)
+
+    def __getattr__(self, name):
+        # only called for names which are no attributes, i.e. the codes
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self.members[name]
+        except KeyError:
+            raise AttributeError('%s%s' % (self.prefix, name))
+
+    def __contains__(self, value):
+        self.members
+        return int(value) in self._names
+
+    def __iter__(self):
+        return iter(sorted(self.members.values()))
+
+    def __len__(self):
+        return len(self.members)
+
+    def codes(self, value, vendor = None):
+        """All codes with this value, vendor codes collide. With a vendor
+        (e.g. 'CANON') only the standard codes and those of the vendor."""
+        self.members
+        codes = self._names.get(int(value), [])
+        if vendor is not None:
+            codes = [code for code in codes if _vendor_of(code.name[len(self.prefix):]) in (None, vendor.upper())]
+        return codes
+
+    def name(self, value, vendor = None):
+        """Name of a code, colliding names are joined by ' / ', None if unknown."""
+        codes = self.codes(value, vendor)
+        if not codes:
+            return None
+        return ' / '.join(sorted([code.name for code in codes]))
+
+# vendor blocks of ptp.h, the first part of a vendor code name
+vendors = ['CANON', 'NIKON', 'MTP', 'EK', 'FUJI', 'CASIO', 'OLYMPUS', 'SONY', 'ANDROID', 'PENTAX', 'LEICA']
+
+def _vendor_of(name):
+    vendor = name.split('_')[0].upper()
+    if vendor in vendors and '_' in name:
+        return vendor
+    return None
@@ -0,0 +1,271 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Spherical panorama planner.
+#
+# Rows are spread evenly in pitch between the limits so neighbouring rows
+# overlap by the requested fraction of the vertical field of view. Every
+# row gets as many columns as its widest latitude needs: a frame covers
+# about hfov / cos(latitude) degrees of yaw there, so rows towards the
+# poles need fewer frames than the one at the horizon. A pole within the
+# limits is covered by a single frame pointing straight at it, the rows
+# only have to reach up to the edge of that frame.
+#
+# All angles are degrees, yaw grows in the rotation direction, pitch is
+# positive above the horizon.
+#
+# order() sorts any set of positions for the least head travel time.
+#
+
+import math
+import motion
+
+POLE = 90.0
+
+#
+# One camera position of a plan.
+#
+class Position(object):
+	def __init__(self, row, column, yaw, pitch):
+		self.row = row
+		self.column = column
+		self.yaw = yaw
+		self.pitch = pitch
+
+	def __repr__(self):
+		return "Position(row=%d, column=%d, yaw=%.2f, pitch=%.2f)" % (self.row, self.column, self.yaw, self.pitch)
+
+#
+# One row of a plan, all positions share the pitch.
+#
+class Row(object):
+	def __init__(self, pitch, columns):
+		self.pitch = pitch
+		self.columns = columns
+
+	def yaws(self):
+		return [column * 360.0 / self.columns for column in range(self.columns)]
+
+#
+# Planner Exception, raised for fields of view and limits no plan exists for
+#
+class PlannerException(Exception):
+	def __init__(self, value):
+		self.value = value
+	def __str__(self):
+		return repr(self.value)
+
+def rowPitches(vfov, overlap, minPitch = -POLE, maxPitch = POLE):
+	'''
+	Pitch of every row, top row first. The limits are the extent of the
+	sphere to cover, not the pitch of the outermost rows.
+	'''
+	vfov = float(vfov)
+	if(vfov <= 0 or vfov > 180):
+		raise PlannerException("The vertical field of view has to be within (0, 180] degrees")
+	if(overlap < 0 or overlap >= 1):
+		raise PlannerException("The overlap has to be within [0, 1)")
+	if(minPitch > maxPitch):
+		raise PlannerException("The lower pitch limit is above the upper one")
+	span = float(maxPitch - minPitch)
+	if(span <= vfov):
+		return [(maxPitch + minPitch) / 2.0]
+	step = vfov * (1 - overlap)
+	rows = int(math.ceil((span - vfov) / step)) + 1
+	top = maxPitch - vfov / 2.0
+	bottom = minPitch + vfov / 2.0
+	spacing = (top - bottom) / (rows - 1)
+	return [top - row * spacing for row in range(rows)]
+
+def rowColumns(pitch, hfov, vfov, overlap):
+	'''
+	Columns a row at the given pitch needs to cover the full circle.
+	'''
+	hfov = float(hfov)
+	if(hfov <= 0 or hfov > 360):
+		raise PlannerException("The horizontal field of view has to be within (0, 360] degrees")
+	if(abs(pitch) >= POLE):
+		# the frame pointing at the pole covers every yaw
+		return 1
+	lower = pitch - vfov / 2.0
+	upper = pitch + vfov / 2.0
+	# the latitude of the row closest to the horizon is the widest one
+	if(lower <= 0 <= upper):
+		latitude = 0.0
+	else:
+		latitude = min(abs(lower),abs(upper))
+	circumference = 360.0 * math.cos(math.radians(latitude))
+	return max(1,int(math.ceil(circumference / (hfov * (1 - overlap)))))
+
+def planRows(hfov, vfov, overlap, minPitch = -POLE, maxPitch = POLE):
+	# a frame at the pole reaches down to half its narrower side
+	cap = min(float(hfov),float(vfov)) / 2.0 * (1 - overlap)
+	upper = POLE - cap if maxPitch >= POLE else maxPitch
+	lower = -POLE + cap if minPitch <= -POLE else minPitch
+	rows = []
+	if(maxPitch >= POLE):
+		rows.append(Row(POLE,1))
+	if(upper > lower):
+		rows.extend([Row(pitch,rowColumns(pitch,hfov,vfov,overlap)) for pitch in rowPitches(vfov,overlap,lower,upper)])
+	if(minPitch <= -POLE):
+		rows.append(Row(-POLE,1))
+	return rows
+
+def planPositions(rows):
+	positions = []
+	for number, row in enumerate(rows):
+		for column, yaw in enumerate(row.yaws()):
+			positions.append(Position(number,column,yaw,row.pitch))
+	return positions
+
+def plan(hfov, vfov, overlap, minPitch = -POLE, maxPitch = POLE):
+	'''
+	Positions of a multi row plan, row by row from the top.
+	'''
+	return planPositions(planRows(hfov,vfov,overlap,minPitch,maxPitch))
+
+def singleRow(degrees):
+	'''
+	The classic plan, one row at the horizon with a fixed yaw increment.
+	'''
+	return planPositions([Row(0.0,int(divmod(360,int(degrees))[0]))])
+
+def gridFrames(hfov, vfov, overlap, minPitch = -POLE, maxPitch = POLE):
+	'''
+	Frames of a naive grid with the horizon column count in every row.
+	'''
+	columns = rowColumns(0.0,hfov,vfov,overlap)
+	return columns * len(rowPitches(vfov,overlap,max(minPitch,-POLE),min(maxPitch,POLE)))
+
+#
+# Travel state of the head while a route is built, yaw is unwrapped so
+# the sign of a move is its direction.
+#
+class Route(object):
+	def __init__(self, yawModel, pitchModel, yaw = 0.0, pitch = 0.0):
+		self.yawModel = yawModel
+		self.pitchModel = pitchModel
+		self.yaw = yaw
+		self.pitch = pitch
+		self.yawSign = 0
+		self.pitchSign = 0
+		self.duration = 0.0
+		self.positions = []
+
+	def copy(self):
+		route = Route(self.yawModel,self.pitchModel,self.yaw,self.pitch)
+		route.yawSign = self.yawSign
+		route.pitchSign = self.pitchSign
+		route.duration = self.duration
+		route.positions = list(self.positions)
+		return route
+
+	def moveDuration(self, yaw, pitch):
+		return axisDuration(self.yawModel,yaw - self.yaw,self.yawSign) + axisDuration(self.pitchModel,pitch - self.pitch,self.pitchSign)
+
+	def move(self, yaw, pitch):
+		self.duration = self.duration + self.moveDuration(yaw,pitch)
+		self.yawSign = moveSign(yaw - self.yaw,self.yawSign)
+		self.pitchSign = moveSign(pitch - self.pitch,self.pitchSign)
+		self.yaw = yaw
+		self.pitch = pitch
+
+	def visit(self, position, yaw):
+		self.move(yaw,position.pitch)
+		self.positions.append(Position(position.row,position.column,yaw,position.pitch))
+
+def axisDuration(model, degrees, lastSign):
+	if(model is None or degrees == 0):
+		return 0.0
+	return model.duration(degrees,lastSign != 0 and moveSign(degrees,lastSign) != lastSign)
+
+def moveSign(degrees, lastSign):
+	if(degrees > 0):
+		return 1
+	if(degrees < 0):
+		return -1
+	return lastSign
+
+def nearestTurn(yaw, current):
+	'''
+	The unwrapped yaw of the given angle closest to the current one.
+	'''
+	return current + ((yaw - current + 180.0) % 360.0) - 180.0
+
+def sweep(route, row, start, direction):
+	'''
+	Visits the positions of a row in yaw order from start on, turning in
+	one direction only, the head reaches the first one the short way.
+	'''
+	route = route.copy()
+	yaw = nearestTurn(row[start].yaw,route.yaw)
+	route.visit(row[start],yaw)
+	for step in range(1,len(row)):
+		position = row[(start + step * direction) % len(row)]
+		yaw = yaw + direction * ((direction * (position.yaw - route.yaw)) % 360.0)
+		route.visit(position,yaw)
+	return route
+
+def orderRow(route, row):
+	best = None
+	row = sorted(row,key=lambda position: position.yaw % 360.0)
+	for start in range(len(row)):
+		for direction in (1,-1):
+			candidate = sweep(route,row,start,direction)
+			if(best is None or candidate.duration < best.duration):
+				best = candidate
+	return best
+
+def order(positions, yawModel, pitchModel = None, home = None):
+	'''
+	Orders the positions for the least travel time from home back to home.
+	Rows are shot one after the other from either end, every row in one
+	sweep whose start and direction are chosen against the models, which
+	gives a serpentine through the rows. Returns the route, its positions
+	carry the unwrapped yaw to turn to.
+	'''
+	if(home is None):
+		home = Position(0,0,0.0,0.0)
+	rows = {}
+	for position in positions:
+		rows.setdefault(position.pitch,[]).append(position)
+	best = None
+	for pitches in (sorted(rows,reverse=True),sorted(rows)):
+		route = Route(yawModel,pitchModel,home.yaw,home.pitch)
+		for pitch in pitches:
+			route = orderRow(route,rows[pitch])
+		route.move(nearestTurn(home.yaw,route.yaw),home.pitch)
+		if(best is None or route.duration < best.duration):
+			best = route
+	return best
+
+def follow(positions, yawModel, pitchModel = None, start = None, home = None):
+	'''
+	The route through the positions in the given order, from start back to
+	home, e.g. for the rest of an interrupted session.
+	'''
+	if(start is None):
+		start = Position(0,0,0.0,0.0)
+	if(home is None):
+		home = Position(0,0,0.0,0.0)
+	route = Route(yawModel,pitchModel,start.yaw,start.pitch)
+	for position in positions:
+		route.visit(position,position.yaw)
+	route.move(home.yaw,home.pitch)
+	return route
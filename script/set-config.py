@@ -44,7 +44,57 @@ def check(result):
 
 
 
+#
+# index of the loaded configuration tree, keyed by name path, label path,
+# name and label, built by a single traversal when the tree is fetched
+#
+configTree = None
+widgetIndex = {}
+# name path and label path of every indexed widget, None for the tree itself
+widgetPaths = {}
+
+def indexWidgets(parent, namePath, labelPath):
+	for number in range(gp.gp_widget_count_children(parent._w)):
+		child = Widget()
+		check(gp.gp_widget_get_child(parent._w,number,PTR(child._w)))
+		name = getWidgetName(child)
+		label = getWidgetLabel(child)
+		childNamePath = name if namePath is None else namePath + '/' + name
+		childLabelPath = label if labelPath is None else labelPath + '/' + label
+		widgetIndex[childNamePath] = child
+		widgetIndex.setdefault(childLabelPath,child)
+		widgetIndex.setdefault(name,child)
+		widgetIndex.setdefault(label,child)
+		widgetPaths[child._w.value] = (childNamePath,childLabelPath)
+		indexWidgets(child,childNamePath,childLabelPath)
+
+def loadConfig(refresh = False):
+	# the tree and its index are kept until the camera state is read again
+	global configTree
+	if(configTree is not None and not refresh):
+		return configTree
+	if(configTree is not None):
+		gp.gp_widget_free(configTree._w)
+	configTree = Widget()
+	check(gp.gp_camera_get_config(camera,PTR(configTree._w),context))
+	widgetIndex.clear()
+	widgetPaths.clear()
+	widgetPaths[configTree._w.value] = (None,None)
+	indexWidgets(configTree,None,None)
+	return configTree
+
 def retrieveWidget(parent, name):
+	if(parent._w.value in widgetPaths):
+		namePath, labelPath = widgetPaths[parent._w.value]
+		if(namePath is None):
+			# the whole tree is searched, like gp_widget_get_child_by_name does
+			keys = [name]
+		else:
+			# only paths below the parent, the same name may exist in other sections
+			keys = [namePath + '/' + name,labelPath + '/' + name]
+		for key in keys:
+			if(key in widgetIndex):
+				return widgetIndex[key]
 	child = Widget()
 	ret = gp.gp_widget_get_child_by_name(parent._w,str(name),PTR(child._w))
 	if(ret != 0):
@@ -52,14 +102,16 @@ def retrieveWidget(parent, name):
 	return child;
 
 def setConfig(name, value):
-	main = Widget()
-	check(gp.gp_camera_get_config(camera,PTR(main._w),context))
-	tokens = name.split('/')
-	parent = main
-	child = None
-	for token in tokens:
-		child = retrieveWidget(parent,token)
-		parent = child
+	main = loadConfig()
+	if(name in widgetIndex):
+		child = widgetIndex[name]
+	else:
+		tokens = name.split('/')
+		parent = main
+		child = None
+		for token in tokens:
+			child = retrieveWidget(parent,token)
+			parent = child
 	child.set_value(value)
 	check(gp.gp_camera_set_config(camera,main._w,context))
 
@@ -68,6 +120,11 @@ def getWidgetName(widget):
         gp.gp_widget_get_name(widget._w, PTR(name))
         return name.value
 
+def getWidgetLabel(widget):
+	label = ctypes.c_char_p()
+	check(gp.gp_widget_get_label(widget._w, PTR(label)))
+	return label.value
+
 def getWidgetType(widget):
         type = ctypes.c_int()
         gp.gp_widget_get_type(widget._w, PTR(type))
@@ -88,8 +145,8 @@ def getWidgetValue(widget):
         return value.value
 
 def printCaptureTarget():
-	main = Widget()
-	check(gp.gp_camera_get_config(camera,PTR(main._w),context))
+	# read back from the camera, not from the tree we wrote to
+	main = loadConfig(True)
 	capturetarget = retrieveWidget(main,'capturetarget')
 	print "Widget name: [%s] type: [%s] value: [%s]" % (getWidgetName(capturetarget),getWidgetType(capturetarget),getWidgetValue(capturetarget))
 #
@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+
+
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Simulated parallax head.
+#
+# Speaks the protocol of ParallaxController.ino on a pseudo terminal so
+# control.py can run without an Arduino attached:
+#
+#   ./simulator.py --link /tmp/parallax-head
+#   ./control.py --device /tmp/parallax-head ...
+#
+# Rotations take as long as AccelStepper would need for them, optionally
+# scaled by --timescale. Latency, dropped lines and error replies can be
+# injected to exercise the controller.
+#
+
+import sys, os, pty, tty, select, json, time, random, re, argparse
+import framing, motion
+
+DEFAULT_ENCODING = 'UTF-8'
+DEFAULT_LF = '\n'
+
+SERIAL_BAUD = 9600
+FIRMWARE_VERSION = "1.3-simulated"
+FIRMWARE_CAPABILITIES = ["id","queue","ping","axis","program"]
+PROGRAM_SIZE = 512
+
+STATUS_INITIALIZATION_FINISHED = "Motor initialization finished"
+STATUS_ROTATION_FINISHED       = "Rotation finished"
+STATUS_POWER_ON                = "Power is on"
+STATUS_POWER_OFF               = "Power is off"
+STATUS_RESET                   = "Position is reset to current position"
+STATUS_READY                   = "Ready"
+STATUS_PROGRAM_STORED          = "Program stored"
+STATUS_PROGRAM_FINISHED        = "Program finished"
+STATUS_ERROR                   = "Error"
+
+ERROR_MOTOR_IS_NOT_INITIALIZED          = "The motor has not been initialized yet, please do so now!"
+ERROR_MOTOR_PORT_WRONG                  = "Please specify a valid motor port value"
+ERROR_MOTOR_TOTAL_STEPS_WRONG           = "Please specify the total steps for the motor"
+ERROR_MOTOR_STEP_ANGLE_WRONG            = "Please specify a valid step angle for the motor"
+ERROR_MOTOR_MAX_SPEED_WRONG             = "Please specify a maximum speed value for the motor"
+ERROR_MOTOR_ACCELERATION_WRONG          = "Please specify a acceleration value for the motor"
+ERROR_ROTATION_DIRECTION_NOT_UNDERSTOOD = "The rotation direction was not understood"
+ERROR_ROTATION_DEGREE_VALUE_TOO_SMALL   = "The rotation degree value has to be greater 0"
+ERROR_ROTATION_POWER_IS_OFF             = "Unable to rotate motor due to the power beeing of, please switch the power on first!"
+ERROR_POWER_TOGGLE_VALUE_NOT_UNDERSTOOD = "The power toggle value was not understood"
+ERROR_REQUEST_NOT_UNDERSTOOD            = "The request could not be parsed"
+ERROR_AXIS_NOT_UNDERSTOOD               = "The axis was not understood"
+ERROR_PROGRAM_TOO_LONG                  = "The program does not fit into the program memory"
+ERROR_PROGRAM_INSTRUCTION_WRONG         = "The program contains an unknown instruction"
+
+INSTRUCTION = re.compile(r"([A-Za-z])([-+]?\d*)")
+ERROR_INJECTED                          = "Injected error"
+
+#----------------------------------------------------------------------
+def main():
+	results = setupArgumentParser()
+	random.seed(results.seed)
+
+	head = SimulatedHead(results.binary)
+	link = PtyLink()
+	if(results.link):
+		if(os.path.islink(results.link)):
+			os.remove(results.link)
+		os.symlink(link.name,results.link)
+	sys.stdout.write("Simulated head listening on %s \n" % (results.link or link.name))
+	sys.stdout.flush()
+
+	try:
+		while(True):
+			if(head.binary):
+				frame = framing.readFrame(link.read)
+				try:
+					request = framing.decodeCommand(frame)
+				except framing.FramingException as e:
+					log("dropped corrupt frame: %s" % (e))
+					continue
+				requestSize = len(frame)
+			else:
+				line = link.readline()
+				try:
+					request = json.loads(line.decode(DEFAULT_ENCODING))
+				except ValueError:
+					request = None
+				requestSize = len(line)
+			if(random.random() < results.drop):
+				log("dropped %s" % (request))
+				continue
+			log("<- %s" % (request))
+			binary = head.binary
+			if(random.random() < results.errors):
+				response, duration = {"error":ERROR_INJECTED,"status":STATUS_ERROR}, 0.0
+				copyRequestId(request,response)
+			else:
+				response, duration = head.execute(request)
+			for delay, event in head.takeEvents():
+				time.sleep(delay * results.timescale)
+				log("-> %s" % (event))
+				link.write((json.dumps(event) + "\r" + DEFAULT_LF).encode(DEFAULT_ENCODING))
+			if(binary):
+				data = framing.encodeReply(response)
+			else:
+				data = (json.dumps(response) + "\r" + DEFAULT_LF).encode(DEFAULT_ENCODING)
+			wire = float(requestSize + len(data)) * 10 / results.baudrate
+			time.sleep((duration + wire + results.latency / 1000.0) * results.timescale)
+			log("-> %s" % (response))
+			link.write(data)
+	except KeyboardInterrupt:
+		pass
+	finally:
+		if(results.link and os.path.islink(results.link)):
+			os.remove(results.link)
+
+def log(message):
+	sys.stdout.write(message + DEFAULT_LF)
+	sys.stdout.flush()
+
+def atoi(value):
+	match = re.match(r"\s*[-+]?\d+",value or "")
+	return int(match.group(0)) if match else 0
+
+def atof(value):
+	match = re.match(r"\s*[-+]?(\d+\.?\d*|\.\d+)",value or "")
+	return float(match.group(0)) if match else 0.0
+
+def parameter(request, name):
+	value = request.get(name)
+	return value if value is not None else ""
+
+def copyRequestId(request, response):
+	if(isinstance(request,dict) and framing.JSON_ATTRIBUTE_ID in request):
+		response[framing.JSON_ATTRIBUTE_ID] = request[framing.JSON_ATTRIBUTE_ID]
+
+def axisName(request):
+	if(isinstance(request,dict)):
+		return request.get(framing.JSON_ATTRIBUTE_AXIS) or framing.AXIS_YAW
+	return framing.AXIS_YAW
+
+#
+# Motor state of one axis.
+#
+class SimulatedAxis(object):
+	def __init__(self):
+		self.isMotorInitialized = False
+		self.isPowerOn = False
+		self.position = 0
+		self.stepAngle = None
+		self.maxSpeed = None
+		self.acceleration = None
+
+#
+# Protocol and motor state of the head, mirrors ParallaxController.ino.
+# execute() returns the response together with the seconds the motor moves.
+#
+class SimulatedHead(object):
+	def __init__(self, binary = False):
+		self.supportsBinary = binary
+		self.binary = False
+		self.axes = {framing.AXIS_YAW:SimulatedAxis(),framing.AXIS_PITCH:SimulatedAxis()}
+		self.program = ""
+		self.events = []
+
+	def takeEvents(self):
+		# progress events of a program, each with the seconds before it is sent
+		events = self.events
+		self.events = []
+		return events
+
+	def capabilities(self):
+		if(self.supportsBinary):
+			return FIRMWARE_CAPABILITIES + [framing.FRAMING_BINARY]
+		return FIRMWARE_CAPABILITIES
+
+	def execute(self, request):
+		response = {}
+		duration = 0.0
+		error = self.validate(request)
+		if(error is not None):
+			response.update(error)
+			response["status"] = STATUS_ERROR
+		else:
+			command = request["command"]
+			axis = self.axes.get(axisName(request))
+			if(command == "ping"):
+				yaw = self.axes[framing.AXIS_YAW]
+				pitch = self.axes[framing.AXIS_PITCH]
+				response.update({"firmware":FIRMWARE_VERSION,"baudrate":str(SERIAL_BAUD),"capabilities":",".join(self.capabilities()),"position":str(yaw.position),"status":STATUS_READY})
+				if(pitch.isMotorInitialized):
+					response["pitch-position"] = str(pitch.position)
+			elif(command == framing.COMMAND_FRAMING):
+				self.binary = True
+				response["status"] = framing.STATUS_FRAMING_ENABLED
+			elif(command == "initialize"):
+				axis.stepAngle = atof(request["step-angle"])
+				axis.maxSpeed = atoi(request["max-speed"])
+				axis.acceleration = atoi(request["acceleration"])
+				axis.isMotorInitialized = True
+				response["status"] = STATUS_INITIALIZATION_FINISHED
+			elif(command == "rotate"):
+				duration = self.rotate(axis,request,response)
+			elif(command == "power"):
+				axis.isPowerOn = (request["toggle"] == "on")
+				response["status"] = STATUS_POWER_ON if axis.isPowerOn else STATUS_POWER_OFF
+			elif(command == "reset"):
+				axis.position = 0
+				response["status"] = STATUS_RESET
+			elif(command == "program"):
+				self.storeProgram(request,response)
+		copyRequestId(request,response)
+		return response, duration
+
+	def rotate(self, axis, request, response):
+		if(not axis.isPowerOn):
+			response.update({"error":ERROR_ROTATION_POWER_IS_OFF,"status":STATUS_ERROR})
+			return 0.0
+		steps = motion.rotationSteps(atof(request["degrees"]),axis.stepAngle)
+		if(request["direction"] != "clockwise"):
+			steps = -steps
+		axis.position = axis.position + steps
+		response.update({"degrees":"%.2f" % (abs(steps) * axis.stepAngle),"steps":str(abs(steps)),"position":str(axis.position),"status":STATUS_ROTATION_FINISHED})
+		return motion.trapezoidDuration(steps,axis.maxSpeed,axis.acceleration)
+
+	def storeProgram(self, request, response):
+		if(len(self.program) + len(request["instructions"]) > PROGRAM_SIZE):
+			self.program = ""
+			response.update({"error":ERROR_PROGRAM_TOO_LONG,"status":STATUS_ERROR})
+			return
+		self.program = self.program + request["instructions"]
+		response["length"] = str(len(self.program))
+		if(request.get("mode") == "append"):
+			response["status"] = STATUS_PROGRAM_STORED
+			return
+		error = self.runProgram()
+		if(error is not None):
+			response.update({"error":error,"status":STATUS_ERROR})
+		else:
+			response["status"] = STATUS_PROGRAM_FINISHED
+		self.program = ""
+
+	def runProgram(self):
+		# executes the whole program at once, the events carry the timing
+		# settle, hold and wait of the F instruction
+		timing = {"T":0,"H":0,"W":0}
+		for index, match in enumerate(INSTRUCTION.finditer(self.program)):
+			code = match.group(1)
+			value = atoi(match.group(2))
+			event = {"event":"progress","index":str(index),"code":code}
+			if(code in ("Y","P")):
+				axis = self.axes[framing.AXIS_YAW if code == "Y" else framing.AXIS_PITCH]
+				if(not axis.isMotorInitialized):
+					return ERROR_MOTOR_IS_NOT_INITIALIZED
+				if(not axis.isPowerOn):
+					return ERROR_ROTATION_POWER_IS_OFF
+				axis.position = axis.position + value
+				event["position"] = str(axis.position)
+				duration = motion.trapezoidDuration(value,axis.maxSpeed,axis.acceleration)
+			elif(code in ("D","S")):
+				duration = value / 1000.0
+			elif(code in timing):
+				timing[code] = value
+				duration = 0.0
+			elif(code == "F"):
+				duration = (timing["T"] + value * (timing["H"] + timing["W"])) / 1000.0
+			else:
+				return ERROR_PROGRAM_INSTRUCTION_WRONG
+			self.events.append((duration,event))
+		return None
+
+	def validate(self, request):
+		if(not isinstance(request,dict)):
+			return {"error":ERROR_REQUEST_NOT_UNDERSTOOD}
+		command = parameter(request,"command")
+		if(command == "ping"):
+			return None
+		if(command == framing.COMMAND_FRAMING and self.supportsBinary and request.get("mode") == framing.FRAMING_BINARY):
+			return None
+		if(axisName(request) not in self.axes):
+			return {"error":ERROR_AXIS_NOT_UNDERSTOOD,"error-value":axisName(request)}
+		if(command != "initialize" and not self.axes[axisName(request)].isMotorInitialized):
+			return {"error":ERROR_MOTOR_IS_NOT_INITIALIZED}
+		if(command == "initialize"):
+			if(atoi(parameter(request,"port")) <= 0):
+				return {"error":ERROR_MOTOR_PORT_WRONG}
+			elif(atoi(parameter(request,"total-steps")) <= 0):
+				return {"error":ERROR_MOTOR_TOTAL_STEPS_WRONG}
+			elif(atof(parameter(request,"step-angle")) <= 0):
+				return {"error":ERROR_MOTOR_STEP_ANGLE_WRONG}
+			elif(atoi(parameter(request,"max-speed")) <= 0):
+				return {"error":ERROR_MOTOR_MAX_SPEED_WRONG}
+			elif(atoi(parameter(request,"acceleration")) <= 0):
+				return {"error":ERROR_MOTOR_ACCELERATION_WRONG}
+			return None
+		elif(command == "rotate"):
+			if(parameter(request,"direction") not in ("clockwise","counterclockwise")):
+				return {"error":ERROR_ROTATION_DIRECTION_NOT_UNDERSTOOD,"error-value":parameter(request,"direction")}
+			if(atof(parameter(request,"degrees")) <= 0):
+				return {"error":ERROR_ROTATION_DEGREE_VALUE_TOO_SMALL,"error-value":parameter(request,"degrees")}
+			return None
+		elif(command == "power"):
+			if(parameter(request,"toggle") not in ("on","off")):
+				return {"error":ERROR_POWER_TOGGLE_VALUE_NOT_UNDERSTOOD,"error-value":parameter(request,"toggle")}
+			return None
+		elif(command == "reset"):
+			return None
+		elif(command == "program"):
+			if(self.binary or "instructions" not in request):
+				return {"error":ERROR_REQUEST_NOT_UNDERSTOOD}
+			return None
+		return {"error":ERROR_REQUEST_NOT_UNDERSTOOD}
+
+#
+# Master side of a pseudo terminal, the slave side is what the controller opens.
+# The slave stays open here as well so the terminal survives controller restarts.
+#
+class PtyLink(object):
+	def __init__(self):
+		self.master, self.slave = pty.openpty()
+		tty.setraw(self.master)
+		tty.setraw(self.slave)
+		self.name = os.ttyname(self.slave)
+		self.buffer = bytearray()
+
+	def fill(self):
+		select.select([self.master],[],[])
+		self.buffer += os.read(self.master,1024)
+
+	def read(self, size):
+		while(len(self.buffer) < size):
+			self.fill()
+		data = bytes(self.buffer[:size])
+		del self.buffer[:size]
+		return data
+
+	def readline(self):
+		while(DEFAULT_LF.encode(DEFAULT_ENCODING)[0:1] not in self.buffer):
+			self.fill()
+		index = self.buffer.index(DEFAULT_LF.encode(DEFAULT_ENCODING)[0:1])
+		return self.read(index + 1)
+
+	def write(self, data):
+		os.write(self.master,data)
+
+#----------------------------------------------------------------------
+def setupArgumentParser():
+	parser = argparse.ArgumentParser(description="Simulated Parallax Head on a pseudo terminal")
+
+	parser.add_argument("--link",required=False,
+		help="Create a symlink to the pseudo terminal at this path, e.g. /tmp/parallax-head")
+
+	parser.add_argument("--baudrate",required=False,
+		type=int,default=SERIAL_BAUD,
+		help="Baudrate used to model the time on the wire")
+
+	parser.add_argument("--binary",required=False,
+		action="store_true",
+		help="Advertise and accept binary framing")
+
+	# ---- fault injection arguments ----
+
+	faults = parser.add_argument_group("fault injection arguments")
+
+	faults.add_argument("--latency",required=False,
+		type=float,default=0,
+		help="Milliseconds added before every reply")
+
+	faults.add_argument("--drop",required=False,
+		type=float,default=0,
+		help="Probability for an incoming command to be dropped without reply")
+
+	faults.add_argument("--errors",required=False,
+		type=float,default=0,
+		help="Probability for a command to be answered with an error")
+
+	faults.add_argument("--seed",required=False,
+		type=int,default=None,
+		help="Random seed for reproducible fault injection")
+
+	faults.add_argument("--timescale",required=False,
+		type=float,default=1.0,
+		help="Factor applied to all simulated durations, 0 answers immediately")
+
+	return parser.parse_args()
+
+#----------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Tests of control.py without head and camera, run from this directory:
+#
+#   python -m unittest test_control
+#
+
+import unittest, ctypes
+import control, planner, motion, framing
+
+DEFAULT_ARGUMENTS = ["--device","/dev/null","--direction","clockwise","--aperture","8","--shutterspeed","1/100"]
+
+def defaultArguments(*arguments):
+	return control.setupArgumentParser(DEFAULT_ARGUMENTS + list(arguments))
+
+def yawAxis(results):
+	return control.Axis(framing.AXIS_YAW,motion.AxisModel(results.stepangle,results.maxspeed,results.acceleration,results.backlash,results.jerk),results.direction)
+
+class ProgramTest(unittest.TestCase):
+	def testDefaultPanoramaFits(self):
+		results = defaultArguments("--program","--location","memorycard","--degrees","10")
+		yaw = yawAxis(results)
+		route = planner.order(planner.singleRow(results.degrees),yaw.model)
+		home = planner.Position(0,0,planner.nearestTurn(0.0,route.positions[-1].yaw),0.0)
+		instructions = control.buildProgram(route.positions,home,yaw,None,results.settle,results.pulse,results.dwell)
+		self.assertEqual(len(route.positions),36)
+		self.assertTrue(len(instructions) <= control.PROGRAM_SIZE)
+		self.assertEqual(instructions.count("F1"),36)
+
+	def testTimingIsSentOnce(self):
+		results = defaultArguments("--program","--location","memorycard","--degrees","90")
+		yaw = yawAxis(results)
+		positions = planner.singleRow(results.degrees)
+		instructions = control.buildProgram(positions,planner.Position(0,0,360.0,0.0),yaw,None,0.2,100,1000)
+		self.assertTrue(instructions.startswith("T200H100W1000"))
+		self.assertEqual(len(control.PROGRAM_INSTRUCTION.findall(instructions)),3 + 4 + 4)
+
+#
+# Answers every libgphoto2 call with GP_OK and counts the calls.
+#
+class FakeGphoto(object):
+	def __init__(self):
+		self.calls = []
+
+	def __getattr__(self, name):
+		if(not name.startswith("gp_")):
+			raise AttributeError(name)
+		def call(*arguments):
+			self.calls.append(name)
+			return control.GP_OK
+		return call
+
+def flushedConfig():
+	config = control.CameraConfig(None,None)
+	config.set("capturesettings/aperture","8")
+	config.set("capturesettings/shutterspeed","1/100")
+	config.flush()
+	return config
+
+class CameraConfigTest(unittest.TestCase):
+	def setUp(self):
+		self.gp = control.gp
+		control.gp = FakeGphoto()
+		self.config = flushedConfig()
+
+	def tearDown(self):
+		control.gp = self.gp
+
+	def testEchoKeepsApplied(self):
+		self.config.propertyChanged(b"PTP Property d101 changed")
+		self.config.propertyChanged(b"PTP Property d102 changed")
+		self.assertEqual(self.config.applied,{"capturesettings/aperture":"8","capturesettings/shutterspeed":"1/100"})
+		self.config.set("capturesettings/aperture","8")
+		self.assertEqual(self.config.skipped,1)
+		self.assertFalse(self.config.dirty)
+
+	def testUntrackedPropertyIsIgnored(self):
+		self.config.propertyChanged(b"PTP Property d1b0 changed")
+		self.assertEqual(len(self.config.applied),2)
+		self.assertEqual(control.gp.calls.count("gp_camera_get_config"),1)
+
+	def testCameraChangeForgetsOnlyItsSetting(self):
+		self.config.propertyChanged(b"PTP Property d101 changed")
+		# a second change is the dial, not the echo of our write
+		self.config.propertyChanged(b"PTP Property d101 changed")
+		self.assertEqual(self.config.applied,{"capturesettings/shutterspeed":"1/100"})
+		self.config.set("capturesettings/aperture","8")
+		self.assertTrue(self.config.dirty)
+		self.assertEqual(control.gp.calls.count("gp_camera_get_config"),1)
+
+	def testCameraChangeIsWrittenBack(self):
+		self.config.propertyChanged(b"PTP Property d101 changed")
+		self.config.propertyChanged(b"PTP Property d101 changed")
+		# the cached widget still holds 8, only the changed mark makes libgphoto2 write it
+		control.gp.calls = []
+		self.config.set("capturesettings/aperture","8")
+		self.config.flush()
+		calls = [call for call in control.gp.calls if not call.startswith("gp_widget_get_child")]
+		self.assertEqual(calls,["gp_widget_set_value","gp_widget_set_changed","gp_camera_set_config"])
+
+	def testEchoesExpireWithTheDrain(self):
+		# a body which does not echo our write
+		control.gp = EventGphoto([])
+		self.config.pollEvents()
+		self.config.propertyChanged(b"PTP Property d101 changed")
+		self.assertFalse("capturesettings/aperture" in self.config.applied)
+
+#
+# Reports the given events from gp_camera_wait_for_event, the data is
+# allocated with malloc like libgphoto2 does, the caller frees it.
+#
+class EventGphoto(FakeGphoto):
+	def __init__(self, events):
+		FakeGphoto.__init__(self)
+		self.events = list(events)
+
+	def gp_camera_wait_for_event(self, camera, timeout, eventType, data, context):
+		eventType.contents.value, payload = self.events.pop(0) if len(self.events) > 0 else (control.GP_EVENT_TIMEOUT,None)
+		data.contents.value = None
+		if(payload is not None):
+			malloc = control.libc.malloc
+			malloc.restype = ctypes.c_void_p
+			data.contents.value = malloc(ctypes.sizeof(payload))
+			ctypes.memmove(data.contents.value,ctypes.addressof(payload),ctypes.sizeof(payload))
+		return control.GP_OK
+
+class BracketEventsTest(unittest.TestCase):
+	def setUp(self):
+		self.gp = control.gp
+		control.gp = FakeGphoto()
+		self.config = flushedConfig()
+
+	def tearDown(self):
+		control.gp = self.gp
+
+	def testEchoDuringBracketKeepsApplied(self):
+		path = control.CameraFilePath()
+		path.folder = b"/store_00020001/DCIM/100CANON"
+		path.name = b"IMG_0001.CR2"
+		control.gp = EventGphoto([(control.GP_EVENT_UNKNOWN,ctypes.create_string_buffer(b"PTP Property d101 changed")),(control.GP_EVENT_FILE_ADDED,path)])
+		paths = control.waitForFiles(None,None,self.config,1)
+		self.assertEqual(len(paths),1)
+		self.assertEqual(self.config.applied["capturesettings/aperture"],"8")
+
+#
+# An answered head request as Move sees it.
+#
+class AnsweredRequest(object):
+	def __init__(self, start, latency, response):
+		self.start = start
+		self.latency = latency
+		self.response = response
+		self.size = 80
+
+	def wait(self):
+		return self.response
+
+class FakeArduino(object):
+	def __init__(self, baudrate):
+		self.baudrate = baudrate
+		self.binary = False
+
+class MoveTest(unittest.TestCase):
+	def testFastLinkNeverFinishesBeforeTheRequest(self):
+		# the reply took less time than the model says crossing the wire takes
+		move = control.Move(FakeArduino("300"))
+		move.start = 100.0
+		move.add(AnsweredRequest(100.0,0.01,{"status":"Rotation finished","position":"89"}),0.0)
+		self.assertEqual(move.confirm(),0.0)
+		self.assertEqual(move.early(100.0),0.0)
+		self.assertEqual(move.early(99.0),1.0)
+
+	def testSlowestAxisFinishesTheMove(self):
+		move = control.Move(FakeArduino("115200"))
+		move.start = 100.0
+		move.add(AnsweredRequest(100.0,0.5,{"status":"Rotation finished"}),0.5)
+		move.add(AnsweredRequest(100.01,2.0,{"status":"Rotation finished"}),2.0)
+		duration = move.confirm()
+		self.assertTrue(duration > 1.9 and duration < 2.01)
+
+class FakePort(object):
+	def __init__(self):
+		self.written = []
+
+	def write(self, data):
+		self.written.append(data)
+
+	def flush(self):
+		pass
+
+class SubmitTest(unittest.TestCase):
+	def testUnencodableCommandFreesItsSlot(self):
+		arduino = control.Arduino("/dev/null","9600",1,1)
+		arduino.port = FakePort()
+		arduino.binary = True
+		# more than the 655.35 deg a binary rotate holds
+		for attempt in range(2):
+			self.assertRaises(control.ArduinoCommandExecutionException,arduino.submit,control.rotateRequest("clockwise","700"))
+		self.assertEqual(len(arduino.pending),0)
+		self.assertEqual(arduino.port.written,[])
+		arduino.submit(control.rotateRequest("clockwise","10"))
+		self.assertEqual(len(arduino.port.written),1)
+
+if __name__ == "__main__":
+	unittest.main()
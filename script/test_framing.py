@@ -0,0 +1,44 @@
+'''
+ Parallax Head Control Software
+
+ Copyright 2012 Michael Mimo Moratti
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+'''
+
+#
+# Tests of framing.py, run from this directory:
+#
+#   python -m unittest test_framing
+#
+
+import unittest
+import framing
+
+class DecodeReplyTest(unittest.TestCase):
+	def testRotationRoundTrip(self):
+		response = {"id":"7","status":"Rotation finished","degrees":"36.00","steps":"20","position":"-20"}
+		self.assertEqual(framing.decodeReply(framing.encodeReply(response)),response)
+
+	def testUnknownCodesRaiseFramingException(self):
+		# frames with a valid crc but codes the host does not know
+		for opcode, payload in [(framing.OPCODE_REPLY_STATUS,b"\x40"),(framing.OPCODE_REPLY_ERROR,b"\xff"),(framing.OPCODE_REPLY_ROTATION,b"\x02")]:
+			frame = framing.encodeFrame(opcode,1,payload)
+			self.assertRaises(framing.FramingException,framing.decodeReply,frame)
+
+	def testOversizedRotationRaisesFramingException(self):
+		request = {"command":"rotate","direction":"clockwise","degrees":"700","id":"1"}
+		self.assertRaises(framing.FramingException,framing.encodeCommand,request)
+
+if __name__ == "__main__":
+	unittest.main()